@@ -1,31 +1,122 @@
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
-from models.services.cat_service import CatService
-from models.services.player_service import PlayerService
-from models.services.timer_service import TimerService
 import random
-import json
-import os
+from models.rendering import RARITY_EMOJI
+
+CATS_PER_PAGE = 5
+
+SORT_LABELS = {
+    'id': "Oldest first",
+    'level': "Level",
+    'health': "❤️ Health",
+    'attack': "⚔️ Attack",
+    'defense': "🛡️ Defense",
+    'speed': "💨 Speed"
+}
+
+def describe_filters(sort: str = 'id', breed: str = None, rarity: str = None,
+                     min_level: int = None, max_level: int = None) -> str:
+    """Short summary of a /cats view, e.g. 'Rare · Level 5-10 · Sorted by ⚔️ Attack'"""
+    parts = []
+    if breed:
+        parts.append(breed)
+    if rarity:
+        parts.append(rarity.title())
+    if min_level is not None or max_level is not None:
+        if max_level is None:
+            parts.append(f"Level {min_level}+")
+        elif min_level is None:
+            parts.append(f"Level ≤{max_level}")
+        else:
+            parts.append(f"Level {min_level}-{max_level}")
+    if sort != 'id':
+        parts.append(f"Sorted by {SORT_LABELS[sort]}")
+    return " · ".join(parts)
+
+def build_cat_page(cat_text, username: str, cats: list, page: int, pages: int, summary: str = ""):
+    """Build one /cats collection page; pure CPU work, so it can be benchmarked without Discord.
+    
+    ``cat_text`` is the CatTextCache, so cats already shown once are not formatted again.
+    """
+    embed = discord.Embed(
+        title=f"{username}'s Cats",
+        description=f"Page {page}/{pages}" + (f" · {summary}" if summary else ""),
+        color=discord.Color.blue()
+    )
+    
+    for cat in cats:
+        text = cat_text.get(cat)
+        embed.add_field(
+            name=text.active_title if cat['is_active'] else text.title,
+            value=text.collection,
+            inline=False
+        )
+    
+    return embed
+
+def attach_image(embed, image, thumbnail: bool = False) -> dict:
+    """Show ``image`` (an ImageStore Attachment, or None) in the embed.
+    
+    Returns extra send() arguments: the file to upload, unless it was uploaded before.
+    """
+    if image is None:
+        return {}
+    url = image.url or f"attachment://{image.filename}"
+    if thumbnail:
+        embed.set_thumbnail(url=url)
+    else:
+        embed.set_image(url=url)
+    return {} if image.url else {'file': discord.File(image.path, filename=image.filename)}
+
+async def remember_upload(image_service, image, message):
+    """After a first upload, keep the attachment's CDN URL so the file is never uploaded again"""
+    if image is None or image.url or message is None:
+        return
+    for attachment in message.attachments:
+        if attachment.filename == image.filename:
+            await image_service.remember_url(image.filename, attachment.url)
 
 class CatCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.cat_service = CatService()
-        self.player_service = PlayerService()
-        self.timer_service = TimerService()
-        # Load timer config from configs folder
-        with open(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'configs', 'timers_config.json'), 'r') as f:
-            self.timer_config = json.load(f)["timers"]
+        # Shared services and the hot-reloaded timers config, built once in setup_hook
+        self.services = bot.services
+        self.cat_service = self.services.cat_service
+        self.player_service = self.services.player_service
+        self.timer_service = self.services.timer_service
+        self.cat_text = self.services.cat_text
+        self.image_service = self.services.image_service
     
     @app_commands.command(name="cats", description="View your cat collection")
-    async def cats(self, interaction: discord.Interaction):
-        """Display all cats owned by the player"""
+    @app_commands.describe(
+        breed="Only show cats of this breed",
+        rarity="Only show cats of this rarity",
+        min_level="Only show cats at or above this level",
+        max_level="Only show cats at or below this level",
+        sort="Order of the cats (default: oldest first)"
+    )
+    @app_commands.choices(
+        rarity=[app_commands.Choice(name=rarity.title(), value=rarity) for rarity in RARITY_EMOJI],
+        sort=[app_commands.Choice(name=label, value=column) for column, label in SORT_LABELS.items()]
+    )
+    async def cats(self, interaction: discord.Interaction, breed: str = None, rarity: str = None,
+                   min_level: app_commands.Range[int, 1] = None, max_level: app_commands.Range[int, 1] = None,
+                   sort: str = 'id'):
+        """Display the cats owned by the player, one page at a time"""
         try:
             # Defer the response immediately to prevent timeout
             await interaction.response.defer()
             
-            profile_data = self.player_service.get_profile(interaction.user.id)
+            if min_level is not None and max_level is not None and min_level > max_level:
+                await interaction.followup.send(
+                    "The minimum level can't be higher than the maximum level!",
+                    ephemeral=True
+                )
+                return
+            
+            profile_data = await self.player_service.get_profile(interaction.user.id, full=False)
             if not profile_data:
                 await interaction.followup.send(
                     "You haven't started your adventure yet! Use `/start` to begin.",
@@ -33,107 +124,88 @@ class CatCommands(commands.Cog):
                 )
                 return
             
-            cats = profile_data['cats']
-            if not cats:
+            if not profile_data['cat_count']:
                 await interaction.followup.send(
                     "You don't have any cats yet! Use `/start` to get your first cat.",
                     ephemeral=True
                 )
                 return
             
-            # Create paginated embeds for cats (5 cats per page)
-            embeds = []
-            for i in range(0, len(cats), 5):
-                embed = discord.Embed(
-                    title=f"{profile_data['player']['username']}'s Cats",
-                    description=f"Page {i//5 + 1}/{(len(cats)-1)//5 + 1}",
-                    color=discord.Color.blue()
+            # Filtering and sorting happen in the database, and only the first page is loaded now;
+            # later pages are fetched as the player pages through
+            player_id = profile_data['player']['id']
+            username = profile_data['player']['username']
+            filters = {'breed': breed, 'rarity': rarity, 'min_level': min_level, 'max_level': max_level}
+            summary = describe_filters(sort, **filters)
+            first_page = await self.cat_service.get_cat_page(
+                player_id, per_page=CATS_PER_PAGE, sort=sort, with_count=True, **filters
+            )
+            if not first_page['cats']:
+                await interaction.followup.send(
+                    f"None of your cats match those filters ({summary}).",
+                    ephemeral=True
                 )
-                
-                for cat in cats[i:i+5]:
-                    # Get rarity from breed
-                    rarity = next(
-                        rarity for rarity, breeds in self.cat_service.RARITY_WEIGHTS.items()
-                        if cat['breed'] in breeds
-                    )
-                    
-                    # Emoji based on rarity
-                    rarity_emoji = {
-                        'common': '⚪',
-                        'uncommon': '🟢',
-                        'rare': '🔵',
-                        'epic': '🟣',
-                        'legendary': '🟡'
-                    }[rarity]
-                    
-                    active_status = "✨ Active" if cat['is_active'] else ""
-                    
-                    embed.add_field(
-                        name=f"{rarity_emoji} {cat['name']} {active_status}",
-                        value=f"ID: {cat['id']}\n"
-                              f"Breed: {cat['breed']}\n"
-                              f"Level: {cat['level']}\n"
-                              f"Stats: ❤️ {cat['health']} | ⚔️ {cat['attack']} | "
-                              f"🛡️ {cat['defense']} | 💨 {cat['speed']}",
-                        inline=False
-                    )
-                
-                embeds.append(embed)
+                return
+            page_count = (first_page['count'] - 1) // CATS_PER_PAGE + 1
+            cat_service = self.cat_service
+            cat_text = self.cat_text
             
             # Create pagination buttons
             class CatCollectionView(discord.ui.View):
                 def __init__(self):
                     super().__init__(timeout=180)  # 3 minute timeout
                     self.current_page = 0
-                    self.embeds = embeds
+                    self.pages = [first_page]  # Pages fetched so far, in order
+                    self.prefetch = None
+                    self.loading = asyncio.Lock()  # Rapid clicks must not fetch the same page twice
+                    self.update_buttons()
+                    self.start_prefetch()
                 
-                @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, disabled=True)
-                async def previous_button(self, button_interaction: discord.Interaction, button: discord.ui.Button):
-                    try:
-                        self.current_page = max(0, self.current_page - 1)
-                        
-                        # Update button states
-                        self.children[0].disabled = self.current_page == 0  # Previous button
-                        self.children[1].disabled = self.current_page == len(self.embeds) - 1  # Next button
-                        
-                        # Handle both legacy and slash command interactions
-                        if hasattr(button_interaction, 'response'):
-                            await button_interaction.response.edit_message(
-                                embed=self.embeds[self.current_page],
-                                view=self
+                def start_prefetch(self):
+                    """Fetch the page after the last loaded one while the player reads the current one"""
+                    next_after = self.pages[-1]['next_after']
+                    if self.prefetch is None and next_after is not None:
+                        self.prefetch = asyncio.create_task(
+                            cat_service.get_cat_page(
+                                player_id, after=next_after, per_page=CATS_PER_PAGE, sort=sort, **filters
                             )
-                        else:
-                            # For legacy interactions, edit the original message
-                            await button_interaction.message.edit(
-                                embed=self.embeds[self.current_page],
-                                view=self
-                            )
-                    except Exception as e:
-                        error_msg = f"An error occurred while navigating: {str(e)}"
-                        if hasattr(button_interaction, 'response'):
-                            await button_interaction.response.send_message(error_msg, ephemeral=True)
-                        else:
-                            await button_interaction.channel.send(error_msg)
+                        )
                 
-                @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, disabled=len(embeds) <= 1)
-                async def next_button(self, button_interaction: discord.Interaction, button: discord.ui.Button):
+                async def load_page(self, index: int) -> int:
+                    """Make sure page ``index`` is loaded; returns the index of the page to show"""
+                    async with self.loading:
+                        if index == len(self.pages) and self.pages[-1]['next_after'] is not None:
+                            self.start_prefetch()
+                            task, self.prefetch = self.prefetch, None
+                            self.pages.append(await task)
+                            self.start_prefetch()
+                    return min(index, len(self.pages) - 1)
+                
+                def update_buttons(self):
+                    self.children[0].disabled = self.current_page == 0  # Previous button
+                    self.children[1].disabled = self.pages[self.current_page]['next_after'] is None  # Next button
+                
+                def page_embed(self):
+                    return build_cat_page(
+                        cat_text, username, self.pages[self.current_page]['cats'],
+                        self.current_page + 1, max(page_count, len(self.pages)), summary
+                    )
+                
+                async def show_page(self, button_interaction, index: int):
                     try:
-                        self.current_page = min(len(self.embeds) - 1, self.current_page + 1)
-                        
-                        # Update button states
-                        self.children[0].disabled = self.current_page == 0  # Previous button
-                        self.children[1].disabled = self.current_page == len(self.embeds) - 1  # Next button
+                        self.current_page = await self.load_page(index)
+                        self.update_buttons()
                         
                         # Handle both legacy and slash command interactions
                         if hasattr(button_interaction, 'response'):
                             await button_interaction.response.edit_message(
-                                embed=self.embeds[self.current_page],
+                                embed=self.page_embed(),
                                 view=self
                             )
                         else:
                             # For legacy interactions, edit the original message
                             await button_interaction.message.edit(
-                                embed=self.embeds[self.current_page],
+                                embed=self.page_embed(),
                                 view=self
                             )
                     except Exception as e:
@@ -143,7 +215,17 @@ class CatCommands(commands.Cog):
                         else:
                             await button_interaction.channel.send(error_msg)
                 
+                @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, disabled=True)
+                async def previous_button(self, button_interaction: discord.Interaction, button: discord.ui.Button):
+                    await self.show_page(button_interaction, max(0, self.current_page - 1))
+                
+                @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+                async def next_button(self, button_interaction: discord.Interaction, button: discord.ui.Button):
+                    await self.show_page(button_interaction, self.current_page + 1)
+                
                 async def on_timeout(self):
+                    if self.prefetch is not None:
+                        self.prefetch.cancel()
                     try:
                         # Disable all buttons when the view times out
                         for child in self.children:
@@ -160,9 +242,10 @@ class CatCommands(commands.Cog):
                         pass
             
             # Send first page with navigation buttons
+            view = CatCollectionView()
             await interaction.followup.send(
-                embed=embeds[0],
-                view=CatCollectionView()
+                embed=view.page_embed(),
+                view=view
             )
             
         except Exception as e:
@@ -181,6 +264,16 @@ class CatCommands(commands.Cog):
                 # If we can't send any response, just log the error
                 print(f"Failed to send error message: {str(e)}")
     
+    @cats.autocomplete('breed')
+    async def breed_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest breed names containing what the player has typed so far"""
+        current = current.lower()
+        return [
+            app_commands.Choice(name=breed.name, value=breed.name)
+            for breed in self.cat_service.breeds
+            if current in breed.name.lower()
+        ][:25]
+    
     @app_commands.command(name="switch_cat", description="Switch your active cat")
     @app_commands.describe(cat_id="The ID of the cat you want to make active")
     async def switch_cat(self, interaction: discord.Interaction, cat_id: int):
@@ -189,7 +282,7 @@ class CatCommands(commands.Cog):
             # Defer the response immediately to prevent timeout
             await interaction.response.defer()
             
-            success, message = self.cat_service.switch_active_cat(
+            success, message = await self.cat_service.switch_active_cat(
                 cat_id=cat_id,
                 player_id=interaction.user.id
             )
@@ -230,7 +323,7 @@ class CatCommands(commands.Cog):
             # Defer the response immediately to prevent timeout
             await interaction.response.defer()
             
-            success, message = self.cat_service.rename_cat(
+            success, message = await self.cat_service.rename_cat(
                 cat_id=cat_id,
                 player_id=interaction.user.id,
                 new_name=new_name
@@ -264,7 +357,7 @@ class CatCommands(commands.Cog):
             # Defer the response immediately to prevent timeout
             await interaction.response.defer()
             
-            profile_data = self.player_service.get_profile(interaction.user.id)
+            profile_data = await self.player_service.get_profile(interaction.user.id, full=False)
             if not profile_data:
                 await interaction.followup.send(
                     "You haven't started your adventure yet! Use `/start` to begin.",
@@ -275,9 +368,9 @@ class CatCommands(commands.Cog):
             # Timer check for encounter
             player_id = profile_data['player']['id']
             action = "encounter"
-            cooldown = self.timer_config.get(action, 3600)
-            if not self.timer_service.is_available(player_id, action):
-                seconds_remaining = self.timer_service.get_seconds_remaining(player_id, action)
+            cooldown = self.services.config.cooldown(action, 3600)
+            if not await self.timer_service.is_available(player_id, action):
+                seconds_remaining = await self.timer_service.get_seconds_remaining(player_id, action)
                 minutes = seconds_remaining // 60
                 seconds = seconds_remaining % 60
                 await interaction.followup.send(
@@ -287,7 +380,7 @@ class CatCommands(commands.Cog):
                 return
 
             # Set next available time
-            self.timer_service.set_cooldown(player_id, action, cooldown)
+            await self.timer_service.set_cooldown(player_id, action, cooldown)
             
             # Get active cat
             active_cat = profile_data['active_cat']
@@ -298,11 +391,11 @@ class CatCommands(commands.Cog):
                 )
                 return
             
-            # Generate a random cat based on location
-            # TODO: Implement location-based rarity weights
-            encountered_cat = self.cat_service.generate_random(
+            # Generate a random cat weighted by the player's location
+            encountered_cat = await self.cat_service.generate_random(
                 player_id=None,  # No owner yet
-                name="Wild Cat"
+                name="Wild Cat",
+                location=profile_data['player']['current_location']
             )
             
             embed = discord.Embed(
@@ -313,10 +406,7 @@ class CatCommands(commands.Cog):
 
             embed.add_field(
                 name="Wild Cat",
-                value=f"Breed: {encountered_cat['breed']}\n"
-                      f"Level: {encountered_cat['level']}\n"
-                      f"Stats: ❤️ {encountered_cat['health']} | ⚔️ {encountered_cat['attack']} | "
-                      f"🛡️ {encountered_cat['defense']} | 💨 {encountered_cat['speed']}",
+                value=self.cat_text.get(encountered_cat).card,
                 inline=False
             )
 
@@ -327,26 +417,56 @@ class CatCommands(commands.Cog):
                     self.cat_service = cat_service
                     self.player_data = player_data
                     self.encountered_cat = encountered_cat
+                    self.catch_chance = 0.5  # Base 50% chance, higher after winning a battle
                 
                 @discord.ui.button(label="Battle", style=discord.ButtonStyle.danger)
                 async def battle(self, button_interaction: discord.Interaction, button: discord.ui.Button):
-                    # TODO: Implement battle system
-                    await button_interaction.response.send_message(
-                        "Battle system coming soon!",
-                        ephemeral=True
-                    )
+                    try:
+                        result = await self.cat_service.battle(self.player_data['active_cat'], self.encountered_cat)
+                        (own_health, own_max), (wild_health, wild_max) = result.health
+
+                        if result.winner == 0:
+                            # A worn-out wild cat is easier to catch
+                            self.catch_chance = 0.5 + 0.4 * (1 - wild_health / wild_max)
+                            outcome = f"You won! The wild cat is worn out, catching it is now easier ({self.catch_chance:.0%})."
+                            color = discord.Color.green()
+                            button.disabled = True
+                        elif result.winner == 1:
+                            outcome = "Your cat lost and the wild cat ran away! 😿"
+                            color = discord.Color.red()
+                            for child in self.children:
+                                child.disabled = True
+                        else:
+                            outcome = "Neither cat would give in. The wild cat is still here."
+                            color = discord.Color.light_grey()
+                            button.disabled = True
+
+                        battle_embed = discord.Embed(title="Battle! ⚔️", description=outcome, color=color)
+                        battle_embed.add_field(
+                            name=f"After {result.rounds} round{'s' if result.rounds != 1 else ''}",
+                            value="\n".join(result.log[-5:]),
+                            inline=False
+                        )
+                        battle_embed.set_footer(text=f"Your cat: ❤️ {own_health}/{own_max} | Wild cat: ❤️ {wild_health}/{wild_max}")
+                        await button_interaction.response.send_message(embed=battle_embed, ephemeral=True)
+                        await interaction.edit_original_response(view=self)
+                    except discord.errors.NotFound:
+                        # If the original message was deleted or interaction expired
+                        pass
+                    except Exception as e:
+                        await button_interaction.response.send_message(
+                            f"An error occurred during the battle: {str(e)}",
+                            ephemeral=True
+                        )
                 
                 @discord.ui.button(label="Try to Catch", style=discord.ButtonStyle.primary)
                 async def catch(self, button_interaction: discord.Interaction, button: discord.ui.Button):
                     try:
-                        # Calculate catch chance based on health percentage
-                        catch_chance = 0.5  # Base 50% chance
-                        
-                        if random.random() < catch_chance:
+                        if random.random() < self.catch_chance:
                             # Success!
                             self.encountered_cat['player_id'] = self.player_data['player']['id']
                             self.encountered_cat['name'] = f"{self.player_data['player']['username']}'s {self.encountered_cat['breed']}"
-                            self.cat_service.save_cat(self.encountered_cat)
+                            await self.cat_service.save_cat(self.encountered_cat)
                             
                             await button_interaction.response.send_message(
                                 f"Success! You caught the {self.encountered_cat['breed']}! 🎉",
@@ -402,10 +522,13 @@ class CatCommands(commands.Cog):
                         # If the original message was deleted
                         pass
             
-            await interaction.followup.send(
+            image = await self.image_service.breed_image(encountered_cat['breed'], 'embed')
+            message = await interaction.followup.send(
                 embed=embed,
-                view=EncounterView(self.cat_service, profile_data)
+                view=EncounterView(self.cat_service, profile_data),
+                **attach_image(embed, image)
             )
+            await remember_upload(self.image_service, image, message)
             
         except Exception as e:
             try:
@@ -0,0 +1,100 @@
+import logging
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+logger = logging.getLogger('whiskerverse.leaderboard')
+
+BOARD_TITLES = {
+    'level': "🏆 Top Players by Level",
+    'coins': "💰 Richest Players",
+    'cats': "🐱 Biggest Cat Collections"
+}
+
+def format_score(board: str, score) -> str:
+    if board == 'level':
+        return f"Level {score[0]} ({score[1]:,} XP)"
+    if board == 'coins':
+        return f"{score[0]:,} coins"
+    return f"{score[0]:,} cat{'s' if score[0] != 1 else ''}"
+
+class LeaderboardCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.leaderboards = bot.services.leaderboards
+        self.leaderboard_service = bot.services.leaderboard_service
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Put players on the leaderboards of the servers they play in"""
+        if interaction.guild_id is None or self.leaderboards.is_member(interaction.guild_id, interaction.user.id):
+            return
+        try:
+            await self.leaderboard_service.join_guild(interaction.guild_id, player_id=interaction.user.id)
+        except Exception:
+            logger.exception("Error recording server membership")
+
+    @app_commands.command(name="leaderboard", description="See the top players, globally or in this server")
+    @app_commands.describe(board="What to rank players by", scope="Everyone, or only players in this server")
+    @app_commands.choices(
+        board=[
+            app_commands.Choice(name="Level", value="level"),
+            app_commands.Choice(name="Coins", value="coins"),
+            app_commands.Choice(name="Cats", value="cats")
+        ],
+        scope=[
+            app_commands.Choice(name="This server", value="server"),
+            app_commands.Choice(name="Global", value="global")
+        ]
+    )
+    async def leaderboard(self, interaction: discord.Interaction, board: str = "level", scope: str = "server"):
+        """Show the top 10 players and your own rank"""
+        try:
+            # Defer the response immediately to prevent timeout
+            await interaction.response.defer()
+
+            guild_id = interaction.guild_id if scope == "server" else None
+            top = await self.leaderboard_service.top(board, 10, guild_id=guild_id)
+            mine = await self.leaderboard_service.rank(board, interaction.user.id, guild_id=guild_id)
+
+            where = "Global" if guild_id is None else (interaction.guild.name if interaction.guild else "This Server")
+            embed = discord.Embed(
+                title=f"{BOARD_TITLES[board]} - {where}",
+                color=discord.Color.gold()
+            )
+
+            if top:
+                medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+                embed.description = "\n".join(
+                    f"{medals.get(rank, f'**{rank}.**')} {username or player_id} - {format_score(board, score)}"
+                    for rank, player_id, username, score in top
+                )
+            else:
+                embed.description = "No players here yet! Use `/start` to begin your adventure."
+
+            if mine:
+                rank, total, score = mine
+                embed.set_footer(text=f"Your rank: #{rank} of {total:,} - {format_score(board, score)}")
+            else:
+                embed.set_footer(text="You're not on this leaderboard yet. Use /start to begin!")
+
+            await interaction.followup.send(embed=embed)
+
+        except Exception as e:
+            try:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(
+                        f"An error occurred while fetching the leaderboard: {str(e)}",
+                        ephemeral=True
+                    )
+                else:
+                    await interaction.followup.send(
+                        f"An error occurred while fetching the leaderboard: {str(e)}",
+                        ephemeral=True
+                    )
+            except Exception:
+                # If we can't send any response, just log the error
+                logger.exception("Failed to send error message")
+
+async def setup(bot):
+    await bot.add_cog(LeaderboardCommands(bot))
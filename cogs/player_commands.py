@@ -1,12 +1,15 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from models.services.player_service import PlayerService
+from .cat_commands import attach_image, remember_upload
 
 class PlayerCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.player_service = PlayerService()
+        self.player_service = bot.services.player_service
+        self.cat_text = bot.services.cat_text
+        self.image_service = bot.services.image_service
+        self.cards = bot.services.cards
     
     @app_commands.command(name="start", description="Start your Whiskerverse adventure!")
     async def start(self, interaction: discord.Interaction):
@@ -15,7 +18,7 @@ class PlayerCommands(commands.Cog):
             # Defer the response immediately to prevent timeout
             await interaction.response.defer()
             
-            success, message, cat = self.player_service.start_adventure(
+            success, message, cat = await self.player_service.start_adventure(
                 discord_id=interaction.user.id,
                 username=interaction.user.name,
                 cat_name=f"{interaction.user.name}'s First Cat"
@@ -77,7 +80,7 @@ class PlayerCommands(commands.Cog):
             # Defer the response immediately to prevent timeout
             await interaction.response.defer()
             
-            profile_data = self.player_service.get_profile(interaction.user.id)
+            profile_data = await self.player_service.get_profile(interaction.user.id, full=False)
             if not profile_data:
                 await interaction.followup.send(
                     "You haven't started your adventure yet! Use `/start` to begin.",
@@ -87,8 +90,6 @@ class PlayerCommands(commands.Cog):
             
             player = profile_data['player']
             active_cat = profile_data['active_cat']
-            cats = profile_data['cats']
-            inventory = profile_data['inventory']
             
             embed = discord.Embed(
                 title=f"{player['username']}'s Profile",
@@ -109,33 +110,34 @@ class PlayerCommands(commands.Cog):
             if active_cat:
                 embed.add_field(
                     name="Active Cat",
-                    value=f"Name: {active_cat['name']}\n"
-                          f"Breed: {active_cat['breed']}\n"
-                          f"Level: {active_cat['level']}\n"
-                          f"Stats: ❤️ {active_cat['health']} | ⚔️ {active_cat['attack']} | "
-                          f"🛡️ {active_cat['defense']} | 💨 {active_cat['speed']}",
+                    value=self.cat_text.get(active_cat).profile,
                     inline=False
                 )
             
             # Cat collection
-            cat_count = len(cats)
             embed.add_field(
                 name="Cat Collection",
-                value=f"Total Cats: {cat_count}",
+                value=f"Total Cats: {profile_data['cat_count']}",
                 inline=False
             )
             
             # Inventory summary
-            item_count = sum(item['quantity'] for item in inventory)
             embed.add_field(
                 name="Inventory",
-                value=f"Total Items: {item_count}",
+                value=f"Total Items: {profile_data['item_count']}",
                 inline=False
             )
             
             embed.set_footer(text="Use /cats to see your cat collection and /inventory to see your items!")
             
-            await interaction.followup.send(embed=embed)
+            # The rendered card when there is one; the cat's art as a thumbnail when the renderer is busy
+            card = await self.cards.render(profile_data)
+            if card:
+                image = await self.image_service.attachment_for(card)
+            else:
+                image = await self.image_service.breed_image(active_cat['breed'], 'thumbnail') if active_cat else None
+            message = await interaction.followup.send(embed=embed, **attach_image(embed, image, thumbnail=not card))
+            await remember_upload(self.image_service, image, message)
             
         except Exception as e:
             try:
@@ -1,23 +1,16 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from models.services.timer_service import TimerService
-import json
-import os
 
 class TimerCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.timer_service = TimerService()
-        # Load timer config from configs folder
-        with open(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'configs', 'timers_config.json'), 'r') as f:
-            config = json.load(f)
-            self.timer_config = config["timers"]
-            self.admin_id = config["players"]["admin_id"]
+        self.services = bot.services
+        self.timer_service = self.services.timer_service
     
     def is_admin(self, user_id: int) -> bool:
         """Check if the user is an admin"""
-        return user_id == self.admin_id
+        return user_id == self.services.config.admin_id
     
     @app_commands.command(name="timer_reset_all", description="[ADMIN] Reset all timer cooldowns for everyone")
     async def timer_reset_all(self, interaction: discord.Interaction):
@@ -35,7 +28,7 @@ class TimerCommands(commands.Cog):
             await interaction.response.defer()
             
             # Clear all timers from the database
-            success = self.timer_service.reset_all_timers()
+            success = await self.timer_service.reset_all_timers()
             
             if success:
                 embed = discord.Embed(
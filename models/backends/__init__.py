@@ -0,0 +1,19 @@
+import os
+from .base import DatabaseBackend
+
+BACKENDS = ('mysql', 'sqlite')
+
+
+def get_backend(name: str = None) -> DatabaseBackend:
+    """Create the storage backend named by ``name`` or WHISKERVERSE_DB_BACKEND (default: mysql)"""
+    name = (name or os.getenv('WHISKERVERSE_DB_BACKEND', 'mysql')).lower()
+    if name == 'mysql':
+        from .mysql_backend import MySQLBackend
+        return MySQLBackend()
+    if name == 'sqlite':
+        from .sqlite_backend import SQLiteBackend
+        return SQLiteBackend()
+    raise ValueError(f"Unknown database backend '{name}', expected one of: {', '.join(BACKENDS)}")
+
+
+__all__ = ['DatabaseBackend', 'get_backend', 'BACKENDS']
@@ -0,0 +1,133 @@
+import os
+from ..statement_cache import StatementCache, StatementCacheStats
+
+# Statements worth preparing server-side; DDL and admin statements run as plain text
+PREPARABLE_PREFIXES = ('select', 'insert', 'update', 'delete', 'replace')
+
+
+def is_preparable(query):
+    return query.lstrip()[:7].lower().startswith(PREPARABLE_PREFIXES)
+
+
+class DatabaseBackend:
+    """Storage engine used by DatabaseManager.
+
+    Repositories write SQL with ``%s`` placeholders; a backend opens raw
+    connections for the pool, runs statements, and supplies the few pieces
+    of SQL that differ between engines (schema, upserts).
+    """
+
+    name = None
+    # Exception types raised by the driver for failed statements
+    errors = (Exception,)
+    # Upper bound on pooled connections, or None for no limit
+    max_pool_size = None
+    # Never evict idle connections (an in-memory database dies with its last connection)
+    keep_connections_open = False
+    # Whether DDL can be rolled back (lets migration dry runs apply and undo changes)
+    transactional_ddl = False
+
+    def __init__(self):
+        # Per-connection LRU of prepared statements (WHISKERVERSE_STATEMENT_CACHE_SIZE, 0 disables)
+        self.statement_cache_size = int(os.getenv('WHISKERVERSE_STATEMENT_CACHE_SIZE', '64'))
+        self.statement_stats = StatementCacheStats()
+        self._statement_caches = {}
+
+    def statement_cache(self, connection):
+        """Prepared statement cache belonging to ``connection``"""
+        cache = self._statement_caches.get(id(connection))
+        if cache is None:
+            cache = self._statement_caches[id(connection)] = StatementCache(
+                self.statement_cache_size,
+                self.statement_stats,
+                factory=lambda query: self.prepare_statement(connection, query),
+                on_evict=self.release_statement
+            )
+        return cache
+
+    def prepare_statement(self, connection, query):
+        """Prepare ``query`` on ``connection`` and return a handle for execute"""
+        raise NotImplementedError
+
+    def release_statement(self, statement):
+        """Deallocate a statement evicted from the cache"""
+
+    def connect(self):
+        """Open a new raw connection"""
+        raise NotImplementedError
+
+    def ping(self, connection):
+        """Return True if the connection is still usable"""
+        raise NotImplementedError
+
+    def is_connected(self, connection):
+        """Cheap liveness check used after a failed statement"""
+        return self.ping(connection)
+
+    def cursor(self, connection):
+        """Create a cursor that returns rows as dicts"""
+        raise NotImplementedError
+
+    def begin(self, connection):
+        raise NotImplementedError
+
+    def commit(self, connection):
+        connection.commit()
+
+    def rollback(self, connection):
+        connection.rollback()
+
+    def close(self, connection):
+        cache = self._statement_caches.pop(id(connection), None)
+        if cache is not None:
+            try:
+                cache.clear()
+            except Exception:
+                pass
+        connection.close()
+
+    def prepare_sql(self, query):
+        """Translate a ``%s``-style query into the driver's dialect"""
+        return query
+
+    def execute(self, connection, cursor, query, params, fetch):
+        """Run one statement; return its rows when ``fetch`` is set, else the affected row count"""
+        raise NotImplementedError
+
+    def execute_many(self, cursor, query, params_list):
+        """Run one statement for every parameter tuple and return the affected row count"""
+        raise NotImplementedError
+
+    def execute_insert(self, connection, cursor, query, params):
+        """Run one INSERT and return the auto-increment id it generated"""
+        raise NotImplementedError
+
+    def insert_many(self, connection, cursor, table, columns, rows):
+        """Insert ``rows`` with one multi-row INSERT and return their generated ids in order"""
+        raise NotImplementedError
+
+    def execute_batch(self, connection, cursor, statements):
+        """Run several SELECT statements, ideally in one round trip, and return each one's rows"""
+        return [self.execute(connection, cursor, query, params, True) for query, params in statements]
+
+    def explain_sql(self, query):
+        """Statement that shows the engine's plan for ``query``"""
+        return f"EXPLAIN {query}"
+
+    def column_exists(self, db, table, column):
+        raise NotImplementedError
+
+    def index_exists(self, db, table, index):
+        raise NotImplementedError
+
+    def schema_statements(self):
+        """CREATE TABLE statements for the game schema"""
+        raise NotImplementedError
+
+    def upsert(self, table, columns, conflict_columns, update_columns=(), increment_columns=()):
+        """INSERT that updates the existing row when ``conflict_columns`` collide.
+
+        ``update_columns`` are overwritten with the incoming value and
+        ``increment_columns`` have the incoming value added to them.
+        """
+        raise NotImplementedError
@@ -0,0 +1,224 @@
+import os
+from functools import lru_cache
+from .base import DatabaseBackend, is_preparable
+
+
+class MySQLBackend(DatabaseBackend):
+    """MySQL 8 via mysql-connector-python"""
+
+    name = 'mysql'
+
+    def __init__(self):
+        super().__init__()
+        # Imported here so the SQLite backend works without the MySQL driver installed
+        import mysql.connector
+        from mysql.connector import Error
+        self._connector = mysql.connector
+        self.errors = (Error,)
+        self.host = os.getenv('MYSQL_HOST')
+        self.user = os.getenv('MYSQL_USER')
+        self.password = os.getenv('MYSQL_PASSWORD')
+        self.database = os.getenv('MYSQL_DATABASE')
+        # Per-connection @@auto_increment_increment, read on the first multi-row INSERT
+        self._increments = {}
+
+    def connect(self):
+        try:
+            connection = self._connector.connect(
+                host=self.host,
+                user=self.user,
+                password=self.password,
+                database=self.database,
+                autocommit=True
+            )
+            print("Successfully connected to the database")
+            return connection
+        except self.errors as e:
+            print(f"Error connecting to MySQL database: {e}")
+            raise
+
+    def close(self, connection):
+        self._increments.pop(id(connection), None)
+        super().close(connection)
+
+    def ping(self, connection):
+        connection.ping(reconnect=False)
+        return True
+
+    def is_connected(self, connection):
+        return connection.is_connected()
+
+    def cursor(self, connection):
+        return connection.cursor(dictionary=True, buffered=True)
+
+    def begin(self, connection):
+        connection.start_transaction()
+
+    def prepare_statement(self, connection, query):
+        # One prepared cursor per statement keeps it prepared server-side between executions
+        return connection.cursor(prepared=True, dictionary=True)
+
+    def release_statement(self, statement):
+        # Closing a prepared cursor deallocates the server-side statement
+        statement.close()
+
+    def execute(self, connection, cursor, query, params, fetch):
+        if self.statement_cache_size and is_preparable(query):
+            statement = self.statement_cache(connection).get(query)
+            statement.execute(query, params)
+            return statement.fetchall() if fetch else statement.rowcount
+
+        cursor.execute(query, params)
+        result = cursor.fetchall() if fetch else cursor.rowcount
+        # Ensure all results are consumed
+        while cursor.nextset():
+            pass
+        return result
+
+    def execute_insert(self, connection, cursor, query, params):
+        if self.statement_cache_size:
+            cursor = self.statement_cache(connection).get(query)
+        cursor.execute(query, params)
+        return cursor.lastrowid
+
+    def insert_many(self, connection, cursor, table, columns, rows):
+        row_placeholders = f"({', '.join(['%s'] * len(columns))})"
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row_placeholders] * len(rows))}"
+        cursor.execute(query, tuple(value for row in rows for value in row))
+        # LAST_INSERT_ID() is the first id of the statement; InnoDB reserves the ids for a
+        # multi-row INSERT with a known row count in one block, spaced by auto_increment_increment
+        first_id = cursor.lastrowid
+        step = self.auto_increment_increment(connection, cursor)
+        return list(range(first_id, first_id + len(rows) * step, step))
+
+    def auto_increment_increment(self, connection, cursor):
+        """Gap between consecutive auto-increment ids on ``connection`` (not 1 on multi-primary setups)"""
+        step = self._increments.get(id(connection))
+        if step is None:
+            cursor.execute("SELECT @@auto_increment_increment AS step")
+            step = self._increments[id(connection)] = int(cursor.fetchall()[0]['step'])
+        return step
+
+    def execute_batch(self, connection, cursor, statements):
+        # Send every statement as one multi-statement query; the driver interpolates
+        # the parameters client-side and we read one result set per statement
+        query = ';\n'.join(query.strip() for query, _ in statements)
+        params = tuple(param for _, statement_params in statements for param in statement_params)
+        results = []
+        for result in cursor.execute(query, params, multi=True):
+            results.append(result.fetchall() if result.with_rows else [])
+        return results
+
+    def execute_many(self, cursor, query, params_list):
+        cursor.executemany(query, params_list)
+        return cursor.rowcount
+
+    def column_exists(self, db, table, column):
+        rows = db.execute_query(
+            """
+            SELECT COUNT(*) AS count
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+            """,
+            (table, column)
+        )
+        return rows[0]['count'] > 0
+
+    def index_exists(self, db, table, index):
+        rows = db.execute_query(
+            """
+            SELECT COUNT(*) AS count
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+            """,
+            (table, index)
+        )
+        return rows[0]['count'] > 0
+
+    @lru_cache(maxsize=None)
+    def upsert(self, table, columns, conflict_columns, update_columns=(), increment_columns=()):
+        # MySQL resolves the conflict from whichever unique key collides
+        assignments = [f"{col} = VALUES({col})" for col in update_columns]
+        assignments += [f"{col} = {col} + VALUES({col})" for col in increment_columns]
+        return f"""
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join(['%s'] * len(columns))})
+            ON DUPLICATE KEY UPDATE {', '.join(assignments)}
+        """
+
+    def schema_statements(self):
+        return [
+            # Players table
+            """
+            CREATE TABLE IF NOT EXISTS players (
+                id BIGINT PRIMARY KEY,
+                username VARCHAR(255) NOT NULL,
+                level INT DEFAULT 1,
+                experience INT DEFAULT 0,
+                coins INT DEFAULT 100,
+                current_location VARCHAR(255) DEFAULT 'Whiskerton',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            # Cats table (player's collected cats)
+            """
+            CREATE TABLE IF NOT EXISTS cats (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                player_id BIGINT,
+                name VARCHAR(255) NOT NULL,
+                breed VARCHAR(255) NOT NULL,
+                level INT DEFAULT 1,
+                experience INT DEFAULT 0,
+                health INT DEFAULT 100,
+                attack INT DEFAULT 10,
+                defense INT DEFAULT 10,
+                speed INT DEFAULT 10,
+                is_active BOOLEAN DEFAULT FALSE,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (player_id) REFERENCES players(id)
+            )
+            """,
+            # Inventory table
+            """
+            CREATE TABLE IF NOT EXISTS inventory (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                player_id BIGINT,
+                item_id INT,
+                quantity INT DEFAULT 1,
+                FOREIGN KEY (player_id) REFERENCES players(id)
+            )
+            """,
+            # Items table
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                description TEXT,
+                type ENUM('weapon', 'armor', 'potion', 'material', 'misc') NOT NULL,
+                rarity ENUM('common', 'uncommon', 'rare', 'epic', 'legendary') NOT NULL,
+                value INT DEFAULT 0,
+                image_path VARCHAR(255) DEFAULT 'images/items/eternal_scroll_of_meowgic.png'
+            )
+            """,
+            # Locations table
+            """
+            CREATE TABLE IF NOT EXISTS locations (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                description TEXT,
+                region VARCHAR(255) NOT NULL,
+                level_requirement INT DEFAULT 1,
+                is_combat_zone BOOLEAN DEFAULT FALSE
+            )
+            """,
+            # Timers table for player actions
+            """
+            CREATE TABLE IF NOT EXISTS timers (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                player_id BIGINT NOT NULL,
+                action VARCHAR(255) NOT NULL,
+                next_available TIMESTAMP NOT NULL,
+                UNIQUE KEY unique_player_action (player_id, action)
+            )
+            """
+        ]
@@ -0,0 +1,204 @@
+import datetime
+import os
+import sqlite3
+from functools import lru_cache
+from .base import DatabaseBackend, is_preparable
+
+ITEM_TYPES = ('weapon', 'armor', 'potion', 'material', 'misc')
+RARITIES = ('common', 'uncommon', 'rare', 'epic', 'legendary')
+
+
+def _adapt_datetime(value):
+    return value.isoformat(' ')
+
+
+def _convert_timestamp(value):
+    return datetime.datetime.fromisoformat(value.decode())
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+# Store and read TIMESTAMP columns as naive datetimes, matching mysql-connector
+sqlite3.register_adapter(datetime.datetime, _adapt_datetime)
+sqlite3.register_converter('TIMESTAMP', _convert_timestamp)
+
+
+@lru_cache(maxsize=256)
+def _translate(query):
+    return query.replace('%s', '?')
+
+
+class SQLiteBackend(DatabaseBackend):
+    """Embedded SQLite engine, either a WAL-mode file or a private in-memory database"""
+
+    name = 'sqlite'
+    errors = (sqlite3.Error,)
+    transactional_ddl = True
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.database = path or os.getenv('SQLITE_PATH', 'whiskerverse.db')
+        self.in_memory = self.database == ':memory:'
+        # Every connection to ":memory:" is a separate database, so share a single one
+        self.max_pool_size = 1 if self.in_memory else None
+        self.keep_connections_open = self.in_memory
+
+    def connect(self):
+        connection = sqlite3.connect(
+            self.database,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            check_same_thread=False,  # the pool hands a connection to one thread at a time
+            cached_statements=max(self.statement_cache_size, 0)
+        )
+        connection.row_factory = _dict_row
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA busy_timeout = 5000")
+        if not self.in_memory:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def ping(self, connection):
+        connection.execute("SELECT 1")
+        return True
+
+    def is_connected(self, connection):
+        try:
+            return self.ping(connection)
+        except sqlite3.Error:
+            return False
+
+    def cursor(self, connection):
+        return connection.cursor()
+
+    def begin(self, connection):
+        connection.execute("BEGIN")
+
+    def prepare_sql(self, query):
+        return _translate(query)
+
+    def prepare_statement(self, connection, query):
+        # sqlite3 compiles and caches statements itself (cached_statements uses the
+        # same capacity and LRU policy); this entry only mirrors it for the hit/miss counters
+        return True
+
+    def execute(self, connection, cursor, query, params, fetch):
+        if self.statement_cache_size and is_preparable(query):
+            self.statement_cache(connection).get(query)
+        cursor.execute(query, params)
+        return cursor.fetchall() if fetch else cursor.rowcount
+
+    def execute_insert(self, connection, cursor, query, params):
+        self.execute(connection, cursor, query, params, False)
+        return cursor.lastrowid
+
+    def insert_many(self, connection, cursor, table, columns, rows):
+        row_placeholders = f"({', '.join(['?'] * len(columns))})"
+        query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row_placeholders] * len(rows))} "
+            f"RETURNING id"
+        )
+        cursor.execute(query, tuple(value for row in rows for value in row))
+        # RETURNING order is unspecified, but ids are assigned in VALUES order
+        return sorted(row['id'] for row in cursor.fetchall())
+
+    def execute_many(self, cursor, query, params_list):
+        cursor.executemany(query, params_list)
+        return cursor.rowcount
+
+    def explain_sql(self, query):
+        return f"EXPLAIN QUERY PLAN {query}"
+
+    def column_exists(self, db, table, column):
+        return any(row['name'] == column for row in db.execute_query(f"PRAGMA table_info({table})"))
+
+    def index_exists(self, db, table, index):
+        return any(row['name'] == index for row in db.execute_query(f"PRAGMA index_list({table})"))
+
+    @lru_cache(maxsize=None)
+    def upsert(self, table, columns, conflict_columns, update_columns=(), increment_columns=()):
+        assignments = [f"{col} = excluded.{col}" for col in update_columns]
+        assignments += [f"{col} = {table}.{col} + excluded.{col}" for col in increment_columns]
+        # Without a matching unique index SQLite needs a target-less conflict clause
+        target = f"({', '.join(conflict_columns)})" if conflict_columns else ""
+        return f"""
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join(['%s'] * len(columns))})
+            ON CONFLICT{target} DO UPDATE SET {', '.join(assignments)}
+        """
+
+    def schema_statements(self):
+        item_types = ', '.join(f"'{value}'" for value in ITEM_TYPES)
+        rarities = ', '.join(f"'{value}'" for value in RARITIES)
+        return [
+            """
+            CREATE TABLE IF NOT EXISTS players (
+                id BIGINT PRIMARY KEY,
+                username VARCHAR(255) NOT NULL,
+                level INT DEFAULT 1,
+                experience INT DEFAULT 0,
+                coins INT DEFAULT 100,
+                current_location VARCHAR(255) DEFAULT 'Whiskerton',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS cats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_id BIGINT,
+                name VARCHAR(255) NOT NULL,
+                breed VARCHAR(255) NOT NULL,
+                level INT DEFAULT 1,
+                experience INT DEFAULT 0,
+                health INT DEFAULT 100,
+                attack INT DEFAULT 10,
+                defense INT DEFAULT 10,
+                speed INT DEFAULT 10,
+                is_active BOOLEAN DEFAULT FALSE,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (player_id) REFERENCES players(id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS inventory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_id BIGINT,
+                item_id INT,
+                quantity INT DEFAULT 1,
+                FOREIGN KEY (player_id) REFERENCES players(id)
+            )
+            """,
+            f"""
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name VARCHAR(255) NOT NULL,
+                description TEXT,
+                type VARCHAR(16) NOT NULL CHECK (type IN ({item_types})),
+                rarity VARCHAR(16) NOT NULL CHECK (rarity IN ({rarities})),
+                value INT DEFAULT 0,
+                image_path VARCHAR(255) DEFAULT 'images/items/eternal_scroll_of_meowgic.png'
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS locations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name VARCHAR(255) NOT NULL,
+                description TEXT,
+                region VARCHAR(255) NOT NULL,
+                level_requirement INT DEFAULT 1,
+                is_combat_zone BOOLEAN DEFAULT FALSE
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS timers (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_id BIGINT NOT NULL,
+                action VARCHAR(255) NOT NULL,
+                next_available TIMESTAMP NOT NULL,
+                CONSTRAINT unique_player_action UNIQUE (player_id, action)
+            )
+            """
+        ]
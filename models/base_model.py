@@ -1,21 +1,46 @@
+import datetime
 from .database import DatabaseManager
+from .cache import profile_cache
+
+
+def utc_now():
+    """Current UTC time at the precision of a TIMESTAMP column"""
+    return datetime.datetime.utcnow().replace(microsecond=0)
+
 
 class BaseModel:
     table_name = None
     primary_key = 'id'
+    # Column holding the id of the player whose cached profile this row belongs to
+    profile_owner_field = None
+    # Column -> callable producing the value the database would default it to
+    insert_defaults = {}
+    # Attributes filled from queries (e.g. derived columns) that are never saved
+    computed_fields = ()
+    # Column bumped by every UPDATE, so readers can tell a row changed; None for tables without one
+    version_field = None
     
     def __init__(self, **kwargs):
         self.db = DatabaseManager()
+        # Column values as last read from or written to the database; None until then
+        self._persisted = None
         for key, value in kwargs.items():
             setattr(self, key, value)
     
+    @classmethod
+    def from_row(cls, row):
+        """Build an instance from a database row and mark it clean"""
+        instance = cls(**row)
+        instance._mark_clean()
+        return instance
+    
     @classmethod
     def get_by_id(cls, id_value):
         db = DatabaseManager()
         query = f"SELECT * FROM {cls.table_name} WHERE {cls.primary_key} = %s"
         results = db.execute_query(query, (id_value,))
         if results:
-            return cls(**results[0])
+            return cls.from_row(results[0])
         return None
     
     @classmethod
@@ -25,33 +50,76 @@ class BaseModel:
         if where_clause:
             query += f" WHERE {where_clause}"
         results = db.execute_query(query, params)
-        return [cls(**result) for result in results]
+        return [cls.from_row(result) for result in results]
+    
+    def _fields(self):
+        """Column values held by this instance"""
+        return {
+            key: value for key, value in vars(self).items()
+            if key != 'db' and not key.startswith('_') and key not in self.computed_fields
+        }
+    
+    def _mark_clean(self):
+        self._persisted = self._fields()
+    
+    def _mark_stale(self, *fields):
+        """Flag columns that were changed in the database behind this instance's back"""
+        if self._persisted is not None:
+            for field in fields:
+                self._persisted.pop(field, None)
+    
+    def dirty_fields(self):
+        """Columns changed since the instance was loaded or last saved.
+        
+        Instances that were never loaded report every column as dirty.
+        """
+        fields = self._fields()
+        if self._persisted is None:
+            return fields
+        return {
+            key: value for key, value in fields.items()
+            if key not in self._persisted or self._persisted[key] != value
+        }
     
     def save(self):
         """Save or update the model instance"""
+        is_update = hasattr(self, self.primary_key) and getattr(self, self.primary_key) is not None
+        if is_update and self._persisted is not None and not self.dirty_fields():
+            # Nothing changed since the last load or save
+            return 0
+        
         try:
             self.db.start_transaction()
             
-            if hasattr(self, self.primary_key) and getattr(self, self.primary_key) is not None:
+            if is_update:
                 result = self._update()
             else:
                 result = self._create()
             
+            self._invalidate_profile()
             self.db.end_transaction()
             return result
             
         except Exception as e:
-            self.db.end_transaction()
+            # Committing here would keep the partial writes and fire their after_commit hooks
+            self.db.rollback_transaction()
             raise
     
+    def _apply_insert_defaults(self):
+        """Fill server-side defaults client-side so inserts need no read-back"""
+        for key, default in self.insert_defaults.items():
+            if getattr(self, key, None) is None:
+                setattr(self, key, default())
+    
     def _create(self):
         """Insert a new record"""
+        self._apply_insert_defaults()
         fields = []
         values = []
         placeholders = []
         
-        for key, value in vars(self).items():
-            if key != 'db' and not key.startswith('_') and value is not None:
+        for key, value in self._fields().items():
+            if value is not None:
                 fields.append(key)
                 values.append(value)
                 placeholders.append('%s')
@@ -62,31 +130,46 @@ class BaseModel:
             VALUES ({', '.join(placeholders)})
         """
         
-        # Execute the insert and commit immediately
-        result = self.db.execute_query(query, tuple(values))
-        
-        # Verify using the same database connection
-        verify_query = f"SELECT * FROM {self.table_name} WHERE {self.primary_key} = %s"
-        verify_result = self.db.execute_query(verify_query, (getattr(self, self.primary_key),))
-        
-        if not verify_result:
-            raise Exception(f"Failed to create record in {self.table_name}")
-        
-        # Update the current instance with any default values from the database
-        for key, value in verify_result[0].items():
-            setattr(self, key, value)
+        # Auto-increment tables get their key straight from the cursor
+        generated_id = self.db.execute_insert(query, tuple(values))
+        if getattr(self, self.primary_key, None) is None:
+            setattr(self, self.primary_key, generated_id)
+        self._mark_clean()
         
         return True
     
+    @classmethod
+    def create_many(cls, instances):
+        """Insert new instances with multi-row INSERTs and assign their generated keys"""
+        if not instances:
+            return []
+        for instance in instances:
+            instance._apply_insert_defaults()
+        columns = [key for key in instances[0]._fields() if key != cls.primary_key]
+        rows = [tuple(getattr(instance, key) for key in columns) for instance in instances]
+        
+        db = DatabaseManager()
+        ids = db.insert_many(cls.table_name, columns, rows)
+        for instance, generated_id in zip(instances, ids):
+            setattr(instance, cls.primary_key, generated_id)
+            instance._mark_clean()
+            instance._invalidate_profile()
+        return instances
+    
     def _update(self):
-        """Update an existing record"""
-        updates = []
-        values = []
+        """Update only the columns that changed"""
+        changes = self.dirty_fields()
+        changes.pop(self.primary_key, None)
+        if self.version_field:
+            changes.pop(self.version_field, None)
+        if not changes:
+            return 0
         
-        for key, value in vars(self).items():
-            if key != 'db' and not key.startswith('_') and key != self.primary_key:
-                updates.append(f"{key} = %s")
-                values.append(value)
+        updates = [f"{key} = %s" for key in changes]
+        values = list(changes.values())
+        if self.version_field:
+            updates.append(f"{self.version_field} = {self.version_field} + 1")
+            setattr(self, self.version_field, (getattr(self, self.version_field, None) or 0) + 1)
         
         # Add the primary key value for the WHERE clause
         values.append(getattr(self, self.primary_key))
@@ -97,7 +180,9 @@ class BaseModel:
             WHERE {self.primary_key} = %s
         """
         
-        return self.db.execute_query(query, tuple(values))
+        result = self.db.execute_query(query, tuple(values))
+        self._mark_clean()
+        return result
     
     def delete(self):
         """Delete the record"""
@@ -105,4 +190,11 @@ class BaseModel:
             raise ValueError(f"Cannot delete without {self.primary_key}")
             
         query = f"DELETE FROM {self.table_name} WHERE {self.primary_key} = %s"
-        return self.db.execute_query(query, (getattr(self, self.primary_key),)) 
\ No newline at end of file
+        result = self.db.execute_query(query, (getattr(self, self.primary_key),))
+        self._invalidate_profile()
+        return result
+    
+    def _invalidate_profile(self):
+        """Drop the owning player's cached profile after a write"""
+        if self.profile_owner_field:
+            profile_cache.invalidate(getattr(self, self.profile_owner_field, None)) 
\ No newline at end of file
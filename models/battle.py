@@ -0,0 +1,149 @@
+import random
+from collections import namedtuple
+from .breeds import STAT_NAMES, get_breed_registry
+from .cat import Cat
+
+# Power of the basic attack every cat uses
+MOVE_POWER = 10
+
+# Rounds before a fight is called a draw (each round both cats attack once)
+MAX_ROUNDS = 50
+
+# winner: index (0 or 1) of the winning cat, None for a draw
+# health: (remaining, max) health of each cat; log: one line per attack
+BattleResult = namedtuple('BattleResult', ('winner', 'rounds', 'health', 'log'))
+
+
+def _as_cat(cat):
+    """Accept Cat instances or cat rows (dicts) such as profile['active_cat']"""
+    return cat if isinstance(cat, Cat) else Cat(**cat)
+
+
+def turn_order(first, second, rng=random):
+    """Indexes of (attacker, defender) for a round: faster cat first, ties settled by a coin flip"""
+    if first.speed != second.speed:
+        return (0, 1) if first.speed > second.speed else (1, 0)
+    return (0, 1) if rng.random() < 0.5 else (1, 0)
+
+
+def resolve_battle(first, second, move_power: int = MOVE_POWER, max_rounds: int = MAX_ROUNDS, rng=random):
+    """Fight two cats to the end using Cat.calculate_damage; nothing is saved"""
+    cats = (_as_cat(first), _as_cat(second))
+    health = [cats[0].health, cats[1].health]
+    order = turn_order(cats[0], cats[1], rng)
+    log = []
+    for round_number in range(1, max_rounds + 1):
+        for attacker, defender in (order, order[::-1]):
+            damage = cats[attacker].calculate_damage(cats[defender], move_power, rng)
+            health[defender] = max(0, health[defender] - damage)
+            log.append(f"{cats[attacker].name} hits {cats[defender].name} for {damage} ({health[defender]} HP left)")
+            if health[defender] == 0:
+                return BattleResult(
+                    attacker, round_number,
+                    ((health[0], cats[0].health), (health[1], cats[1].health)), log
+                )
+    return BattleResult(None, max_rounds, ((health[0], cats[0].health), (health[1], cats[1].health)), log)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Battle simulations need NumPy: pip install numpy") from e
+    return numpy
+
+
+def simulate_battles(first, second, move_power: int = MOVE_POWER, max_rounds: int = MAX_ROUNDS,
+                     seed=None, np_rng=None):
+    """Play many fights at once with NumPy, one per row of the stat arrays.
+
+    ``first`` and ``second`` map each stat name to an array (one entry per
+    fight). Damage follows Cat.calculate_damage exactly: attack * power /
+    defense, times a uniform variance, times the crit multiplier on a crit,
+    truncated to an int. Returns (winner, rounds) arrays where winner is 0,
+    1 or -1 for a draw.
+    """
+    np = _numpy()
+    np_rng = np_rng or np.random.default_rng(seed)
+    low, high = Cat.DAMAGE_VARIANCE
+    count = len(first['health'])
+
+    attack = np.stack([np.asarray(first['attack'], dtype=np.float64), np.asarray(second['attack'], dtype=np.float64)])
+    defense = np.stack([np.asarray(first['defense'], dtype=np.float64), np.asarray(second['defense'], dtype=np.float64)])
+    health = np.stack([np.asarray(first['health'], dtype=np.int64), np.asarray(second['health'], dtype=np.int64)])
+    speed_first = np.asarray(first['speed'])
+    speed_second = np.asarray(second['speed'])
+    # Which cat attacks first in every round of each fight
+    leader = np.where(
+        speed_first == speed_second,
+        (np_rng.random(count) >= 0.5).astype(np.int64),
+        (speed_second > speed_first).astype(np.int64)
+    )
+
+    fights = np.arange(count)
+    winner = np.full(count, -1, dtype=np.int64)
+    rounds = np.full(count, max_rounds, dtype=np.int64)
+    active = fights
+    for round_number in range(1, max_rounds + 1):
+        for striker_is_leader in (True, False):
+            if not active.size:
+                return winner, rounds
+            attacker = leader[active] if striker_is_leader else 1 - leader[active]
+            defender = 1 - attacker
+            variance = np_rng.uniform(low, high, active.size)
+            variance = np.where(np_rng.random(active.size) < Cat.CRIT_CHANCE, variance * Cat.CRIT_MULTIPLIER, variance)
+            damage = (attack[attacker, active] * move_power / defense[defender, active] * variance).astype(np.int64)
+            remaining = np.maximum(0, health[defender, active] - damage)
+            health[defender, active] = remaining
+            finished = remaining == 0
+            winner[active[finished]] = attacker[finished]
+            rounds[active[finished]] = round_number
+            active = active[~finished]
+    return winner, rounds
+
+
+def win_rate_matrix(battles_per_pair: int = 100, breeds=None, spread: float = 0.0,
+                    move_power: int = MOVE_POWER, max_rounds: int = MAX_ROUNDS,
+                    seed=None, chunk_size: int = 1_000_000):
+    """Win rates for every ordered pair of breeds from the breed registry.
+
+    Cell [i, j] is how often breed i beats breed j. With ``spread`` each
+    fight rolls stats within ±spread of the breed's base stats, like a wild
+    encounter; otherwise base stats are used. Returns a dict with ``breeds``,
+    ``win_rate``, ``draw_rate`` and ``mean_rounds`` (N x N arrays) and
+    ``battles``.
+    """
+    np = _numpy()
+    np_rng = np.random.default_rng(seed)
+    registry = breeds or get_breed_registry()
+    names = [breed.name for breed in registry]
+    base = np.array([[registry.stats_of(name)[stat] for stat in STAT_NAMES] for name in names], dtype=np.float64)
+    count = len(names)
+    pairs = count * count
+
+    wins = np.zeros(pairs, dtype=np.int64)
+    draws = np.zeros(pairs, dtype=np.int64)
+    total_rounds = np.zeros(pairs, dtype=np.int64)
+    total = pairs * battles_per_pair
+    for start in range(0, total, chunk_size):
+        pair = np.arange(start, min(start + chunk_size, total)) // battles_per_pair
+        fighters = []
+        for breed_index in (pair // count, pair % count):
+            stats = base[breed_index]
+            if spread:
+                stats = stats * np_rng.uniform(1 - spread, 1 + spread, stats.shape)
+            stats = stats.astype(np.int64)
+            fighters.append({stat: stats[:, column] for column, stat in enumerate(STAT_NAMES)})
+        winner, rounds = simulate_battles(fighters[0], fighters[1], move_power, max_rounds, np_rng=np_rng)
+        wins += np.bincount(pair, weights=winner == 0, minlength=pairs).astype(np.int64)
+        draws += np.bincount(pair, weights=winner == -1, minlength=pairs).astype(np.int64)
+        total_rounds += np.bincount(pair, weights=rounds, minlength=pairs).astype(np.int64)
+
+    shape = (count, count)
+    return {
+        'breeds': names,
+        'win_rate': (wins / battles_per_pair).reshape(shape),
+        'draw_rate': (draws / battles_per_pair).reshape(shape),
+        'mean_rounds': (total_rounds / battles_per_pair).reshape(shape),
+        'battles': total
+    }
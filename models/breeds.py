@@ -0,0 +1,142 @@
+import csv
+import os
+import random
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+DATA_FILE = os.path.join(ROOT_DIR, 'data', 'Whiskerverse_Cats_List.csv')
+IMAGE_DIR = os.path.join('images', 'cats')
+
+RARITIES = ('common', 'uncommon', 'rare', 'epic', 'legendary')
+
+STAT_NAMES = ('health', 'attack', 'defense', 'speed')
+
+# Base stats for breeds the registry doesn't know
+DEFAULT_STATS = MappingProxyType({'health': 100, 'attack': 10, 'defense': 10, 'speed': 10})
+
+# Breeds handed out before the CSV became the only breed list; cats of these breeds still exist
+LEGACY_BREED_RARITIES = MappingProxyType({
+    'Domestic Longhair': 'common',
+    'Mixed Breed': 'common',
+    'American Shorthair': 'uncommon',
+    'Mystic Shadowpaw': 'epic',
+    'Celestial Whisker': 'epic',
+    'Astral Prowler': 'epic',
+    'Ethereal Purrer': 'epic',
+    'Void Walker': 'epic',
+    'Ancient Mau': 'legendary',
+    'Spectral Tiger': 'legendary',
+    'Phoenix Cat': 'legendary',
+    'Dragon Kitten': 'legendary',
+    'Cosmic Feline': 'legendary'
+})
+
+Breed = namedtuple('Breed', ('name', 'rarity', 'stats', 'image_path'))
+
+
+def image_slug(breed: str) -> str:
+    """File name stem used for a breed's image, e.g. 'Alley Cat' -> 'alley_cat'"""
+    return '_'.join(breed.lower().replace("'", '').split())
+
+
+class BreedRegistry:
+    """Read-only breed data with dict indexes by breed and by rarity.
+
+    Lookups by breed never scan: ``rarity_of``, ``stats_of`` and
+    ``image_of`` are single dict lookups, and breeds missing from the CSV
+    fall back to LEGACY_BREED_RARITIES, then to defaults, instead of raising.
+    """
+
+    __slots__ = ('_breeds', '_by_rarity')
+
+    def __init__(self, breeds):
+        index = {}
+        by_rarity = {rarity: [] for rarity in RARITIES}
+        for breed in breeds:
+            index[breed.name] = breed
+            by_rarity.setdefault(breed.rarity, []).append(breed.name)
+        self._breeds = MappingProxyType(index)
+        self._by_rarity = MappingProxyType({rarity: tuple(names) for rarity, names in by_rarity.items()})
+
+    @classmethod
+    def from_csv(cls, path: str = DATA_FILE, image_dir: str = IMAGE_DIR):
+        """Load breeds from the cats CSV (breed, rarity, health, attack, defense, speed)"""
+        images = {}
+        image_root = os.path.join(ROOT_DIR, image_dir)
+        if os.path.isdir(image_root):
+            for filename in os.listdir(image_root):
+                stem, extension = os.path.splitext(filename)
+                if extension.lower() in ('.png', '.jpg', '.jpeg', '.gif', '.webp'):
+                    images[stem.lower()] = os.path.join(image_dir, filename).replace(os.sep, '/')
+
+        breeds = []
+        with open(path, newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                name = row['breed'].strip()
+                breeds.append(Breed(
+                    name=name,
+                    rarity=row['rarity'].strip().lower(),
+                    stats=MappingProxyType({stat: int(row[stat]) for stat in STAT_NAMES}),
+                    image_path=images.get(image_slug(name))
+                ))
+        return cls(breeds)
+
+    def __contains__(self, breed):
+        return breed in self._breeds
+
+    def __len__(self):
+        return len(self._breeds)
+
+    def __iter__(self):
+        return iter(self._breeds.values())
+
+    def get(self, breed: str):
+        """The Breed record, or None for breeds that aren't in the CSV"""
+        return self._breeds.get(breed)
+
+    def rarity_of(self, breed: str, default: str = 'common') -> str:
+        record = self._breeds.get(breed)
+        if record is not None:
+            return record.rarity
+        return LEGACY_BREED_RARITIES.get(breed, default)
+
+    def stats_of(self, breed: str):
+        """Base stats of a breed (DEFAULT_STATS if unknown); read-only"""
+        record = self._breeds.get(breed)
+        return record.stats if record is not None else DEFAULT_STATS
+
+    def image_of(self, breed: str):
+        """Path of the breed's image under images/cats, or None if it has none"""
+        record = self._breeds.get(breed)
+        return record.image_path if record is not None else None
+
+    @property
+    def by_rarity(self):
+        """Breed names per rarity, e.g. ``by_rarity['rare']``"""
+        return self._by_rarity
+
+    def breeds_of(self, rarity: str):
+        return self._by_rarity.get(rarity, ())
+
+    def roll_stats(self, breed: str, spread: float = 0.1, rng=random) -> dict:
+        """Base stats of the breed, each varied by up to ±spread"""
+        return {
+            stat: int(value * rng.uniform(1 - spread, 1 + spread))
+            for stat, value in self.stats_of(breed).items()
+        }
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_breed_registry() -> BreedRegistry:
+    """Process-wide registry, loaded from the CSV on first use"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = BreedRegistry.from_csv()
+    return _registry
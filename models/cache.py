@@ -0,0 +1,166 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from .database import DatabaseManager
+
+_MISSING = object()
+
+
+def estimate_size(value) -> int:
+    """Rough deep size in bytes of the dict/list rows we cache"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+class LRUCache:
+    """Thread-safe LRU cache with a per-entry TTL, bounded by entry count and estimated bytes"""
+
+    def __init__(self, max_entries=10000, max_bytes=64 * 1024 * 1024, ttl=30.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at, size = entry
+            if expires_at <= time.monotonic():
+                self._remove_locked(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (value, time.monotonic() + self.ttl, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._remove_locked(key, entry[2])
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove_locked(self, key, size):
+        del self._entries[key]
+        self._bytes -= size
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+
+class ProfileCache:
+    """Read-through cache of PlayerService.get_profile results.
+
+    Cached profiles are shared between callers and must be treated as
+    read-only. Every write to a player's rows bumps that player's
+    generation, so a load that raced with a write is never stored.
+    """
+
+    def __init__(self, cache: LRUCache, enabled=True):
+        self.cache = cache
+        self.enabled = enabled
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Build from WHISKERVERSE_PROFILE_CACHE_* environment variables (TTL 0 disables)"""
+        ttl = float(os.getenv('WHISKERVERSE_PROFILE_CACHE_TTL', '30'))
+        cache = LRUCache(
+            max_entries=int(os.getenv('WHISKERVERSE_PROFILE_CACHE_MAX_ENTRIES', '10000')),
+            max_bytes=int(os.getenv('WHISKERVERSE_PROFILE_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+            ttl=ttl
+        )
+        return cls(cache, enabled=ttl > 0)
+
+    def get_profile(self, player_id: int, full: bool, loader):
+        """Return the cached profile or call ``loader()`` and cache its result"""
+        if not self.enabled:
+            return loader()
+        profile = self.cache.get((player_id, full), _MISSING)
+        if profile is _MISSING and not full:
+            # A full profile answers a counts-only request too
+            profile = self.cache.get((player_id, True), _MISSING)
+        if profile is not _MISSING:
+            return profile
+
+        generation = self._generations.get(player_id, 0)
+        profile = loader()
+        with self._lock:
+            if self._generations.get(player_id, 0) == generation:
+                self.cache.put((player_id, full), profile)
+        return profile
+
+    def invalidate(self, player_id: int):
+        """Drop a player's cached profiles now and again once the current transaction commits"""
+        if not self.enabled or player_id is None:
+            return
+        self._invalidate(player_id)
+        DatabaseManager().after_commit(lambda: self._invalidate(player_id))
+
+    def _invalidate(self, player_id):
+        with self._lock:
+            self._generations[player_id] = self._generations.get(player_id, 0) + 1
+        self.cache.delete((player_id, True))
+        self.cache.delete((player_id, False))
+
+    def clear(self):
+        with self._lock:
+            self._generations.clear()
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+profile_cache = ProfileCache.from_env()
@@ -0,0 +1,260 @@
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from .breeds import ROOT_DIR, STAT_NAMES, get_breed_registry
+from .images import get_image_store
+from .services.async_service import get_executor
+
+logger = logging.getLogger('whiskerverse.cards')
+
+# Bump when the card layout changes so cached cards are rendered again
+CARD_VERSION = 1
+
+CARD_SIZE = (600, 240)
+ART_SIZE = (200, 200)
+BACKGROUND = (35, 39, 42)
+TEXT = (255, 255, 255)
+MUTED = (170, 176, 182)
+BAR_BACKGROUND = (64, 68, 75)
+
+# Frame colour of each rarity, matching the rarity emoji
+RARITY_COLORS = {
+    'common': (160, 160, 160),
+    'uncommon': (46, 204, 113),
+    'rare': (52, 152, 219),
+    'epic': (155, 89, 182),
+    'legendary': (241, 196, 15)
+}
+
+STAT_BARS = {
+    # stat: (label, bar colour, value that fills the bar)
+    'health': ("HP", (231, 76, 60), 200),
+    'attack': ("ATK", (230, 126, 34), 35),
+    'defense': ("DEF", (52, 152, 219), 30),
+    'speed': ("SPD", (46, 204, 113), 30)
+}
+
+
+def card_inputs(profile, art_path=None, art_digest=None):
+    """Everything drawn on a profile card, from a get_profile result with an active cat"""
+    player = profile['player']
+    cat = profile['active_cat']
+    return {
+        'version': CARD_VERSION,
+        'username': player['username'],
+        'player_level': player['level'],
+        'name': cat['name'],
+        'breed': cat['breed'],
+        'rarity': cat.get('rarity') or get_breed_registry().rarity_of(cat['breed']),
+        'level': cat['level'],
+        'stats': {stat: cat[stat] for stat in STAT_NAMES},
+        'art': art_path,
+        'art_digest': art_digest
+    }
+
+
+def card_key(inputs) -> str:
+    """SHA-256 of the card inputs; the art is identified by its digest, not its path"""
+    hashed = {key: value for key, value in inputs.items() if key != 'art'}
+    encoded = json.dumps(hashed, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _font(ImageFont, size):
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        # Pillow before 10.1 only has the small bitmap font
+        return ImageFont.load_default()
+
+
+def render_card(inputs, target):
+    """Draw a profile card and write it to ``target``; runs in a worker process"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    frame = RARITY_COLORS.get(inputs['rarity'], RARITY_COLORS['common'])
+    card = Image.new('RGBA', CARD_SIZE, BACKGROUND)
+    draw = ImageDraw.Draw(card)
+    draw.rectangle((0, 0, CARD_SIZE[0] - 1, CARD_SIZE[1] - 1), outline=frame, width=6)
+
+    # Cat art, centred in its box, or an empty box for breeds without art
+    art_box = (20, 20, 20 + ART_SIZE[0], 20 + ART_SIZE[1])
+    draw.rectangle(art_box, fill=BAR_BACKGROUND)
+    if inputs['art']:
+        with Image.open(inputs['art']) as art:
+            art = art.convert('RGBA')
+            art.thumbnail(ART_SIZE, Image.LANCZOS)
+            card.alpha_composite(art, (
+                art_box[0] + (ART_SIZE[0] - art.width) // 2,
+                art_box[1] + (ART_SIZE[1] - art.height) // 2
+            ))
+    draw.rectangle(art_box, outline=frame, width=3)
+
+    left = art_box[2] + 20
+    draw.text((left, 22), inputs['name'], font=_font(ImageFont, 26), fill=TEXT)
+    small = _font(ImageFont, 16)
+    draw.text((left, 56), f"Level {inputs['level']} {inputs['breed']} · {inputs['rarity'].title()}",
+              font=small, fill=frame)
+    draw.text((left, 78), f"{inputs['username']} · Player level {inputs['player_level']}", font=small, fill=MUTED)
+
+    # One bar per stat, full at STAT_BARS' value
+    bar_left, bar_right = left + 48, CARD_SIZE[0] - 70
+    for row, stat in enumerate(STAT_NAMES):
+        label, color, full = STAT_BARS[stat]
+        value = inputs['stats'][stat]
+        top = 116 + row * 28
+        draw.text((left, top), label, font=small, fill=MUTED)
+        draw.rounded_rectangle((bar_left, top + 2, bar_right, top + 16), radius=7, fill=BAR_BACKGROUND)
+        filled = bar_left + int((bar_right - bar_left) * min(1.0, value / full))
+        if filled > bar_left:
+            draw.rounded_rectangle((bar_left, top + 2, max(filled, bar_left + 14), top + 16), radius=7, fill=color)
+        draw.text((bar_right + 10, top), str(value), font=small, fill=TEXT)
+
+    # Write to a temporary file first so readers never see a half-written card
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(target), suffix='.png')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            card.save(f, 'PNG', optimize=True)
+        os.replace(temporary, target)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return target
+
+
+class CardRenderer:
+    """Renders /profile cards in a process pool so image work never blocks the event loop.
+
+    Cards are cached on disk under the hash of everything drawn on them, so
+    a profile whose cat and level haven't changed is never drawn twice.
+    At most ``max_pending`` cards are queued or rendering at once; past that
+    ``render`` returns None and the caller shows a profile without a card.
+    Identical requests in flight share one render.
+    """
+
+    def __init__(self, cache_dir: str = None, workers: int = 2, max_pending: int = 8):
+        self.images = get_image_store()
+        self.cache_dir = cache_dir or os.path.join(self.images.cache_dir, 'cards')
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._lock = threading.Lock()
+        self._inflight = {}  # card key -> future of its render
+        try:
+            import PIL  # noqa: F401
+            self.available = workers > 0
+        except ImportError:
+            self.available = False
+        self.rendered = 0
+        self.cache_hits = 0
+        self.rejected = 0
+        self.failed = 0
+
+    @classmethod
+    def from_env(cls):
+        """Build from WHISKERVERSE_CARD_* environment variables (0 workers disables cards)"""
+        return cls(
+            workers=int(os.getenv('WHISKERVERSE_CARD_WORKERS', '2')),
+            max_pending=int(os.getenv('WHISKERVERSE_CARD_MAX_PENDING', '8'))
+        )
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that runs threads can copy held locks, so workers are spawned
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _inputs(self, profile):
+        breed = profile['active_cat']['breed']
+        art = get_breed_registry().image_of(breed)
+        if art:
+            art = os.path.join(ROOT_DIR, art)
+            try:
+                return card_inputs(profile, art, self.images.source_digest(art))
+            except OSError as e:
+                logger.warning("Card for %s drawn without art: %s", breed, e)
+        return card_inputs(profile)
+
+    def _prepare(self, profile):
+        """Card inputs, their key, the card's path and whether it is already cached"""
+        inputs = self._inputs(profile)
+        key = card_key(inputs)
+        target = os.path.join(self.cache_dir, key[:2], f"card_{key}.png")
+        return inputs, key, target, os.path.exists(target)
+
+    async def render(self, profile):
+        """Path of the profile card for a get_profile result, or None if it can't be had now"""
+        if not self.available or not profile or not profile.get('active_cat'):
+            return None
+        # The first card of a breed hashes its full-size art, so this runs on the service executor
+        loop = asyncio.get_running_loop()
+        inputs, key, target, cached = await loop.run_in_executor(get_executor(), self._prepare, profile)
+        if cached:
+            self.cache_hits += 1
+            return target
+
+        future = self._inflight.get(key)
+        if future is None:
+            if len(self._inflight) >= self.max_pending:
+                self.rejected += 1
+                return None
+            try:
+                future = asyncio.wrap_future(self._pool().submit(render_card, inputs, target))
+            except Exception as e:
+                # A broken pool (e.g. a worker that died) only costs the card, not the /profile
+                self.failed += 1
+                logger.warning("Could not queue a profile card: %s", e)
+                return None
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        try:
+            # A caller that gives up must not cancel the render other callers wait for
+            path = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failed += 1
+            logger.warning("Rendering a profile card failed: %s", e)
+            return None
+        self.rendered += 1
+        return path
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            'available': self.available,
+            'rendered': self.rendered,
+            'cache_hits': self.cache_hits,
+            'pending': len(self._inflight),
+            'rejected': self.rejected,
+            'failed': self.failed
+        }
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_card_renderer() -> CardRenderer:
+    """Process-wide card renderer, configured from the environment on first use"""
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = CardRenderer.from_env()
+    return _renderer
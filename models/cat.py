@@ -1,44 +1,21 @@
-from .base_model import BaseModel
+from .base_model import BaseModel, utc_now
+from .breeds import get_breed_registry
+from .encounters import get_encounter_generator
+from .leaderboard import get_leaderboards
 import random
-import csv
-import os
 
 class Cat(BaseModel):
     table_name = 'cats'
+    profile_owner_field = 'player_id'
+    insert_defaults = {'created_at': utc_now}
+    # Derived from players.active_cat_id, never written to the cats table
+    computed_fields = ('is_active',)
+    version_field = 'row_version'
 
-    # Load cat breeds and stats from CSV
-    DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'Whiskerverse_Cats_List.csv')
-    BREEDS = []
-    RARITY_WEIGHTS = {}
-    BREED_STATS = {}
-
-    @classmethod
-    def load_cat_data(cls):
-        cls.BREEDS = []
-        cls.RARITY_WEIGHTS = {}
-        cls.BREED_STATS = {}
-        try:
-            with open(cls.DATA_FILE, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    breed = row['breed']
-                    rarity = row['rarity']
-                    health = int(row['health'])
-                    attack = int(row['attack'])
-                    defense = int(row['defense'])
-                    speed = int(row['speed'])
-                    cls.BREEDS.append(breed)
-                    if rarity not in cls.RARITY_WEIGHTS:
-                        cls.RARITY_WEIGHTS[rarity] = []
-                    cls.RARITY_WEIGHTS[rarity].append(breed)
-                    cls.BREED_STATS[breed] = {
-                        'health': health,
-                        'attack': attack,
-                        'defense': defense,
-                        'speed': speed
-                    }
-        except Exception as e:
-            print(f"Error loading cat data from CSV: {e}")
+    # Damage formula constants, shared with the vectorized simulator in models/battle.py
+    DAMAGE_VARIANCE = (0.8, 1.2)
+    CRIT_CHANCE = 0.1
+    CRIT_MULTIPLIER = 1.5
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -46,33 +23,39 @@ class Cat(BaseModel):
         self.player_id = kwargs.get('player_id')
         self.name = kwargs.get('name')
         self.breed = kwargs.get('breed')
+        self.rarity = kwargs.get('rarity') or get_breed_registry().rarity_of(self.breed)
         self.level = kwargs.get('level', 1)
         self.experience = kwargs.get('experience', 0)
-        # Use breed stats from loaded CSV
-        breed_stats = self.BREED_STATS.get(self.breed, {'health': 100, 'attack': 10, 'defense': 10, 'speed': 10})
+        # Use breed stats from the breed registry
+        breed_stats = get_breed_registry().stats_of(self.breed)
         self.health = kwargs.get('health', breed_stats['health'])
         self.attack = kwargs.get('attack', breed_stats['attack'])
         self.defense = kwargs.get('defense', breed_stats['defense'])
         self.speed = kwargs.get('speed', breed_stats['speed'])
         self.is_active = kwargs.get('is_active', False)
         self.created_at = kwargs.get('created_at')
+        self.row_version = kwargs.get('row_version', 0)
+
+    def save(self):
+        is_new = self.id is None
+        result = super().save()
+        if is_new:
+            get_leaderboards().record_cats(self.player_id)
+        return result
+
+    def delete(self):
+        result = super().delete()
+        get_leaderboards().record_cats(self.player_id, -1)
+        return result
 
     @classmethod
     def generate_random(cls, player_id: int, name: str, rarity: str = None):
         """Generate a random cat with the given rarity"""
-        if rarity is None:
-            # Default rarity weights
-            weights = [0.5, 0.25, 0.15, 0.08, 0.02]  # common, uncommon, rare, epic, legendary
-            rarity = random.choices(list(cls.RARITY_WEIGHTS.keys()), weights=weights)[0]
-
-        breed = random.choice(cls.RARITY_WEIGHTS[rarity])
-        base_stats = cls.BREED_STATS[breed]
+        # Without a rarity, the default encounter profile's rarity weights apply
+        breed = get_encounter_generator().sample_breed(rarity=rarity)
 
         # Add some randomness to stats (±10%)
-        stats = {
-            stat: int(value * random.uniform(0.9, 1.1))
-            for stat, value in base_stats.items()
-        }
+        stats = get_breed_registry().roll_stats(breed)
 
         cat = cls(
             player_id=player_id,
@@ -111,28 +94,28 @@ class Cat(BaseModel):
     def set_active(self, active: bool = True):
         """Set this cat as the active cat for battles"""
         if active:
-            # First, deactivate all other cats for this player
             self.db.execute_query(
-                "UPDATE cats SET is_active = FALSE WHERE player_id = %s",
-                (self.player_id,)
+                "UPDATE players SET active_cat_id = %s WHERE id = %s",
+                (self.id, self.player_id)
+            )
+        else:
+            self.db.execute_query(
+                "UPDATE players SET active_cat_id = NULL WHERE id = %s AND active_cat_id = %s",
+                (self.player_id, self.id)
             )
-
         self.is_active = active
-        self.save()
+        self._invalidate_profile()
 
-    def calculate_damage(self, target, move_power: int):
+    def calculate_damage(self, target, move_power: int, rng=random):
         """Calculate damage for an attack move"""
         # Basic damage formula: (attack * move_power) / target_defense
         base_damage = (self.attack * move_power) / target.defense
 
         # Add randomness (±20%)
-        variance = random.uniform(0.8, 1.2)
+        variance = rng.uniform(*self.DAMAGE_VARIANCE)
 
         # Critical hit chance (10%)
-        if random.random() < 0.1:
-            variance *= 1.5
+        if rng.random() < self.CRIT_CHANCE:
+            variance *= self.CRIT_MULTIPLIER
 
         return int(base_damage * variance)
-
-# Load data at class initialization
-Cat.load_cat_data()
\ No newline at end of file
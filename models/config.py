@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger('whiskerverse.config')
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'configs')
+
+
+class ConfigFile:
+    """Parsed JSON file that is re-read when it changes on disk.
+
+    The file is stat'ed at most every ``check_interval`` seconds and only
+    parsed again when its modification time or size changed. A file that
+    fails to parse is reported and the previous contents are kept.
+    """
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._data = None
+        self._signature = None
+        self._checked_at = float('-inf')
+        self._lock = threading.Lock()
+
+    @property
+    def data(self) -> dict:
+        if time.monotonic() - self._checked_at >= self.check_interval or self._data is None:
+            self._refresh()
+        return self._data
+
+    def _refresh(self):
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                stat = os.stat(self.path)
+            except OSError as e:
+                if self._data is None:
+                    raise
+                logger.warning("Error reading config %s: %s", self.path, e)
+                return
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self._signature:
+                return
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                if self._data is None:
+                    raise
+                # Don't re-read (and re-report) the broken file until it changes again
+                self._signature = signature
+                logger.warning("Error reloading config %s, keeping the previous version: %s", self.path, e)
+                return
+            self._data = data
+            self._signature = signature
+            self.reloads += 1
+
+
+class TimersConfig(ConfigFile):
+    """configs/timers_config.json: action cooldowns and the admin id"""
+
+    def __init__(self, path: str = None, check_interval: float = None):
+        super().__init__(
+            path or os.path.join(CONFIG_DIR, 'timers_config.json'),
+            float(os.getenv('WHISKERVERSE_CONFIG_CHECK_INTERVAL', '5')) if check_interval is None else check_interval
+        )
+
+    @property
+    def timers(self) -> dict:
+        """Cooldown in seconds per action"""
+        return self.data["timers"]
+
+    def cooldown(self, action: str, default: int = 3600) -> int:
+        return self.timers.get(action, default)
+
+    @property
+    def admin_id(self) -> int:
+        return self.data["players"]["admin_id"]
+
+
+class EncountersConfig(ConfigFile):
+    """configs/encounters_config.json: rarity weight profiles and the profile used at each location"""
+
+    def __init__(self, path: str = None, check_interval: float = None):
+        super().__init__(
+            path or os.path.join(CONFIG_DIR, 'encounters_config.json'),
+            float(os.getenv('WHISKERVERSE_CONFIG_CHECK_INTERVAL', '5')) if check_interval is None else check_interval
+        )
+
+    @property
+    def profiles(self) -> dict:
+        """Rarity weights per profile name"""
+        return self.data["profiles"]
+
+    @property
+    def locations(self) -> dict:
+        """Profile name per location; other locations use the 'default' profile"""
+        return self.data.get("locations", {})
@@ -0,0 +1,181 @@
+import threading
+import time
+from collections import deque
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no connection could be checked out before the timeout"""
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of database connections.
+
+    Connections are created lazily by ``factory`` up to ``size``. Idle
+    connections are health-checked on checkout, evicted after
+    ``idle_timeout`` seconds and pinged every ``keepalive_interval`` seconds
+    by a background thread so the server does not drop them.
+    """
+
+    def __init__(self, factory, size=5, checkout_timeout=10.0, idle_timeout=300.0,
+                 keepalive_interval=60.0, health_check_after=5.0,
+                 validate=None, close=None):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._factory = factory
+        self._validate = validate or (lambda conn: True)
+        self._close = close or (lambda conn: conn.close())
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self.health_check_after = health_check_after
+
+        self._lock = threading.Condition()
+        # (connection, last_used, last_checked) entries ordered by last_used, most recent on the right.
+        # Keepalive pings only move last_checked, so idle connections still age out by last_used
+        self._idle = deque()
+        self._in_use = 0
+        self._closed = False
+        self._keepalive_thread = None
+
+    @property
+    def total(self):
+        """Number of open connections, idle or checked out"""
+        with self._lock:
+            return self._in_use + len(self._idle)
+
+    def acquire(self):
+        """Check out a healthy connection, creating one if the pool has room"""
+        deadline = time.monotonic() + self.checkout_timeout
+        expired = []
+        try:
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise PoolExhaustedError("Connection pool is closed")
+                    expired += self._evict_idle_locked()
+                    if self._idle:
+                        connection, _, last_checked = self._idle.pop()
+                        self._in_use += 1
+                        break
+                    if self._in_use < self.size:
+                        connection, last_checked = None, None
+                        self._in_use += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolExhaustedError(
+                            f"No database connection available after {self.checkout_timeout}s "
+                            f"(pool size {self.size})"
+                        )
+                    self._lock.wait(remaining)
+        finally:
+            for stale in expired:
+                self._safe_close(stale)
+
+        # Connect and validate outside the lock so slow handshakes don't block other threads
+        try:
+            if connection is not None and time.monotonic() - last_checked >= self.health_check_after:
+                if not self._safe_validate(connection):
+                    self._safe_close(connection)
+                    connection = None
+            if connection is None:
+                connection = self._factory()
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+
+        self._ensure_keepalive()
+        return connection
+
+    def release(self, connection, discard=False):
+        """Return a connection to the pool, or close it if ``discard`` is set"""
+        with self._lock:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._lock.notify()
+            else:
+                now = time.monotonic()
+                self._idle.append((connection, now, now))
+                self._lock.notify()
+                return
+        self._safe_close(connection)
+
+    def close(self):
+        """Close every idle connection and refuse further checkouts"""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._lock.notify_all()
+        for connection, _, _ in idle:
+            self._safe_close(connection)
+
+    def _evict_idle_locked(self):
+        """Remove connections that sat idle past ``idle_timeout`` (oldest are on the left).
+
+        Returns them so the caller can close them after dropping the lock.
+        """
+        now = time.monotonic()
+        expired = []
+        while self._idle and now - self._idle[0][1] >= self.idle_timeout:
+            expired.append(self._idle.popleft()[0])
+        return expired
+
+    def _ensure_keepalive(self):
+        if self.keepalive_interval <= 0 or self._keepalive_thread is not None:
+            return
+        with self._lock:
+            if self._keepalive_thread is None:
+                self._keepalive_thread = threading.Thread(
+                    target=self._keepalive_loop, name="db-pool-keepalive", daemon=True
+                )
+                self._keepalive_thread.start()
+
+    def _keepalive_loop(self):
+        while True:
+            time.sleep(self.keepalive_interval)
+            with self._lock:
+                if self._closed:
+                    return
+                expired = self._evict_idle_locked()
+                now = time.monotonic()
+                stale = [entry for entry in self._idle if now - entry[2] >= self.keepalive_interval]
+                for entry in stale:
+                    self._idle.remove(entry)
+                self._in_use += len(stale)
+            for connection in expired:
+                self._safe_close(connection)
+
+            # Ping outside the lock; the connections are counted as checked out meanwhile
+            alive, dead = [], []
+            for connection, last_used, _ in stale:
+                if self._safe_validate(connection):
+                    alive.append((connection, last_used, time.monotonic()))
+                else:
+                    dead.append(connection)
+
+            with self._lock:
+                self._in_use -= len(stale)
+                if self._closed:
+                    dead += [connection for connection, _, _ in alive]
+                else:
+                    # Back in last_used order, so a ping never makes a connection look recently used
+                    self._idle = deque(sorted([*self._idle, *alive], key=lambda entry: entry[1]))
+                self._lock.notify(len(stale))
+            for connection in dead:
+                self._safe_close(connection)
+
+    def _safe_validate(self, connection):
+        try:
+            return self._validate(connection)
+        except Exception:
+            return False
+
+    def _safe_close(self, connection):
+        try:
+            self._close(connection)
+        except Exception:
+            pass
@@ -0,0 +1,179 @@
+import atexit
+import datetime
+import logging
+import os
+import threading
+import time
+from .repositories.timer_repository import TimerRepository
+
+logger = logging.getLogger('whiskerverse.cooldowns')
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def to_epoch(value: datetime.datetime) -> float:
+    """Naive UTC datetime (as stored in the timers table) to epoch seconds"""
+    return (value - EPOCH).total_seconds()
+
+
+def from_epoch(seconds: float) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(seconds=seconds)
+
+
+class CooldownStore:
+    """In-memory cooldowns keyed by (player_id, action), persisted write-behind.
+
+    A player's rows are loaded from the ``timers`` table the first time any
+    of their cooldowns is checked. Checks then only compare floats in memory.
+    Changes are written back in batches every ``flush_interval`` seconds and
+    on ``close()``, so cooldowns survive a restart. The store assumes one bot
+    process owns the ``timers`` table.
+    """
+
+    def __init__(self, timer_repo: TimerRepository = None, flush_interval: float = 5.0):
+        self.timer_repo = timer_repo or TimerRepository()
+        self.flush_interval = flush_interval
+        self._expires = {}        # (player_id, action) -> epoch seconds
+        self._loaded = set()      # players whose rows are in memory
+        self._dirty = {}          # (player_id, action) -> epoch seconds awaiting write
+        self._deleted = set()     # (player_id, action) awaiting delete
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _ensure_loaded(self, player_id: int):
+        if player_id in self._loaded:
+            return
+        rows = self.timer_repo.get_all_timers(player_id)
+        with self._lock:
+            if player_id in self._loaded:
+                return
+            for row in rows:
+                key = (player_id, row['action'])
+                # Keep writes made while the rows were loading
+                if key not in self._dirty and key not in self._deleted:
+                    self._expires[key] = to_epoch(row['next_available'])
+            self._loaded.add(player_id)
+
+    def expires_at(self, player_id: int, action: str):
+        """Epoch seconds when the action becomes available, or None if there is no cooldown"""
+        self._ensure_loaded(player_id)
+        return self._expires.get((player_id, action))
+
+    def remaining(self, player_id: int, action: str) -> float:
+        """Seconds until the action is available again (0 if it already is)"""
+        expires = self.expires_at(player_id, action)
+        if expires is None:
+            return 0.0
+        return max(0.0, expires - time.time())
+
+    def set(self, player_id: int, action: str, expires: float):
+        self._ensure_loaded(player_id)
+        key = (player_id, action)
+        with self._lock:
+            self._expires[key] = expires
+            self._dirty[key] = expires
+            self._deleted.discard(key)
+        self._ensure_flusher()
+
+    def delete(self, player_id: int, action: str):
+        self._ensure_loaded(player_id)
+        key = (player_id, action)
+        with self._lock:
+            self._expires.pop(key, None)
+            self._dirty.pop(key, None)
+            self._deleted.add(key)
+        self._ensure_flusher()
+
+    def player_timers(self, player_id: int):
+        """All (action, epoch seconds) cooldowns for a player"""
+        self._ensure_loaded(player_id)
+        with self._lock:
+            return [(action, expires) for (pid, action), expires in self._expires.items() if pid == player_id]
+
+    def reset_all(self):
+        """Expire every cooldown in memory and in the database"""
+        with self._flush_lock:
+            with self._lock:
+                self._dirty.clear()
+                self._deleted.clear()
+                for key in self._expires:
+                    self._expires[key] = 0.0
+            return self.timer_repo.reset_all_timers()
+
+    def flush(self):
+        """Write pending changes to the timers table"""
+        with self._flush_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, {}
+                deleted, self._deleted = self._deleted, set()
+            try:
+                self.timer_repo.set_timers([
+                    (player_id, action, from_epoch(expires))
+                    for (player_id, action), expires in dirty.items()
+                ])
+                self.timer_repo.delete_timers(list(deleted))
+            except Exception:
+                # Requeue whatever hasn't been superseded so the next flush retries it
+                with self._lock:
+                    for key, expires in dirty.items():
+                        if key not in self._deleted:
+                            self._dirty.setdefault(key, expires)
+                    for key in deleted:
+                        if key not in self._dirty:
+                            self._deleted.add(key)
+                logger.exception("Error flushing %d cooldown changes, will retry", len(dirty) + len(deleted))
+                return False
+            self._prune()
+            return True
+
+    def _prune(self):
+        """Forget players whose cooldowns have all expired; they reload on next use"""
+        now = time.time()
+        with self._lock:
+            active = {player_id for (player_id, _), expires in self._expires.items() if expires > now}
+            pending = {player_id for player_id, _ in self._dirty} | {player_id for player_id, _ in self._deleted}
+            for key in [key for key in self._expires if key[0] not in active and key[0] not in pending]:
+                del self._expires[key]
+            self._loaded &= active | pending
+
+    def _ensure_flusher(self):
+        if self._thread is not None or self.flush_interval <= 0:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._flush_loop, name="cooldown-flush", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Stop the background flusher and write everything still pending"""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if not self.flush():
+            # Nothing will retry after this, so the requeued changes are lost
+            with self._lock:
+                lost = len(self._dirty) + len(self._deleted)
+            logger.error("Shutting down with %d cooldown changes not saved", lost)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_cooldown_store() -> CooldownStore:
+    """Process-wide cooldown store (WHISKERVERSE_COOLDOWN_FLUSH_INTERVAL seconds between writes)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CooldownStore(
+                    flush_interval=float(os.getenv('WHISKERVERSE_COOLDOWN_FLUSH_INTERVAL', '5'))
+                )
+    return _store
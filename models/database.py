@@ -1,7 +1,30 @@
 import os
-import mysql.connector
-from mysql.connector import Error
+import contextvars
+from contextlib import contextmanager
 from dotenv import load_dotenv
+from .backends import get_backend
+from .connection_pool import ConnectionPool
+from .instrumentation import QueryInstrumentation, logger
+
+
+class _ConnectionState:
+    """Connection checked out by the current task or thread"""
+    __slots__ = ('connection', 'cursor', 'transaction_depth', 'holds', 'after_commit')
+
+    def __init__(self, connection, cursor):
+        self.connection = connection
+        self.cursor = cursor
+        self.transaction_depth = 0
+        self.holds = 0
+        self.after_commit = []
+
+
+# Statements whose rows execute_query returns (everything else returns the affected row count)
+ROW_RETURNING_PREFIXES = ('select', 'with', 'show', 'explain', 'pragma', 'describe')
+
+# Each asyncio task and each thread sees its own checked-out connection and cursor
+_connection_state = contextvars.ContextVar('whiskerverse_db_connection', default=None)
+
 
 class DatabaseManager:
     _instance = None
@@ -12,193 +35,205 @@ class DatabaseManager:
             cls._instance._initialize()
         return cls._instance
     
-    def _initialize(self):
-        """Initialize database connection parameters from environment variables"""
+    def _initialize(self, backend=None):
+        """Initialize the storage backend and connection pool from environment variables"""
         load_dotenv()
-        self.host = os.getenv('MYSQL_HOST')
-        self.user = os.getenv('MYSQL_USER')
-        self.password = os.getenv('MYSQL_PASSWORD')
-        self.database = os.getenv('MYSQL_DATABASE')
-        self.connection = None
-        self.cursor = None
-        self._transaction_depth = 0
+        self.backend = backend or get_backend()
+        self.database = self.backend.database
+        self.instrumentation = QueryInstrumentation.from_env()
+        pool_size = int(os.getenv('MYSQL_POOL_SIZE', '5'))
+        if self.backend.max_pool_size:
+            pool_size = min(pool_size, self.backend.max_pool_size)
+        idle_timeout = float(os.getenv('MYSQL_POOL_IDLE_TIMEOUT', '300'))
+        if self.backend.keep_connections_open:
+            idle_timeout = float('inf')
+        self.pool = ConnectionPool(
+            factory=self.backend.connect,
+            size=pool_size,
+            checkout_timeout=float(os.getenv('MYSQL_POOL_TIMEOUT', '10')),
+            idle_timeout=idle_timeout,
+            keepalive_interval=float(os.getenv('MYSQL_POOL_KEEPALIVE', '60')),
+            validate=self.backend.ping,
+            close=self.backend.close
+        )
+    
+    @classmethod
+    def configure(cls, backend=None):
+        """Point the shared instance at another backend, e.g. for scripts or benchmarks"""
+        if cls._instance is None:
+            cls._instance = super(DatabaseManager, cls).__new__(cls)
+        else:
+            cls._instance.close()
+        cls._instance._initialize(backend)
+        return cls._instance
+    
+    @property
+    def connection(self):
+        """Connection held by the current task, if any"""
+        state = _connection_state.get()
+        return state.connection if state else None
+    
+    @property
+    def cursor(self):
+        """Cursor held by the current task, if any"""
+        state = _connection_state.get()
+        return state.cursor if state else None
+    
+    @property
+    def _transaction_depth(self):
+        state = _connection_state.get()
+        return state.transaction_depth if state else 0
     
     def connect(self):
-        """Establish connection to the database"""
+        """Check a connection out of the pool for the current task"""
+        state = _connection_state.get()
+        if state is not None:
+            return state
+        connection = self.pool.acquire()
         try:
-            if self.connection is None or not self.connection.is_connected():
-                self.connection = mysql.connector.connect(
-                    host=self.host,
-                    user=self.user,
-                    password=self.password,
-                    database=self.database
-                )
-                self.cursor = self.connection.cursor(dictionary=True, buffered=True)
-                print("Successfully connected to the database")
-        except Error as e:
-            print(f"Error connecting to MySQL database: {e}")
+            cursor = self.backend.cursor(connection)
+        except Exception:
+            self.pool.release(connection, discard=True)
             raise
+        state = _ConnectionState(connection, cursor)
+        _connection_state.set(state)
+        return state
+    
+    def disconnect(self, discard=False):
+        """Return the current task's connection to the pool once nothing holds it"""
+        state = _connection_state.get()
+        if state is None:
+            return
+        if not discard and (state.transaction_depth > 0 or state.holds > 0):
+            return
+        _connection_state.set(None)
+        try:
+            state.cursor.close()
+        except Exception:
+            discard = True
+        self.pool.release(state.connection, discard=discard)
+    
+    def close(self):
+        """Close every pooled connection (used on shutdown)"""
+        self.pool.close()
     
-    def disconnect(self):
-        """Close database connection"""
-        if self.connection and self.connection.is_connected():
-            if self.cursor:
-                self.cursor.close()
-            self.connection.close()
-            print("Database connection closed")
+    @contextmanager
+    def connection_context(self):
+        """Pin one pooled connection to the current task for the duration of the block"""
+        state = self.connect()
+        state.holds += 1
+        try:
+            yield state.connection
+        finally:
+            state.holds -= 1
+            self.disconnect()
     
     def start_transaction(self):
         """Start a new transaction or increment the transaction depth"""
-        self._transaction_depth += 1
-        if self._transaction_depth == 1:
-            self.connect()
+        state = self.connect()
+        state.transaction_depth += 1
+        if state.transaction_depth == 1:
+            self.backend.begin(state.connection)
     
     def end_transaction(self):
         """End a transaction or decrement the transaction depth"""
-        if self._transaction_depth > 0:
-            self._transaction_depth -= 1
-            if self._transaction_depth == 0:
-                self.connection.commit()
+        state = _connection_state.get()
+        if state and state.transaction_depth > 0:
+            state.transaction_depth -= 1
+            if state.transaction_depth == 0:
+                self.backend.commit(state.connection)
                 self.disconnect()
+                callbacks, state.after_commit = state.after_commit, []
+                for callback in callbacks:
+                    callback()
     
-    def execute_query(self, query, params=None):
-        """Execute a query and return results"""
+    def rollback_transaction(self):
+        """Roll back the whole transaction, however deeply nested, and release the connection"""
+        state = _connection_state.get()
+        if state and state.transaction_depth > 0:
+            state.transaction_depth = 0
+            state.after_commit = []
+            try:
+                self.backend.rollback(state.connection)
+            finally:
+                self.disconnect()
+    
+    def after_commit(self, callback):
+        """Run ``callback`` once the current transaction commits, or now if there is none"""
+        state = _connection_state.get()
+        if state is not None and state.transaction_depth > 0:
+            state.after_commit.append(callback)
+        else:
+            callback()
+    
+    def _run(self, query, work, count_rows=None):
+        """Run ``work(state)`` on the task's connection and record it with the instrumentation"""
+        instrumentation = self.instrumentation
+        started = instrumentation.start() if instrumentation.enabled else None
+        state = self.connect()
+        discard = False
         try:
-            if self._transaction_depth == 0:
-                self.connect()
-            
-            print(f"Executing query: {query}")
-            print(f"With parameters: {params}")
-            
-            self.cursor.execute(query, params or ())
-            
-            if query.lower().strip().startswith('select'):
-                result = self.cursor.fetchall()
+            result = work(state)
+        except self.backend.errors as e:
+            if started is not None:
+                instrumentation.record(query, started, error=e)
             else:
-                # Only commit if we're not in a transaction
-                if self._transaction_depth == 0:
-                    self.connection.commit()
-                result = self.cursor.rowcount
-            
-            # Ensure all results are consumed
-            while self.cursor.nextset():
-                pass
-            
-            if self._transaction_depth == 0:
-                self.disconnect()
-            
-            return result
-            
-        except Error as e:
-            print(f"Error executing query: {e}")
-            print(f"Query was: {query}")
-            print(f"Parameters were: {params}")
+                logger.error("Error executing query: %s", e)
+            discard = not self.backend.is_connected(state.connection)
             raise
+        finally:
+            self.disconnect(discard=discard)
+        if started is not None:
+            instrumentation.record(query, started, count_rows(result) if count_rows else result)
+        return result
+    
+    def execute_query(self, query, params=None):
+        """Execute a query and return results"""
+        fetch = query.lstrip()[:8].lower().startswith(ROW_RETURNING_PREFIXES)
+        sql = self.backend.prepare_sql(query)
+        return self._run(query, lambda state: self.backend.execute(
+            state.connection, state.cursor, sql, params or (), fetch
+        ))
+
+    def execute_insert(self, query, params=None):
+        """Execute an INSERT and return the generated auto-increment id"""
+        sql = self.backend.prepare_sql(query)
+        return self._run(query, lambda state: self.backend.execute_insert(
+            state.connection, state.cursor, sql, params or ()
+        ), count_rows=lambda _: 1)
+
+    def insert_many(self, table, columns, rows, chunk_size=500):
+        """Insert many rows with multi-row INSERTs and return their generated ids in order"""
+        ids = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+            ids += self._run(query, lambda state: self.backend.insert_many(
+                state.connection, state.cursor, table, columns, chunk
+            ), count_rows=len)
+        return ids
+
+    def execute_batch(self, statements):
+        """Run a list of (query, params) SELECTs in one round trip and return each result"""
+        query = ';\n'.join(statement for statement, _ in statements)
+        prepared = [(self.backend.prepare_sql(statement), params) for statement, params in statements]
+        return self._run(query, lambda state: self.backend.execute_batch(
+            state.connection, state.cursor, prepared
+        ), count_rows=lambda results: sum(len(rows) for rows in results))
 
     def execute_many(self, query, params_list):
         """Execute multiple queries with different parameters"""
-        try:
-            self.connect()
-            self.cursor.executemany(query, params_list)
-            self.connection.commit()
-            return self.cursor.rowcount
-        except Error as e:
-            print(f"Error executing multiple queries: {e}")
-            raise
-        finally:
-            self.disconnect()
+        sql = self.backend.prepare_sql(query)
+        return self._run(query, lambda state: self.backend.execute_many(state.cursor, sql, params_list))
 
 # Create tables if they don't exist
-def initialize_database():
+def initialize_database(migrate: bool = True):
     db = DatabaseManager()
     
-    # Players table
-    create_players_table = """
-    CREATE TABLE IF NOT EXISTS players (
-        id BIGINT PRIMARY KEY,
-        username VARCHAR(255) NOT NULL,
-        level INT DEFAULT 1,
-        experience INT DEFAULT 0,
-        coins INT DEFAULT 100,
-        current_location VARCHAR(255) DEFAULT 'Whiskerton',
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    """
-    
-    # Cats table (player's collected cats)
-    create_cats_table = """
-    CREATE TABLE IF NOT EXISTS cats (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        player_id BIGINT,
-        name VARCHAR(255) NOT NULL,
-        breed VARCHAR(255) NOT NULL,
-        level INT DEFAULT 1,
-        experience INT DEFAULT 0,
-        health INT DEFAULT 100,
-        attack INT DEFAULT 10,
-        defense INT DEFAULT 10,
-        speed INT DEFAULT 10,
-        is_active BOOLEAN DEFAULT FALSE,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (player_id) REFERENCES players(id)
-    )
-    """
-    
-    # Inventory table
-    create_inventory_table = """
-    CREATE TABLE IF NOT EXISTS inventory (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        player_id BIGINT,
-        item_id INT,
-        quantity INT DEFAULT 1,
-        FOREIGN KEY (player_id) REFERENCES players(id)
-    )
-    """
-    
-    # Items table
-    create_items_table = """
-    CREATE TABLE IF NOT EXISTS items (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        name VARCHAR(255) NOT NULL,
-        description TEXT,
-        type ENUM('weapon', 'armor', 'potion', 'material', 'misc') NOT NULL,
-        rarity ENUM('common', 'uncommon', 'rare', 'epic', 'legendary') NOT NULL,
-        value INT DEFAULT 0,
-        image_path VARCHAR(255) DEFAULT 'images/items/eternal_scroll_of_meowgic.png'
-    )
-    """
-    
-    # Locations table
-    create_locations_table = """
-    CREATE TABLE IF NOT EXISTS locations (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        name VARCHAR(255) NOT NULL,
-        description TEXT,
-        region VARCHAR(255) NOT NULL,
-        level_requirement INT DEFAULT 1,
-        is_combat_zone BOOLEAN DEFAULT FALSE
-    )
-    """
-    
-    # Timers table for player actions
-    create_timers_table = """
-    CREATE TABLE IF NOT EXISTS timers (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        player_id BIGINT NOT NULL,
-        action VARCHAR(255) NOT NULL,
-        next_available TIMESTAMP NOT NULL,
-        UNIQUE KEY unique_player_action (player_id, action)
-    )
-    """
-
-    tables = [
-        create_players_table,
-        create_cats_table,
-        create_inventory_table,
-        create_items_table,
-        create_locations_table,
-        create_timers_table
-    ]
-
-    for table_query in tables:
-        db.execute_query(table_query)
\ No newline at end of file
+    for table_query in db.backend.schema_statements():
+        db.execute_query(table_query)
+    
+    if migrate:
+        # Bring the baseline tables up to the current schema
+        from .migrations import run_migrations
+        run_migrations(db)
@@ -0,0 +1,184 @@
+import logging
+import random
+import threading
+from .breeds import STAT_NAMES, get_breed_registry
+from .config import EncountersConfig
+
+logger = logging.getLogger('whiskerverse.encounters')
+
+DEFAULT_PROFILE = 'default'
+
+
+class AliasTable:
+    """Walker/Vose alias table: constant-time draws from a fixed discrete distribution"""
+
+    __slots__ = ('outcomes', 'probabilities', 'aliases')
+
+    def __init__(self, outcomes, weights):
+        pairs = [(outcome, float(weight)) for outcome, weight in zip(outcomes, weights) if weight > 0]
+        if not pairs:
+            raise ValueError("AliasTable needs at least one outcome with a positive weight")
+        self.outcomes = tuple(outcome for outcome, _ in pairs)
+        count = len(pairs)
+        total = sum(weight for _, weight in pairs)
+        scaled = [weight * count / total for _, weight in pairs]
+
+        probabilities = [1.0] * count
+        aliases = list(range(count))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probabilities[low] = scaled[low]
+            aliases[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Whatever is left is 1.0 up to rounding error
+        self.probabilities = tuple(probabilities)
+        self.aliases = tuple(aliases)
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def sample_index(self, rng=random) -> int:
+        index = rng.randrange(len(self.outcomes))
+        return index if rng.random() < self.probabilities[index] else self.aliases[index]
+
+    def sample(self, rng=random):
+        return self.outcomes[self.sample_index(rng)]
+
+    def sample_indices(self, size: int, np_rng):
+        """``size`` draws at once as a NumPy index array"""
+        np = _numpy()
+        probabilities = np.asarray(self.probabilities)
+        aliases = np.asarray(self.aliases)
+        index = np_rng.integers(0, len(self.outcomes), size=size)
+        return np.where(np_rng.random(size) < probabilities[index], index, aliases[index])
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Batched encounter generation needs NumPy: pip install numpy") from e
+    return numpy
+
+
+class EncounterGenerator:
+    """Draws wild cats from precomputed alias tables.
+
+    Each rarity profile in configs/encounters_config.json gets one alias
+    table over every breed, weighted by the profile's rarity weight split
+    evenly across that rarity's breeds, so a draw is one table lookup.
+    Locations map to profiles. Tables are rebuilt when the config file
+    changes. Pass ``seed`` (or a ``random.Random``) for reproducible draws.
+    """
+
+    def __init__(self, config: EncountersConfig = None, breeds=None, seed=None):
+        self.config = config or EncountersConfig()
+        self.breeds = breeds or get_breed_registry()
+        self.rng = random.Random(seed)
+        self._tables = {}
+        self._rarity_tables = {}
+        self._built_for = None
+        self._lock = threading.Lock()
+
+    def seed(self, seed):
+        """Restart the Python-path random stream from ``seed``"""
+        self.rng.seed(seed)
+
+    def _ensure_tables(self):
+        config = self.config
+        config.data  # stat the file (throttled) and reload it if it changed
+        if self._built_for == config.reloads:
+            return
+        with self._lock:
+            if self._built_for == config.reloads:
+                return
+            try:
+                self._build_tables(config)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError):
+                if not self._tables:
+                    raise
+                # A bare KeyError names only the missing key, so keep the traceback
+                logger.warning("Error rebuilding encounter tables from %s, keeping the previous ones",
+                               config.path, exc_info=True)
+            self._built_for = config.reloads
+
+    def _build_tables(self, config):
+        by_rarity = self.breeds.by_rarity
+        tables = {}
+        for name, weights in config.profiles.items():
+            breeds, breed_weights = [], []
+            for rarity, weight in weights.items():
+                pool = by_rarity.get(rarity, ())
+                for breed in pool:
+                    breeds.append(breed)
+                    breed_weights.append(weight / len(pool))
+            tables[name] = AliasTable(breeds, breed_weights)
+        if DEFAULT_PROFILE not in tables:
+            raise ValueError(f"no '{DEFAULT_PROFILE}' profile")
+        self._rarity_tables = {
+            rarity: AliasTable(pool, [1] * len(pool)) for rarity, pool in by_rarity.items() if pool
+        }
+        self._tables = tables
+
+    def table_for(self, location: str = None, profile: str = None) -> AliasTable:
+        """Alias table for a profile, or for the profile a location uses"""
+        self._ensure_tables()
+        if profile is None:
+            profile = self.config.locations.get(location, DEFAULT_PROFILE)
+        return self._tables.get(profile) or self._tables[DEFAULT_PROFILE]
+
+    def sample_breed(self, location: str = None, profile: str = None, rarity: str = None, rng=None) -> str:
+        """Draw one breed for a location or profile, or uniformly within one rarity"""
+        rng = rng or self.rng
+        if rarity is not None:
+            self._ensure_tables()
+            return self._rarity_tables[rarity].sample(rng)
+        return self.table_for(location, profile).sample(rng)
+
+    def generate(self, location: str = None, profile: str = None, rarity: str = None, rng=None) -> dict:
+        """One wild cat's breed, rarity and rolled stats"""
+        rng = rng or self.rng
+        breed = self.sample_breed(location, profile, rarity, rng)
+        return {
+            'breed': breed,
+            'rarity': self.breeds.rarity_of(breed),
+            **self.breeds.roll_stats(breed, rng=rng)
+        }
+
+    def generate_batch(self, count: int, location: str = None, profile: str = None, seed=None, np_rng=None) -> dict:
+        """``count`` wild cats at once as NumPy arrays (columns: breed, rarity and each stat).
+
+        Stats vary by ±10% around the breed's base stats like single draws.
+        Pass ``seed`` or a ``numpy.random.Generator`` for reproducible batches.
+        """
+        np = _numpy()
+        np_rng = np_rng or np.random.default_rng(seed)
+        table = self.table_for(location, profile)
+        index = table.sample_indices(count, np_rng)
+
+        breeds = np.array(table.outcomes, dtype=object)
+        rarities = np.array([self.breeds.rarity_of(breed) for breed in table.outcomes], dtype=object)
+        base = np.array([[self.breeds.stats_of(breed)[stat] for stat in STAT_NAMES] for breed in table.outcomes])
+        stats = (base[index] * np_rng.uniform(0.9, 1.1, size=(count, len(STAT_NAMES)))).astype(np.int64)
+
+        batch = {'breed': breeds[index], 'rarity': rarities[index]}
+        for column, stat in enumerate(STAT_NAMES):
+            batch[stat] = stats[:, column]
+        return batch
+
+
+_generator = None
+_generator_lock = threading.Lock()
+
+
+def get_encounter_generator() -> EncounterGenerator:
+    """Process-wide generator using configs/encounters_config.json"""
+    global _generator
+    if _generator is None:
+        with _generator_lock:
+            if _generator is None:
+                _generator = EncounterGenerator()
+    return _generator
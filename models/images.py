@@ -0,0 +1,246 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import parse_qs, urlparse
+from .breeds import ROOT_DIR, get_breed_registry
+
+logger = logging.getLogger('whiskerverse.images')
+
+# Bounding box of each derivative; images are shrunk to fit, never enlarged or cropped
+VARIANTS = {
+    'thumbnail': (128, 128),
+    'embed': (512, 512)
+}
+
+CACHE_DIR = os.path.join(ROOT_DIR, 'images', 'derived')
+
+# Discord attachment URLs are signed and stop working at their 'ex' timestamp;
+# they are dropped this many seconds early so a message never shows a dead image
+URL_EXPIRY_MARGIN = 3600
+
+# path: the derivative on disk; filename: the name to upload it under;
+# url: a CDN URL it was already uploaded to, or None if it has to be uploaded
+Attachment = namedtuple('Attachment', ('path', 'filename', 'url'))
+
+
+def _pil():
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise ImportError("Image derivatives need Pillow: pip install Pillow") from e
+    return Image
+
+
+def url_expiry(url: str, default_ttl: float) -> float:
+    """Unix time after which an attachment URL should no longer be used"""
+    expires = parse_qs(urlparse(url).query).get('ex')
+    if expires:
+        try:
+            return int(expires[0], 16) - URL_EXPIRY_MARGIN
+        except ValueError:
+            pass
+    return time.time() + default_ttl
+
+
+class ImageStore:
+    """Compressed derivatives of the cat and item art, and the URLs they were uploaded to.
+
+    Derivatives live in a content-addressed cache: a file is named after the
+    SHA-256 of its source image and the variant, so identical sources (every
+    item shares one image today) share one derivative, and an edited source
+    simply gets new files. Without Pillow the source image is used as is.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, image_format: str = 'webp', url_ttl: float = 86400):
+        self.cache_dir = cache_dir
+        self.image_format = image_format
+        self.url_ttl = url_ttl
+        self.urls_file = os.path.join(cache_dir, 'attachments.json')
+        self._digests = {}  # source path -> (mtime_ns, size, sha256)
+        self._urls = None  # derivative filename -> (url, expires_at), loaded on first use
+        self._lock = threading.Lock()
+        self._building = {}  # derivative path -> lock held while it is written
+        self.generated = 0
+        self.cache_hits = 0
+        self.uploads_reused = 0
+        self.uploads = 0
+
+    @classmethod
+    def from_env(cls):
+        """Build from WHISKERVERSE_IMAGE_* environment variables"""
+        return cls(
+            cache_dir=os.getenv('WHISKERVERSE_IMAGE_CACHE_DIR', CACHE_DIR),
+            image_format=os.getenv('WHISKERVERSE_IMAGE_FORMAT', 'webp').lower(),
+            url_ttl=float(os.getenv('WHISKERVERSE_ATTACHMENT_URL_TTL', '86400'))
+        )
+
+    def _format(self):
+        """'webp' if requested and this Pillow build can write it, otherwise 'png'"""
+        if self.image_format == 'webp':
+            from PIL import features
+            if features.check('webp'):
+                return 'webp'
+        return 'png'
+
+    def source_digest(self, path: str) -> str:
+        """SHA-256 of a source image, rehashed only when its size or mtime changes"""
+        path = os.path.join(ROOT_DIR, path)
+        stat = os.stat(path)
+        cached = self._digests.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+        self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def derivative(self, path: str, variant: str = 'embed', force: bool = False) -> str:
+        """Path of the cached ``variant`` of an image, generating it on first use"""
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown image variant {variant!r}, expected one of {', '.join(VARIANTS)}")
+        try:
+            Image = _pil()
+        except ImportError:
+            return os.path.join(ROOT_DIR, path)
+
+        width, height = VARIANTS[variant]
+        extension = self._format()
+        digest = self.source_digest(path)
+        target = os.path.join(self.cache_dir, digest[:2], f"{digest}_{variant}_{width}x{height}.{extension}")
+        if not force and os.path.exists(target):
+            self.cache_hits += 1
+            return target
+
+        with self._lock:
+            building = self._building.setdefault(target, threading.Lock())
+        try:
+            with building:
+                # Another thread may have written it while we waited
+                if not force and os.path.exists(target):
+                    self.cache_hits += 1
+                    return target
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with Image.open(os.path.join(ROOT_DIR, path)) as image:
+                    if image.mode not in ('RGB', 'RGBA'):
+                        image = image.convert('RGBA')
+                    image.thumbnail((width, height), Image.LANCZOS)
+                    # Write to a temporary file first so readers never see a half-written image
+                    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(target), suffix=f'.{extension}')
+                    try:
+                        with os.fdopen(fd, 'wb') as f:
+                            if extension == 'webp':
+                                image.save(f, 'WEBP', quality=80, method=6)
+                            else:
+                                image.save(f, 'PNG', optimize=True)
+                        os.replace(temporary, target)
+                    except BaseException:
+                        os.unlink(temporary)
+                        raise
+                self.generated += 1
+        finally:
+            # Drop the lock even when the source is corrupt, or it stays in _building forever
+            with self._lock:
+                self._building.pop(target, None)
+        return target
+
+    def attachment(self, path: str, variant: str = 'embed') -> Attachment:
+        """The derivative to show for an image, with the URL it was last uploaded to if still valid"""
+        derived = self.derivative(path, variant)
+        filename = os.path.basename(derived)
+        digest = self.source_digest(path)
+        if not filename.startswith(digest):
+            # Without Pillow the source itself is uploaded, still under a content-addressed name
+            filename = digest + os.path.splitext(filename)[1]
+        url = self._known_url(filename)
+        if url is not None:
+            self.uploads_reused += 1
+        return Attachment(derived, filename, url)
+
+    def attachment_for(self, path: str) -> Attachment:
+        """Attachment for a file that is already content-addressed, such as a rendered profile card"""
+        filename = os.path.basename(path)
+        url = self._known_url(filename)
+        if url is not None:
+            self.uploads_reused += 1
+        return Attachment(path, filename, url)
+
+    def breed_image(self, breed: str, variant: str = 'embed'):
+        """Attachment for a breed's image under images/cats, or None if it has none"""
+        path = get_breed_registry().image_of(breed)
+        if not path:
+            return None
+        try:
+            return self.attachment(path, variant)
+        except OSError as e:
+            # A missing or unreadable image must not break the message it decorates
+            logger.warning("Could not prepare %s image of %s: %s", variant, breed, e)
+            return None
+
+    def _load_urls(self):
+        try:
+            with open(self.urls_file, 'r') as f:
+                urls = json.load(f)
+        except (OSError, ValueError):
+            urls = {}
+        now = time.time()
+        return {filename: tuple(entry) for filename, entry in urls.items() if entry[1] > now}
+
+    def _known_url(self, filename: str):
+        with self._lock:
+            if self._urls is None:
+                self._urls = self._load_urls()
+            entry = self._urls.get(filename)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._urls[filename]
+                return None
+            return entry[0]
+
+    def remember_url(self, filename: str, url: str):
+        """Record the CDN URL Discord gave an uploaded derivative so later messages link to it"""
+        with self._lock:
+            if self._urls is None:
+                self._urls = self._load_urls()
+            self._urls[filename] = (url, url_expiry(url, self.url_ttl))
+            self.uploads += 1
+            urls = dict(self._urls)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.urls_file, 'w') as f:
+                json.dump(urls, f, indent=2)
+        except OSError as e:
+            logger.warning("Could not save attachment URLs to %s: %s", self.urls_file, e)
+
+    def stats(self) -> dict:
+        with self._lock:
+            known = len(self._urls) if self._urls is not None else 0
+        return {
+            'generated': self.generated,
+            'cache_hits': self.cache_hits,
+            'uploads': self.uploads,
+            'uploads_reused': self.uploads_reused,
+            'known_urls': known
+        }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_image_store() -> ImageStore:
+    """Process-wide image store, configured from the environment on first use"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ImageStore.from_env()
+    return _store
@@ -0,0 +1,151 @@
+import bisect
+import logging
+import os
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+
+logger = logging.getLogger('whiskerverse.db')
+
+# Upper bounds of the latency buckets in milliseconds; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_VALUE_LIST = re.compile(r"\((?:\s*\?\s*,)*\s*\?\s*\)(?:\s*,\s*\((?:\s*\?\s*,)*\s*\?\s*\))*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(query: str) -> str:
+    """Normalize a statement so queries differing only in literals share one key"""
+    text = _STRING_LITERAL.sub('?', query)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _PLACEHOLDER.sub('?', text)
+    text = _VALUE_LIST.sub('(?)', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles"""
+    __slots__ = ('counts', 'count', 'total_ms', 'max_ms', 'rows')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+
+    def add(self, elapsed_ms: float, rows: int):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.rows += rows
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return BUCKET_BOUNDS_MS[index] if index < len(BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> dict:
+        return {
+            'count': self.count,
+            'rows': self.rows,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': round(self.max_ms, 3)
+        }
+
+
+class QueryInstrumentation:
+    """Per-statement timing and per-fingerprint latency histograms for DatabaseManager.
+
+    Disabled by default; DatabaseManager then only checks ``enabled`` per
+    statement. When enabled, a ``sample_rate`` fraction of statements is
+    timed, logged at DEBUG (or WARNING past ``slow_query_ms``) without
+    parameters, and folded into the histograms.
+    """
+
+    def __init__(self, enabled=False, sample_rate=1.0, slow_query_ms=100.0, log_level=logging.WARNING):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+        self.statements = 0
+        self._histograms = {}
+        self._lock = threading.Lock()
+        logger.setLevel(log_level)
+
+    @classmethod
+    def from_env(cls):
+        """Build from WHISKERVERSE_QUERY_* environment variables"""
+        return cls(
+            enabled=os.getenv('WHISKERVERSE_QUERY_STATS', '0').lower() in ('1', 'true', 'yes'),
+            sample_rate=float(os.getenv('WHISKERVERSE_QUERY_SAMPLE_RATE', '1.0')),
+            slow_query_ms=float(os.getenv('WHISKERVERSE_SLOW_QUERY_MS', '100')),
+            log_level=os.getenv('WHISKERVERSE_QUERY_LOG_LEVEL', 'WARNING').upper()
+        )
+
+    def start(self):
+        """Start timing a statement, or return None if it is not sampled"""
+        self.statements += 1
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        return time.perf_counter()
+
+    def record(self, query: str, started: float, result=None, error: Exception = None):
+        """Fold one sampled statement into the histogram for its fingerprint"""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        key = fingerprint(query)
+        rows = len(result) if isinstance(result, list) else max(result or 0, 0)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.add(elapsed_ms, rows)
+
+        if error is not None:
+            logger.error("Query failed after %.2fms: %s (%s)", elapsed_ms, key, error)
+        elif elapsed_ms >= self.slow_query_ms:
+            logger.warning("Slow query %.2fms rows=%d: %s", elapsed_ms, rows, key)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query %.2fms rows=%d: %s", elapsed_ms, rows, key)
+
+    def snapshot(self) -> dict:
+        """Summaries keyed by fingerprint, most expensive first"""
+        with self._lock:
+            items = [(key, histogram.summary()) for key, histogram in self._histograms.items()]
+        items.sort(key=lambda item: item[1]['total_ms'], reverse=True)
+        return dict(items)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.statements = 0
+
+    def dump(self, limit: int = 20) -> str:
+        """Human-readable table of the most expensive fingerprints"""
+        lines = [f"{'count':>8} {'avg ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'rows':>9}  query"]
+        for key, stats in list(self.snapshot().items())[:limit]:
+            lines.append(
+                f"{stats['count']:>8} {stats['avg_ms']:>9.3f} {stats['p95_ms']:>9} "
+                f"{stats['p99_ms']:>9} {stats['rows']:>9}  {key}"
+            )
+        return '\n'.join(lines)
@@ -0,0 +1,475 @@
+import atexit
+import logging
+import os
+import random
+import threading
+from operator import neg
+from .database import DatabaseManager
+from .repositories.leaderboard_repository import LeaderboardRepository
+
+logger = logging.getLogger('whiskerverse.leaderboard')
+
+# Board name -> what a player's score on it is made of (compared in order, highest first)
+METRICS = ('level', 'coins', 'cats')
+
+MAX_LEVEL = 32
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, height):
+        self.key = key
+        self.next = [None] * height
+        # width[level]: how many positions next[level] is ahead of this node
+        self.width = [1] * height
+
+
+class RankedKeys:
+    """Indexable skip list of unique sortable keys.
+
+    Insert, remove, position-of-key and key-at-position are all O(log n)
+    on average, which is what rank and top-N lookups need.
+    """
+
+    def __init__(self, keys=(), rng=None):
+        self._head = _Node(None, MAX_LEVEL)
+        self._levels = 1  # levels in use; the head's width is only kept up to date below this
+        self._size = 0
+        self._rng = rng or random.Random()
+        if keys:
+            self._build(sorted(keys))
+
+    def __len__(self):
+        return self._size
+
+    def _height(self):
+        """1 + the number of trailing 1 bits of a random word: height h with probability 2**-h"""
+        bits = self._rng.getrandbits(MAX_LEVEL - 1)
+        return (~bits & (bits + 1)).bit_length()
+
+    def _build(self, keys):
+        """Link already sorted keys in one pass instead of inserting them one by one"""
+        last = [self._head] * MAX_LEVEL
+        last_position = [0] * MAX_LEVEL
+        for position, key in enumerate(keys, 1):
+            height = self._height()
+            self._levels = max(self._levels, height)
+            node = _Node(key, height)
+            for level in range(height):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_position[level]
+                last[level] = node
+                last_position[level] = position
+        self._size = len(keys)
+        for level in range(self._levels):
+            last[level].width[level] = self._size + 1 - last_position[level]
+
+    def _path(self, key, levels):
+        """Last node before ``key`` on each level, and its position"""
+        chain = [self._head] * levels
+        positions = [0] * levels
+        node = self._head
+        position = 0
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def insert(self, key):
+        height = self._height()
+        if height > self._levels:
+            for level in range(self._levels, height):
+                self._head.width[level] = self._size + 1
+            self._levels = height
+        chain, positions = self._path(key, self._levels)
+
+        new = _Node(key, height)
+        position = positions[0] + 1
+        for level in range(height):
+            previous = chain[level]
+            new.next[level] = previous.next[level]
+            previous.next[level] = new
+            new.width[level] = previous.width[level] - (position - positions[level]) + 1
+            previous.width[level] = position - positions[level]
+        for level in range(height, self._levels):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key):
+        chain, _ = self._path(key, self._levels)
+        target = chain[0].next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), self._levels):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def index(self, key) -> int:
+        """0-based position of ``key``; raises KeyError if it isn't present"""
+        chain, positions = self._path(key, self._levels)
+        target = chain[0].next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+        return positions[0]
+
+    def slice(self, start: int, count: int):
+        """Up to ``count`` keys from position ``start`` on"""
+        if start < 0 or start >= self._size or count <= 0:
+            return []
+        node = self._head
+        remaining = start + 1
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        keys = []
+        while node is not None and len(keys) < count:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class Leaderboard:
+    """One ranking of players by score tuple, highest first; ties go to the lower player id"""
+
+    __slots__ = ('_scores', '_ranked')
+
+    def __init__(self):
+        self._scores = {}
+        self._ranked = RankedKeys()
+
+    @staticmethod
+    def _key(player_id, score):
+        return (*map(neg, score), player_id)
+
+    def __len__(self):
+        return len(self._scores)
+
+    def __contains__(self, player_id):
+        return player_id in self._scores
+
+    def player_ids(self):
+        return list(self._scores)
+
+    def load(self, scores: dict):
+        """Replace the whole board with {player_id: score} in one sort instead of n inserts"""
+        self._scores = {player_id: tuple(score) for player_id, score in scores.items()}
+        self._ranked = RankedKeys([self._key(player_id, score) for player_id, score in self._scores.items()])
+
+    def score(self, player_id):
+        return self._scores.get(player_id)
+
+    def set(self, player_id, score) -> bool:
+        """Set a player's score; returns whether it changed"""
+        score = tuple(score)
+        old = self._scores.get(player_id)
+        if old == score:
+            return False
+        if old is not None:
+            self._ranked.remove(self._key(player_id, old))
+        self._scores[player_id] = score
+        self._ranked.insert(self._key(player_id, score))
+        return True
+
+    def remove(self, player_id) -> bool:
+        old = self._scores.pop(player_id, None)
+        if old is None:
+            return False
+        self._ranked.remove(self._key(player_id, old))
+        return True
+
+    def rank(self, player_id):
+        """1-based rank, or None if the player isn't on the board"""
+        score = self._scores.get(player_id)
+        if score is None:
+            return None
+        return self._ranked.index(self._key(player_id, score)) + 1
+
+    def top(self, limit: int = 10, offset: int = 0):
+        """[(player_id, score)] from rank ``offset + 1`` on"""
+        return [(key[-1], self._scores[key[-1]]) for key in self._ranked.slice(offset, limit)]
+
+
+_EMPTY = Leaderboard()
+
+
+class Leaderboards:
+    """Global and per-guild rankings by level, coins and collection size, held in memory.
+
+    Boards load from the database on first use. After that, saving a
+    player, creating one or catching cats updates them in place once the
+    transaction commits, so top-N and rank lookups never query: both are
+    O(log n) in the board's size. A background thread reconciles the boards
+    with the database every ``reconcile_interval`` seconds to pick up writes
+    made outside the models, such as scripts or manual fixes. Per-guild
+    boards cover the players recorded in ``guild_members``.
+    """
+
+    def __init__(self, repo: LeaderboardRepository = None, reconcile_interval: float = 300.0):
+        self.repo = repo or LeaderboardRepository()
+        self.reconcile_interval = reconcile_interval
+        self._boards = {metric: Leaderboard() for metric in METRICS}
+        self._guild_boards = {}   # guild_id -> {metric: Leaderboard}
+        self._guilds_of = {}      # player_id -> guild ids
+        self._names = {}          # player_id -> username
+        self._versions = {}       # player_id -> bumped by every in-place update
+        self._tracking = False    # in-place updates apply once a load has started
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.reconciles = 0
+        self.corrections = 0
+
+    # In-place updates, called by the models and repositories after a write
+
+    def record_player(self, player_id: int, level: int, experience: int, coins: int, username: str = None):
+        """Apply a player's saved level, experience and coins once the transaction commits"""
+        if not self._tracking or player_id is None:
+            return
+        DatabaseManager().after_commit(
+            lambda: self._apply_player(player_id, level, experience, coins, username)
+        )
+
+    def record_cats(self, player_id: int, added: int = 1):
+        """Add ``added`` (negative for removals) to a player's cat count once the transaction commits"""
+        if not self._tracking or player_id is None:
+            return
+        DatabaseManager().after_commit(lambda: self._apply_cats(player_id, added))
+
+    def _apply_player(self, player_id, level, experience, coins, username):
+        with self._lock:
+            self._versions[player_id] = self._versions.get(player_id, 0) + 1
+            if username is not None:
+                self._names[player_id] = username
+            self._set(player_id, 'level', (level, experience))
+            self._set(player_id, 'coins', (coins,))
+            if player_id not in self._boards['cats']:
+                # A new player; an existing one missed by the load is fixed by the next reconcile
+                self._set(player_id, 'cats', (0,))
+
+    def _apply_cats(self, player_id, added):
+        with self._lock:
+            score = self._boards['cats'].score(player_id)
+            if score is None:
+                # Unknown player: the next reconcile picks up their count
+                return
+            self._versions[player_id] = self._versions.get(player_id, 0) + 1
+            self._set(player_id, 'cats', (max(0, score[0] + added),))
+
+    def _set(self, player_id, metric, score) -> bool:
+        """Set a global score and mirror it to the player's guild boards"""
+        if not self._boards[metric].set(player_id, score):
+            return False
+        for guild_id in self._guilds_of.get(player_id, ()):
+            self._guild_boards[guild_id][metric].set(player_id, score)
+        return True
+
+    def _remove(self, player_id):
+        for board in self._boards.values():
+            board.remove(player_id)
+        for guild_id in self._guilds_of.pop(player_id, ()):
+            for board in self._guild_boards[guild_id].values():
+                board.remove(player_id)
+        self._names.pop(player_id, None)
+
+    def _add_member(self, guild_id, player_id) -> bool:
+        if player_id not in self._boards['level']:
+            return False
+        guilds = self._guilds_of.setdefault(player_id, set())
+        if guild_id in guilds:
+            return False
+        guilds.add(guild_id)
+        boards = self._guild_boards.get(guild_id)
+        if boards is None:
+            boards = self._guild_boards[guild_id] = {metric: Leaderboard() for metric in METRICS}
+        for metric, board in boards.items():
+            score = self._boards[metric].score(player_id)
+            if score is not None:
+                board.set(player_id, score)
+        return True
+
+    # Guild membership
+
+    def is_member(self, guild_id: int, player_id: int) -> bool:
+        """Whether the player is already on the guild's boards (memory only, never queries)"""
+        return guild_id in self._guilds_of.get(player_id, ())
+
+    def join_guild(self, guild_id: int, player_id: int) -> bool:
+        """Put a player on a guild's boards, recording it in guild_members; False if nothing changed"""
+        self._ensure_loaded()
+        with self._lock:
+            if self.is_member(guild_id, player_id) or player_id not in self._boards['level']:
+                return False
+        self.repo.add_guild_member(guild_id, player_id)
+        with self._lock:
+            return self._add_member(guild_id, player_id)
+
+    # Reads
+
+    def _board(self, metric, guild_id):
+        if metric not in self._boards:
+            raise ValueError(f"Unknown leaderboard '{metric}', expected one of {', '.join(METRICS)}")
+        if guild_id is None:
+            return self._boards[metric]
+        return self._guild_boards.get(guild_id, {}).get(metric, _EMPTY)
+
+    def top(self, metric: str, limit: int = 10, guild_id: int = None, offset: int = 0):
+        """[(rank, player_id, username, score)] for ranks ``offset + 1`` to ``offset + limit``"""
+        self._ensure_loaded()
+        with self._lock:
+            return [
+                (offset + position + 1, player_id, self._names.get(player_id), score)
+                for position, (player_id, score) in enumerate(self._board(metric, guild_id).top(limit, offset))
+            ]
+
+    def rank(self, metric: str, player_id: int, guild_id: int = None):
+        """(rank, players on the board, score) for a player, or None if they aren't on it"""
+        self._ensure_loaded()
+        with self._lock:
+            board = self._board(metric, guild_id)
+            rank = board.rank(player_id)
+            if rank is None:
+                return None
+            return rank, len(board), board.score(player_id)
+
+    # Loading and reconciliation
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            self.reconcile()
+            self._loaded = True
+        self._ensure_reconciler()
+
+    def reconcile(self) -> int:
+        """Compare every board with the database and fix what drifted; returns the number of fixes.
+
+        Players updated in place while the database was being read are
+        skipped; the next reconcile checks them.
+        """
+        with self._lock:
+            self._tracking = True
+            versions = dict(self._versions)
+        rows = self.repo.load_scores()
+        members = self.repo.load_guild_members()
+
+        with self._lock:
+            if len(self._boards['level']):
+                fixes = self._diff(rows, members, versions)
+            else:
+                # Nothing in memory yet: build the boards in one pass
+                fixes = self._load(rows, members)
+            self.reconciles += 1
+            if self._loaded:
+                self.corrections += fixes
+        return fixes
+
+    def _diff(self, rows, members, versions):
+        """Fix scores that differ from a database snapshot; returns the number of fixes"""
+        fixes = 0
+        seen = set()
+        for row in rows:
+            player_id = row['id']
+            seen.add(player_id)
+            self._names[player_id] = row['username']
+            if self._versions.get(player_id, 0) != versions.get(player_id, 0):
+                continue
+            fixes += self._set(player_id, 'level', (row['level'], row['experience']))
+            fixes += self._set(player_id, 'coins', (row['coins'],))
+            fixes += self._set(player_id, 'cats', (row['cat_count'],))
+        for player_id in self._boards['level'].player_ids():
+            if player_id not in seen and self._versions.get(player_id, 0) == versions.get(player_id, 0):
+                self._remove(player_id)
+                fixes += 1
+        for row in members:
+            self._add_member(row['guild_id'], row['player_id'])
+        return fixes
+
+    def _load(self, rows, members):
+        """Build empty boards straight from a database snapshot"""
+        scores = {metric: {} for metric in METRICS}
+        for row in rows:
+            player_id = row['id']
+            self._names[player_id] = row['username']
+            scores['level'][player_id] = (row['level'], row['experience'])
+            scores['coins'][player_id] = (row['coins'],)
+            scores['cats'][player_id] = (row['cat_count'],)
+        for metric, board in self._boards.items():
+            board.load(scores[metric])
+
+        guild_scores = {}
+        for row in members:
+            guild_id, player_id = row['guild_id'], row['player_id']
+            if player_id not in scores['level']:
+                continue
+            self._guilds_of.setdefault(player_id, set()).add(guild_id)
+            per_metric = guild_scores.setdefault(guild_id, {metric: {} for metric in METRICS})
+            for metric in METRICS:
+                per_metric[metric][player_id] = scores[metric][player_id]
+        for guild_id, per_metric in guild_scores.items():
+            boards = self._guild_boards[guild_id] = {metric: Leaderboard() for metric in METRICS}
+            for metric, board in boards.items():
+                board.load(per_metric[metric])
+        return len(rows)
+
+    def _ensure_reconciler(self):
+        if self._thread is not None or self.reconcile_interval <= 0:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._reconcile_loop, name="leaderboard-reconcile", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _reconcile_loop(self):
+        while not self._stop.wait(self.reconcile_interval):
+            try:
+                fixes = self.reconcile()
+                if fixes:
+                    logger.info("Leaderboard reconcile corrected %d scores", fixes)
+            except Exception:
+                logger.exception("Error reconciling leaderboards")
+
+    def close(self):
+        """Stop the background reconciler"""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'players': len(self._boards['level']),
+                'guilds': len(self._guild_boards),
+                'reconciles': self.reconciles,
+                'corrections': self.corrections
+            }
+
+
+_leaderboards = None
+_leaderboards_lock = threading.Lock()
+
+
+def get_leaderboards() -> Leaderboards:
+    """Process-wide leaderboards (WHISKERVERSE_LEADERBOARD_RECONCILE_INTERVAL seconds between reconciles)"""
+    global _leaderboards
+    if _leaderboards is None:
+        with _leaderboards_lock:
+            if _leaderboards is None:
+                _leaderboards = Leaderboards(
+                    reconcile_interval=float(os.getenv('WHISKERVERSE_LEADERBOARD_RECONCILE_INTERVAL', '300'))
+                )
+    return _leaderboards
@@ -0,0 +1,3 @@
+from .runner import MIGRATIONS, applied_versions, pending_migrations, run_migrations, explain_queries
+
+__all__ = ['MIGRATIONS', 'applied_versions', 'pending_migrations', 'run_migrations', 'explain_queries']
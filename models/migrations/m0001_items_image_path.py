@@ -0,0 +1,12 @@
+"""Add image_path to items (formerly scripts/migrate_items_table.py)"""
+
+VERSION = 1
+DESCRIPTION = "Add items.image_path"
+
+
+def up(db):
+    if not db.backend.column_exists(db, 'items', 'image_path'):
+        db.execute_query("""
+            ALTER TABLE items
+            ADD COLUMN image_path VARCHAR(255) DEFAULT 'images/items/eternal_scroll_of_meowgic.png'
+        """)
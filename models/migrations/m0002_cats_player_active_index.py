@@ -0,0 +1,9 @@
+"""Index the per-player cat lookups in CatRepository and ProfileRepository"""
+
+VERSION = 2
+DESCRIPTION = "Index cats on (player_id, is_active)"
+
+
+def up(db):
+    if not db.backend.index_exists(db, 'cats', 'idx_cats_player_active'):
+        db.execute_query("CREATE INDEX idx_cats_player_active ON cats (player_id, is_active)")
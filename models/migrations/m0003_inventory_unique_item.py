@@ -0,0 +1,28 @@
+"""One inventory row per (player, item) so InventoryRepository.add_item can upsert"""
+
+VERSION = 3
+DESCRIPTION = "Merge duplicate inventory rows and add a unique key on (player_id, item_id)"
+
+
+def up(db):
+    if db.backend.index_exists(db, 'inventory', 'uq_inventory_player_item'):
+        return
+
+    # Fold duplicates into the oldest row before the unique key can be created
+    duplicates = db.execute_query("""
+        SELECT player_id, item_id, MIN(id) AS keep_id, SUM(quantity) AS total
+        FROM inventory
+        GROUP BY player_id, item_id
+        HAVING COUNT(*) > 1
+    """)
+    for row in duplicates:
+        db.execute_query(
+            "UPDATE inventory SET quantity = %s WHERE id = %s",
+            (int(row['total']), row['keep_id'])
+        )
+        db.execute_query(
+            "DELETE FROM inventory WHERE player_id = %s AND item_id = %s AND id <> %s",
+            (row['player_id'], row['item_id'], row['keep_id'])
+        )
+
+    db.execute_query("CREATE UNIQUE INDEX uq_inventory_player_item ON inventory (player_id, item_id)")
@@ -0,0 +1,41 @@
+"""Track the active cat with players.active_cat_id instead of a flag on every cat row"""
+
+VERSION = 4
+DESCRIPTION = "Move the active cat to players.active_cat_id and drop cats.is_active"
+
+
+def up(db):
+    if not db.backend.column_exists(db, 'players', 'active_cat_id'):
+        if db.backend.name == 'sqlite':
+            db.execute_query(
+                "ALTER TABLE players ADD COLUMN active_cat_id INTEGER REFERENCES cats(id) ON DELETE SET NULL"
+            )
+        else:
+            db.execute_query("ALTER TABLE players ADD COLUMN active_cat_id INT NULL")
+            db.execute_query("""
+                ALTER TABLE players
+                ADD CONSTRAINT fk_players_active_cat
+                FOREIGN KEY (active_cat_id) REFERENCES cats(id) ON DELETE SET NULL
+            """)
+
+    if db.backend.column_exists(db, 'cats', 'is_active'):
+        # If a player somehow has several flagged cats, keep the oldest
+        db.execute_query("""
+            UPDATE players SET active_cat_id = (
+                SELECT MIN(c.id) FROM cats c
+                WHERE c.player_id = players.id AND c.is_active = TRUE
+            )
+            WHERE active_cat_id IS NULL
+        """)
+
+    # Build the replacement index first: MySQL may be using the old one for the player_id foreign key
+    if not db.backend.index_exists(db, 'cats', 'idx_cats_player'):
+        db.execute_query("CREATE INDEX idx_cats_player ON cats (player_id, id)")
+    if db.backend.index_exists(db, 'cats', 'idx_cats_player_active'):
+        if db.backend.name == 'sqlite':
+            db.execute_query("DROP INDEX idx_cats_player_active")
+        else:
+            db.execute_query("DROP INDEX idx_cats_player_active ON cats")
+
+    if db.backend.column_exists(db, 'cats', 'is_active'):
+        db.execute_query("ALTER TABLE cats DROP COLUMN is_active")
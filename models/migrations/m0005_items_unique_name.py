@@ -0,0 +1,31 @@
+"""One items row per name so scripts/import_items.py can upsert by name"""
+
+VERSION = 5
+DESCRIPTION = "Merge duplicate item names and add a unique key on items.name"
+
+
+def up(db):
+    if db.backend.index_exists(db, 'items', 'uq_items_name'):
+        return
+
+    # Point inventories at the oldest copy of each item before deleting the rest
+    duplicates = db.execute_query("""
+        SELECT i.id AS duplicate_id, keep.keep_id
+        FROM items i
+        JOIN (SELECT name, MIN(id) AS keep_id FROM items GROUP BY name HAVING COUNT(*) > 1) keep
+            ON keep.name = i.name AND i.id <> keep.keep_id
+    """)
+    fold = db.backend.upsert(
+        'inventory', ('player_id', 'item_id', 'quantity'),
+        conflict_columns=('player_id', 'item_id'),
+        increment_columns=('quantity',)
+    )
+    for row in duplicates:
+        for entry in db.execute_query(
+            "SELECT player_id, quantity FROM inventory WHERE item_id = %s", (row['duplicate_id'],)
+        ):
+            db.execute_query(fold, (entry['player_id'], row['keep_id'], entry['quantity']))
+        db.execute_query("DELETE FROM inventory WHERE item_id = %s", (row['duplicate_id'],))
+        db.execute_query("DELETE FROM items WHERE id = %s", (row['duplicate_id'],))
+
+    db.execute_query("CREATE UNIQUE INDEX uq_items_name ON items (name)")
@@ -0,0 +1,18 @@
+"""Remember which guilds each player plays in, for per-guild leaderboards"""
+
+VERSION = 6
+DESCRIPTION = "Add guild_members for per-guild leaderboards"
+
+
+def up(db):
+    db.execute_query("""
+        CREATE TABLE IF NOT EXISTS guild_members (
+            guild_id BIGINT NOT NULL,
+            player_id BIGINT NOT NULL,
+            last_seen TIMESTAMP NULL,
+            PRIMARY KEY (guild_id, player_id),
+            FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
+        )
+    """)
+    if not db.backend.index_exists(db, 'guild_members', 'idx_guild_members_player'):
+        db.execute_query("CREATE INDEX idx_guild_members_player ON guild_members (player_id)")
@@ -0,0 +1,42 @@
+"""Store each cat's rarity and index the columns /cats filters and sorts by"""
+
+from ..breeds import get_breed_registry
+
+VERSION = 7
+DESCRIPTION = "Add cats.rarity and indexes for filtering and sorting collections"
+
+# Every collection query is for one player, so each index leads with player_id and ends with id for keyset paging
+INDEXES = (
+    ('idx_cats_player_rarity', 'player_id, rarity, id'),
+    ('idx_cats_player_breed', 'player_id, breed, id'),
+    ('idx_cats_player_level', 'player_id, level, id'),
+    ('idx_cats_player_health', 'player_id, health, id'),
+    ('idx_cats_player_attack', 'player_id, attack, id'),
+    ('idx_cats_player_defense', 'player_id, defense, id'),
+    ('idx_cats_player_speed', 'player_id, speed, id'),
+)
+
+
+def up(db):
+    if not db.backend.column_exists(db, 'cats', 'rarity'):
+        db.execute_query("ALTER TABLE cats ADD COLUMN rarity VARCHAR(16) NOT NULL DEFAULT 'common'")
+
+        # One pass over the table: every breed that isn't common gets its rarity from the registry
+        registry = get_breed_registry()
+        rarities = [
+            (row['breed'], registry.rarity_of(row['breed']))
+            for row in db.execute_query("SELECT DISTINCT breed FROM cats")
+        ]
+        rarities = [(breed, rarity) for breed, rarity in rarities if rarity != 'common']
+        if rarities:
+            cases = ' '.join(['WHEN %s THEN %s'] * len(rarities))
+            placeholders = ', '.join(['%s'] * len(rarities))
+            params = [value for pair in rarities for value in pair] + [breed for breed, _ in rarities]
+            db.execute_query(
+                f"UPDATE cats SET rarity = CASE breed {cases} END WHERE breed IN ({placeholders})",
+                tuple(params)
+            )
+
+    for name, columns in INDEXES:
+        if not db.backend.index_exists(db, 'cats', name):
+            db.execute_query(f"CREATE INDEX {name} ON cats ({columns})")
@@ -0,0 +1,9 @@
+"""Count the updates to each cat row, so text rendered from a row can be cached until it changes"""
+
+VERSION = 8
+DESCRIPTION = "Add cats.row_version"
+
+
+def up(db):
+    if not db.backend.column_exists(db, 'cats', 'row_version'):
+        db.execute_query("ALTER TABLE cats ADD COLUMN row_version INT NOT NULL DEFAULT 0")
@@ -0,0 +1,146 @@
+from ..database import DatabaseManager
+from ..repositories.cat_repository import CatRepository
+from ..repositories.inventory_repository import InventoryRepository
+from ..repositories.timer_repository import TimerRepository
+from . import (
+    m0001_items_image_path,
+    m0002_cats_player_active_index,
+    m0003_inventory_unique_item,
+    m0004_players_active_cat,
+    m0005_items_unique_name,
+    m0006_guild_members,
+    m0007_cats_rarity,
+    m0008_cats_row_version,
+)
+
+# Every migration module defines VERSION, DESCRIPTION and up(db); add new ones here
+MIGRATIONS = sorted([
+    m0001_items_image_path,
+    m0002_cats_player_active_index,
+    m0003_inventory_unique_item,
+    m0004_players_active_cat,
+    m0005_items_unique_name,
+    m0006_guild_members,
+    m0007_cats_rarity,
+    m0008_cats_row_version,
+], key=lambda migration: migration.VERSION)
+
+# Hot repository queries whose plans are shown by --explain and --dry-run. Each entry builds its
+# SQL from the repository that runs it, so a plan can't describe a query the bot no longer sends
+# Filters of the filtered /cats page plans
+PAGE_FILTERS = {'breed': 'Alley Cat', 'rarity': 'common'}
+
+EXPLAIN_QUERIES = [
+    ("CatRepository.get_player_cats", lambda db: (CatRepository.SELECT_PLAYER_CATS, (0,))),
+    ("CatRepository.get_active_cat", lambda db: (CatRepository.SELECT_ACTIVE_CAT, (0,))),
+    # One /cats page per sort, each a range read of its (player_id, column, id) index from m0007
+    *[
+        (f"CatRepository.get_page (sort={sort})",
+         lambda db, sort=sort: CatRepository()._page_query(0, (0, 0), 5, sort, {}))
+        for sort in CatRepository.SORT_COLUMNS
+    ],
+    ("CatRepository.get_page (breed and rarity, sort=level)",
+     lambda db: CatRepository()._page_query(0, None, 5, 'level', PAGE_FILTERS)),
+    ("CatRepository.get_page_with_count (count)", lambda db: CatRepository()._count_query(0, {})),
+    ("CatRepository.get_page_with_count (breed and rarity count)",
+     lambda db: CatRepository()._count_query(0, PAGE_FILTERS)),
+    ("CatRepository.get_by_id", lambda db: (CatRepository.SELECT_CAT_BY_ID, (0,))),
+    ("InventoryRepository.get_player_items", lambda db: (InventoryRepository.SELECT_PLAYER_ITEMS, (0,))),
+    ("InventoryRepository.add_item", lambda db: (InventoryRepository.add_item_query(db.backend), (0, 0, 1))),
+    ("TimerRepository.get_timer", lambda db: (TimerRepository.SELECT_TIMER, (0, 'encounter'))),
+    ("TimerRepository.get_all_timers", lambda db: (TimerRepository.SELECT_ALL_TIMERS, (0,))),
+    ("TimerRepository.set_timer",
+     lambda db: (TimerRepository.set_timer_query(db.backend), (0, 'encounter', '1970-01-01 00:00:00'))),
+]
+
+
+def ensure_migrations_table(db):
+    db.execute_query("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT PRIMARY KEY,
+            description VARCHAR(255) NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def applied_versions(db):
+    """Versions already recorded in schema_migrations"""
+    ensure_migrations_table(db)
+    return {row['version'] for row in db.execute_query("SELECT version FROM schema_migrations")}
+
+
+def pending_migrations(db):
+    applied = applied_versions(db)
+    return [migration for migration in MIGRATIONS if migration.VERSION not in applied]
+
+
+def explain_queries(db, out=print):
+    """Print the engine's plan for each hot repository query"""
+    for label, build in EXPLAIN_QUERIES:
+        out(f"  {label}")
+        query, params = build(db)
+        try:
+            plan = db.execute_query(db.backend.explain_sql(query), params)
+        except db.backend.errors as e:
+            # e.g. the query needs a column a pending migration adds
+            out(f"    (no plan: {e})")
+            continue
+        if not plan:
+            # SQLite reports nothing for an upsert that only probes its unique key
+            out("    (no table scans or searches)")
+        for row in plan:
+            out("    " + ', '.join(f"{key}={value}" for key, value in row.items() if value is not None))
+
+
+def run_migrations(db=None, dry_run=False, explain=False, out=print):
+    """Apply pending migrations in version order and return the versions applied.
+
+    Each migration checks the schema before changing it, so running this at
+    every startup is safe. ``dry_run`` lists what would run and prints query
+    plans before and after; on engines with transactional DDL (SQLite) the
+    migrations are applied inside a transaction and rolled back, elsewhere
+    only the current plans are shown. ``explain`` prints plans around a real run.
+    """
+    db = db or DatabaseManager()
+    pending = pending_migrations(db)
+    if not pending:
+        if dry_run or explain:
+            out("Schema is up to date")
+            explain_queries(db, out)
+        return []
+
+    if dry_run or explain:
+        out("Query plans before migrating:")
+        explain_queries(db, out)
+
+    if dry_run:
+        for migration in pending:
+            out(f"Would apply {migration.VERSION:04d}: {migration.DESCRIPTION}")
+        if not db.backend.transactional_ddl:
+            out(f"The {db.backend.name} backend cannot roll back DDL; run with --explain to see plans after migrating")
+            return []
+        db.start_transaction()
+        try:
+            for migration in pending:
+                migration.up(db)
+            out("Query plans after migrating:")
+            explain_queries(db, out)
+        finally:
+            db.rollback_transaction()
+        return []
+
+    applied = []
+    for migration in pending:
+        out(f"Applying migration {migration.VERSION:04d}: {migration.DESCRIPTION}")
+        migration.up(db)
+        db.execute_query(
+            "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+            (migration.VERSION, migration.DESCRIPTION)
+        )
+        applied.append(migration.VERSION)
+
+    if explain:
+        out("Query plans after migrating:")
+        explain_queries(db, out)
+    return applied
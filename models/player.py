@@ -1,9 +1,14 @@
-from .base_model import BaseModel
+from .base_model import BaseModel, utc_now
 from .cat import Cat
+from .leaderboard import get_leaderboards
 
 class Player(BaseModel):
     table_name = 'players'
     primary_key = 'id'
+    profile_owner_field = 'id'
+    insert_defaults = {'created_at': utc_now}
+    # Columns the leaderboards rank players by
+    leaderboard_fields = {'level', 'experience', 'coins'}
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -13,8 +18,17 @@ class Player(BaseModel):
         self.experience = kwargs.get('experience', 0)
         self.coins = kwargs.get('coins', 100)
         self.current_location = kwargs.get('current_location', 'Whiskerton')
+        self.active_cat_id = kwargs.get('active_cat_id')
         self.created_at = kwargs.get('created_at')
     
+    def save(self):
+        """Save the player and move them on the leaderboards if their level or coins changed"""
+        ranked_changes = self.leaderboard_fields & self.dirty_fields().keys()
+        result = super().save()
+        if ranked_changes:
+            get_leaderboards().record_player(self.id, self.level, self.experience, self.coins, username=self.username)
+        return result
+    
     @classmethod
     def get_or_create(cls, discord_id: int, username: str):
         """Get an existing player or create a new one"""
@@ -57,7 +71,7 @@ class Player(BaseModel):
             return True, starter_cat
             
         except Exception as e:
-            self.db.end_transaction()
+            self.db.rollback_transaction()
             raise
     
     def add_experience(self, amount: int):
@@ -90,12 +104,22 @@ class Player(BaseModel):
     
     def get_cats(self):
         """Get all cats owned by the player"""
-        query = "SELECT * FROM cats WHERE player_id = %s"
+        query = """
+            SELECT c.*, CASE WHEN c.id = p.active_cat_id THEN TRUE ELSE FALSE END AS is_active
+            FROM cats c
+            JOIN players p ON p.id = c.player_id
+            WHERE c.player_id = %s
+        """
         return self.db.execute_query(query, (self.id,))
     
     def get_active_cat(self):
         """Get the player's active cat"""
-        query = "SELECT * FROM cats WHERE player_id = %s AND is_active = TRUE LIMIT 1"
+        query = """
+            SELECT c.*, TRUE AS is_active
+            FROM players p
+            JOIN cats c ON c.id = p.active_cat_id
+            WHERE p.id = %s
+        """
         results = self.db.execute_query(query, (self.id,))
         return results[0] if results else None
     
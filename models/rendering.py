@@ -0,0 +1,75 @@
+import os
+from collections import namedtuple
+from .cache import LRUCache, _MISSING
+
+RARITY_EMOJI = {
+    'common': '⚪',
+    'uncommon': '🟢',
+    'rare': '🔵',
+    'epic': '🟣',
+    'legendary': '🟡'
+}
+
+# Text shown for one cat: its /cats field title (plain and active), the /cats field
+# body, and the /profile and /encounter card bodies
+CatText = namedtuple('CatText', ['title', 'active_title', 'collection', 'profile', 'card'])
+
+
+def stat_line(cat) -> str:
+    return (
+        f"Stats: ❤️ {cat['health']} | ⚔️ {cat['attack']} | "
+        f"🛡️ {cat['defense']} | 💨 {cat['speed']}"
+    )
+
+
+def render_cat_text(cat) -> CatText:
+    """Format every piece of text the bot shows for a cat row"""
+    title = f"{RARITY_EMOJI.get(cat.get('rarity'), '⚪')} {cat['name']}"
+    card = f"Breed: {cat['breed']}\nLevel: {cat['level']}\n{stat_line(cat)}"
+    return CatText(
+        title=title,
+        active_title=f"{title} ✨ Active",
+        collection=f"ID: {cat.get('id')}\n{card}",
+        profile=f"Name: {cat['name']}\n{card}",
+        card=card
+    )
+
+
+class CatTextCache:
+    """LRU of rendered cat text keyed by (cat id, row version).
+
+    Every update to a cats row bumps its row_version, so an entry can never
+    go stale and needs no TTL or invalidation; old versions just age out.
+    Rows without an id or row_version (wild cats) are rendered every time.
+    """
+
+    def __init__(self, cache: LRUCache):
+        self.cache = cache
+
+    @classmethod
+    def from_env(cls):
+        """Build from the WHISKERVERSE_CAT_TEXT_CACHE_MAX_ENTRIES environment variable"""
+        cache = LRUCache(
+            max_entries=int(os.getenv('WHISKERVERSE_CAT_TEXT_CACHE_MAX_ENTRIES', '50000')),
+            ttl=float('inf')
+        )
+        return cls(cache)
+
+    def get(self, cat) -> CatText:
+        cat_id, version = cat.get('id'), cat.get('row_version')
+        if cat_id is None or version is None:
+            return render_cat_text(cat)
+        text = self.cache.get((cat_id, version), _MISSING)
+        if text is _MISSING:
+            text = render_cat_text(cat)
+            self.cache.put((cat_id, version), text)
+        return text
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+cat_text = CatTextCache.from_env()
@@ -1,55 +1,168 @@
 from ..database import DatabaseManager
+from ..cache import profile_cache
+from ..base_model import utc_now
+from ..breeds import get_breed_registry
+from ..leaderboard import get_leaderboards
 
 class CatRepository:
+    INSERT_COLUMNS = (
+        'player_id', 'name', 'breed', 'rarity', 'level', 'experience',
+        'health', 'attack', 'defense', 'speed', 'created_at'
+    )
+    # Columns a collection can be sorted by; each has a (player_id, column, id) index
+    SORT_COLUMNS = ('id', 'level', 'health', 'attack', 'defense', 'speed')
+    # Cat columns plus is_active, derived from the owner's players.active_cat_id
+    SELECT_CATS = """
+        SELECT c.*, CASE WHEN c.id = p.active_cat_id THEN TRUE ELSE FALSE END AS is_active
+        FROM cats c
+        LEFT JOIN players p ON p.id = c.player_id
+    """
+    SELECT_PLAYER_CATS = SELECT_CATS + " WHERE c.player_id = %s"
+    SELECT_CAT_BY_ID = SELECT_CATS + " WHERE c.id = %s"
+    SELECT_ACTIVE_CAT = """
+        SELECT c.*, TRUE AS is_active
+        FROM players p
+        JOIN cats c ON c.id = p.active_cat_id
+        WHERE p.id = %s
+    """
+    
     def __init__(self):
         self.db = DatabaseManager()
     
+    def _new_row(self, player_id: int, name: str, breed: str, stats: dict):
+        """Row for a freshly caught or created cat, with the table's defaults filled in"""
+        return {
+            'player_id': player_id,
+            'name': name,
+            'breed': breed,
+            'rarity': get_breed_registry().rarity_of(breed),
+            'level': 1,
+            'experience': 0,
+            'health': stats['health'],
+            'attack': stats['attack'],
+            'defense': stats['defense'],
+            'speed': stats['speed'],
+            'is_active': False,
+            'created_at': utc_now(),
+            'row_version': 0
+        }
+    
     def create(self, player_id: int, name: str, breed: str, stats: dict):
-        query = """
-            INSERT INTO cats (player_id, name, breed, health, attack, defense, speed, level, experience, is_active)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        row = self._new_row(player_id, name, breed, stats)
+        query = f"""
+            INSERT INTO cats ({', '.join(self.INSERT_COLUMNS)})
+            VALUES ({', '.join(['%s'] * len(self.INSERT_COLUMNS))})
         """
-        params = (
-            player_id, name, breed,
-            stats['health'], stats['attack'], stats['defense'], stats['speed'],
-            1, 0, False
+        cat_id = self.db.execute_insert(query, tuple(row[column] for column in self.INSERT_COLUMNS))
+        profile_cache.invalidate(player_id)
+        get_leaderboards().record_cats(player_id)
+        return {'id': cat_id, **row}
+    
+    def create_many(self, cats):
+        """Insert many cats (dicts with player_id, name, breed and stats) in one statement"""
+        rows = [self._new_row(cat['player_id'], cat['name'], cat['breed'], cat['stats']) for cat in cats]
+        ids = self.db.insert_many(
+            'cats', self.INSERT_COLUMNS,
+            [tuple(row[column] for column in self.INSERT_COLUMNS) for row in rows]
         )
-        self.db.execute_query(query, params)
-        # Get the last inserted cat
-        return self.get_last_created_cat(player_id)
+        added = {}
+        for row in rows:
+            added[row['player_id']] = added.get(row['player_id'], 0) + 1
+        for player_id, count in added.items():
+            profile_cache.invalidate(player_id)
+            get_leaderboards().record_cats(player_id, count)
+        return [{'id': cat_id, **row} for cat_id, row in zip(ids, rows)]
     
     def get_player_cats(self, player_id: int):
         """Get all cats owned by a player"""
-        query = "SELECT * FROM cats WHERE player_id = %s"
-        return self.db.execute_query(query, (player_id,))
+        return self.db.execute_query(self.SELECT_PLAYER_CATS, (player_id,))
     
-    def get_by_id(self, cat_id: int):
-        query = "SELECT * FROM cats WHERE id = %s"
-        results = self.db.execute_query(query, (cat_id,))
-        return results[0] if results else None
+    def _collection_filter(self, player_id, breed=None, rarity=None, min_level=None, max_level=None):
+        """WHERE conditions and params selecting a player's cats that match the filters"""
+        conditions = ["c.player_id = %s"]
+        params = [player_id]
+        if breed is not None:
+            conditions.append("c.breed = %s")
+            params.append(breed)
+        if rarity is not None:
+            conditions.append("c.rarity = %s")
+            params.append(rarity)
+        if min_level is not None:
+            conditions.append("c.level >= %s")
+            params.append(min_level)
+        if max_level is not None:
+            conditions.append("c.level <= %s")
+            params.append(max_level)
+        return conditions, params
+    
+    def _page_query(self, player_id, after, limit, sort, filters):
+        if sort not in self.SORT_COLUMNS:
+            raise ValueError(f"Can't sort cats by '{sort}', expected one of {', '.join(self.SORT_COLUMNS)}")
+        conditions, params = self._collection_filter(player_id, **filters)
+        if sort == 'id':
+            # Oldest first
+            if after is not None:
+                conditions.append("c.id > %s")
+                params.append(after[-1])
+            order = "c.id"
+        else:
+            # Highest first, ties newest first; ``after`` is the (value, id) of the last cat shown
+            if after is not None:
+                value, cat_id = after
+                # The redundant c.{sort} <= bound lets both engines seek into the index instead of scanning
+                conditions.append(f"c.{sort} <= %s AND (c.{sort} < %s OR (c.{sort} = %s AND c.id < %s))")
+                params += [value, value, value, cat_id]
+            order = f"c.{sort} DESC, c.id DESC"
+        query = self.SELECT_CATS + f" WHERE {' AND '.join(conditions)} ORDER BY {order} LIMIT %s"
+        return query, tuple(params) + (limit + 1,)
     
-    def get_last_created_cat(self, player_id: int):
-        query = "SELECT * FROM cats WHERE player_id = %s ORDER BY id DESC LIMIT 1"
-        results = self.db.execute_query(query, (player_id,))
+    def _count_query(self, player_id, filters):
+        conditions, params = self._collection_filter(player_id, **filters)
+        return f"SELECT COUNT(*) AS cat_count FROM cats c WHERE {' AND '.join(conditions)}", tuple(params)
+    
+    def get_page(self, player_id: int, after=None, limit: int = 5, sort: str = 'id', **filters):
+        """Up to ``limit`` of a player's cats after the ``after`` cursor, in ``sort`` order.
+        
+        Keyset pagination: ``after`` is the (sort value, id) of the last cat
+        on the previous page, so every page is one range read of the
+        (player_id, sort column, id) index however many cats come before it.
+        ``filters`` are breed, rarity, min_level and max_level. Returns
+        (cats, has_more).
+        """
+        query, params = self._page_query(player_id, after, limit, sort, filters)
+        rows = self.db.execute_query(query, params)
+        return rows[:limit], len(rows) > limit
+    
+    def get_page_with_count(self, player_id: int, limit: int = 5, sort: str = 'id', **filters):
+        """The first page plus how many cats match the filters, in one round trip"""
+        rows, count_rows = self.db.execute_batch([
+            self._page_query(player_id, None, limit, sort, filters),
+            self._count_query(player_id, filters)
+        ])
+        return rows[:limit], len(rows) > limit, int(count_rows[0]['cat_count'])
+    
+    def get_by_id(self, cat_id: int):
+        results = self.db.execute_query(self.SELECT_CAT_BY_ID, (cat_id,))
         return results[0] if results else None
     
     def get_active_cat(self, player_id: int):
-        query = "SELECT * FROM cats WHERE player_id = %s AND is_active = TRUE LIMIT 1"
-        results = self.db.execute_query(query, (player_id,))
+        results = self.db.execute_query(self.SELECT_ACTIVE_CAT, (player_id,))
         return results[0] if results else None
     
     def update_name(self, cat_id: int, player_id: int, new_name: str):
-        query = "UPDATE cats SET name = %s WHERE id = %s AND player_id = %s"
-        return self.db.execute_query(query, (new_name, cat_id, player_id))
+        query = "UPDATE cats SET name = %s, row_version = row_version + 1 WHERE id = %s AND player_id = %s"
+        result = self.db.execute_query(query, (new_name, cat_id, player_id))
+        profile_cache.invalidate(player_id)
+        return result
 
     def set_active(self, cat_id: int, player_id: int):
-        # First deactivate all cats for this player
-        self.db.execute_query(
-            "UPDATE cats SET is_active = FALSE WHERE player_id = %s",
-            (player_id,)
+        """Point the player's active cat at ``cat_id`` if they own it; returns the rows updated"""
+        result = self.db.execute_query(
+            """
+            UPDATE players SET active_cat_id = %s
+            WHERE id = %s AND EXISTS (SELECT 1 FROM cats WHERE id = %s AND player_id = %s)
+            """,
+            (cat_id, player_id, cat_id, player_id)
         )
-        # Then activate the selected cat
-        self.db.execute_query(
-            "UPDATE cats SET is_active = TRUE WHERE id = %s AND player_id = %s",
-            (cat_id, player_id)
-        ) 
\ No newline at end of file
+        profile_cache.invalidate(player_id)
+        return result
@@ -1,22 +1,30 @@
 from ..database import DatabaseManager
+from ..cache import profile_cache
 
 class InventoryRepository:
+    SELECT_PLAYER_ITEMS = """
+        SELECT i.*, inv.quantity 
+        FROM inventory inv 
+        JOIN items i ON inv.item_id = i.id 
+        WHERE inv.player_id = %s
+    """
+    
     def __init__(self):
         self.db = DatabaseManager()
     
     def get_player_items(self, player_id: int):
-        query = """
-            SELECT i.*, inv.quantity 
-            FROM inventory inv 
-            JOIN items i ON inv.item_id = i.id 
-            WHERE inv.player_id = %s
-        """
-        return self.db.execute_query(query, (player_id,))
+        return self.db.execute_query(self.SELECT_PLAYER_ITEMS, (player_id,))
+    
+    @staticmethod
+    def add_item_query(backend):
+        """Upsert adding (player_id, item_id, quantity) to a stack; relies on uq_inventory_player_item (migration 0003)"""
+        return backend.upsert(
+            'inventory', ('player_id', 'item_id', 'quantity'),
+            conflict_columns=('player_id', 'item_id'),
+            increment_columns=('quantity',)
+        )
     
     def add_item(self, player_id: int, item_id: int, quantity: int = 1):
-        query = """
-            INSERT INTO inventory (player_id, item_id, quantity)
-            VALUES (%s, %s, %s)
-            ON DUPLICATE KEY UPDATE quantity = quantity + VALUES(quantity)
-        """
-        return self.db.execute_query(query, (player_id, item_id, quantity)) 
\ No newline at end of file
+        result = self.db.execute_query(self.add_item_query(self.db.backend), (player_id, item_id, quantity))
+        profile_cache.invalidate(player_id)
+        return result
\ No newline at end of file
@@ -0,0 +1,28 @@
+from ..database import DatabaseManager
+from ..base_model import utc_now
+
+class LeaderboardRepository:
+    def __init__(self):
+        self.db = DatabaseManager()
+
+    def load_scores(self):
+        """Every player's username, level, experience, coins and number of cats"""
+        query = """
+            SELECT p.id, p.username, p.level, p.experience, p.coins, COUNT(c.id) AS cat_count
+            FROM players p
+            LEFT JOIN cats c ON c.player_id = p.id
+            GROUP BY p.id, p.username, p.level, p.experience, p.coins
+        """
+        return self.db.execute_query(query)
+
+    def load_guild_members(self):
+        return self.db.execute_query("SELECT guild_id, player_id FROM guild_members")
+
+    def add_guild_member(self, guild_id: int, player_id: int):
+        """Record that a player plays in a guild (refreshes last_seen if already recorded)"""
+        query = self.db.backend.upsert(
+            'guild_members', ('guild_id', 'player_id', 'last_seen'),
+            conflict_columns=('guild_id', 'player_id'),
+            update_columns=('last_seen',)
+        )
+        return self.db.execute_query(query, (guild_id, player_id, utc_now()))
@@ -1,4 +1,7 @@
 from ..database import DatabaseManager
+from ..cache import profile_cache
+from ..base_model import utc_now
+from ..leaderboard import get_leaderboards
 
 class PlayerRepository:
     def __init__(self):
@@ -10,12 +13,23 @@ class PlayerRepository:
         return results[0] if results else None
     
     def create(self, player_id: int, username: str):
+        player = {
+            'id': player_id,
+            'username': username,
+            'level': 1,
+            'experience': 0,
+            'coins': 100,
+            'current_location': 'Whiskerton',
+            'created_at': utc_now()
+        }
         query = """
-            INSERT INTO players (id, username, level, experience, coins, current_location)
-            VALUES (%s, %s, %s, %s, %s, %s)
+            INSERT INTO players (id, username, level, experience, coins, current_location, created_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
         """
-        self.db.execute_query(query, (player_id, username, 1, 0, 100, 'Whiskerton'))
-        return self.get_by_id(player_id)
+        self.db.execute_query(query, tuple(player.values()))
+        profile_cache.invalidate(player_id)
+        get_leaderboards().record_player(player_id, player['level'], player['experience'], player['coins'], username=username)
+        return player
     
     def get_cats(self, player_id: int):
         query = "SELECT * FROM cats WHERE player_id = %s"
@@ -0,0 +1,46 @@
+from ..database import DatabaseManager
+from .cat_repository import CatRepository
+
+class ProfileRepository:
+    """Loads everything a profile view needs in a single round trip"""
+
+    def __init__(self):
+        self.db = DatabaseManager()
+    
+    def load_profile(self, player_id: int, full: bool = True):
+        """Fetch the player, active cat and either full collections or just their counts"""
+        statements = [
+            ("SELECT * FROM players WHERE id = %s", (player_id,)),
+            ("""
+                SELECT c.*, TRUE AS is_active
+                FROM players p
+                JOIN cats c ON c.id = p.active_cat_id
+                WHERE p.id = %s
+            """, (player_id,)),
+            ("SELECT COUNT(*) AS cat_count FROM cats WHERE player_id = %s", (player_id,)),
+            ("SELECT COALESCE(SUM(quantity), 0) AS item_count FROM inventory WHERE player_id = %s", (player_id,))
+        ]
+        if full:
+            statements += [
+                (CatRepository.SELECT_CATS + " WHERE c.player_id = %s", (player_id,)),
+                ("""
+                    SELECT i.*, inv.quantity 
+                    FROM inventory inv 
+                    JOIN items i ON inv.item_id = i.id 
+                    WHERE inv.player_id = %s
+                """, (player_id,))
+            ]
+        
+        results = self.db.execute_batch(statements)
+        player_rows, active_rows, cat_count_rows, item_count_rows = results[:4]
+        if not player_rows:
+            return None
+        
+        return {
+            'player': player_rows[0],
+            'active_cat': active_rows[0] if active_rows else None,
+            'cats': results[4] if full else None,
+            'inventory': results[5] if full else None,
+            'cat_count': int(cat_count_rows[0]['cat_count']),
+            'item_count': int(item_count_rows[0]['item_count'])
+        }
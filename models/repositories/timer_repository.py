@@ -1,23 +1,44 @@
 from ..database import DatabaseManager
 
 class TimerRepository:
+    SELECT_TIMER = "SELECT * FROM timers WHERE player_id = %s AND action = %s"
+    SELECT_ALL_TIMERS = "SELECT * FROM timers WHERE player_id = %s"
+    
     def __init__(self):
         self.db = DatabaseManager()
     
+    @staticmethod
+    def set_timer_query(backend):
+        """Upsert of one (player_id, action, next_available) timer"""
+        return backend.upsert(
+            'timers', ('player_id', 'action', 'next_available'),
+            conflict_columns=('player_id', 'action'),
+            update_columns=('next_available',)
+        )
+    
     def get_timer(self, player_id: int, action: str):
         """Get a timer record for a player and action"""
-        query = "SELECT * FROM timers WHERE player_id = %s AND action = %s"
-        results = self.db.execute_query(query, (player_id, action))
+        results = self.db.execute_query(self.SELECT_TIMER, (player_id, action))
         return results[0] if results else None
     
     def set_timer(self, player_id: int, action: str, next_available):
         """Set or update a timer for a player and action"""
-        query = """
-            INSERT INTO timers (player_id, action, next_available) 
-            VALUES (%s, %s, %s) 
-            ON DUPLICATE KEY UPDATE next_available = %s
-        """
-        return self.db.execute_query(query, (player_id, action, next_available, next_available))
+        query = self.set_timer_query(self.db.backend)
+        return self.db.execute_query(query, (player_id, action, next_available))
+    
+    def set_timers(self, timers):
+        """Upsert many (player_id, action, next_available) rows in one batch"""
+        if not timers:
+            return 0
+        query = self.set_timer_query(self.db.backend)
+        return self.db.execute_many(query, timers)
+    
+    def delete_timers(self, keys):
+        """Delete many (player_id, action) timers in one batch"""
+        if not keys:
+            return 0
+        query = "DELETE FROM timers WHERE player_id = %s AND action = %s"
+        return self.db.execute_many(query, keys)
     
     def delete_timer(self, player_id: int, action: str):
         """Delete a timer for a player and action"""
@@ -26,8 +47,7 @@ class TimerRepository:
     
     def get_all_timers(self, player_id: int):
         """Get all timers for a player"""
-        query = "SELECT * FROM timers WHERE player_id = %s"
-        return self.db.execute_query(query, (player_id,))
+        return self.db.execute_query(self.SELECT_ALL_TIMERS, (player_id,))
     
     def reset_all_timers(self):
         """Reset all timers for all players by setting next_available to a past timestamp (admin function)"""
@@ -0,0 +1,129 @@
+import asyncio
+import functools
+import inspect
+import os
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+# Parameter names that identify the player a service call acts on
+PLAYER_KEYS = ('player_id', 'discord_id')
+
+_executor = None
+
+
+def async_services_enabled() -> bool:
+    """Whether cogs should run service calls off the event loop (WHISKERVERSE_ASYNC_SERVICES)"""
+    return os.getenv('WHISKERVERSE_ASYNC_SERVICES', '1').lower() not in ('0', 'false', 'no')
+
+
+def get_executor():
+    """Shared, bounded executor for blocking database work"""
+    global _executor
+    if _executor is None:
+        # Default to the DB pool size so workers never queue on connection checkout
+        workers = int(os.getenv('WHISKERVERSE_DB_WORKERS', os.getenv('MYSQL_POOL_SIZE', '5')))
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='whiskerverse-db')
+    return _executor
+
+
+def shutdown_executor():
+    """Wait for in-flight service calls and stop the worker threads"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+class PlayerLocks:
+    """Per-player asyncio locks that are dropped once nobody is waiting on them"""
+
+    def __init__(self):
+        self._locks = {}
+        self._waiters = {}
+
+    @asynccontextmanager
+    async def lock(self, key):
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._waiters[key] -= 1
+            if self._waiters[key] == 0:
+                del self._waiters[key]
+                del self._locks[key]
+
+
+_player_locks = PlayerLocks()
+
+
+class AsyncService:
+    """Awaitable facade over a synchronous service.
+
+    Every public method of the wrapped service becomes a coroutine that runs
+    on the shared bounded executor. Calls that target the same player are
+    serialized so one player's writes never interleave; different players
+    run concurrently. When disabled, calls run inline on the event loop.
+    """
+
+    def __init__(self, service, enabled: bool = None, executor=None, locks: PlayerLocks = None):
+        self._service = service
+        self._enabled = async_services_enabled() if enabled is None else enabled
+        self._executor = executor
+        self._locks = locks or _player_locks
+        self._wrappers = {}
+
+    @property
+    def service(self):
+        """The wrapped synchronous service"""
+        return self._service
+
+    def __getattr__(self, name):
+        attr = getattr(self._service, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        wrapper = self._wrappers.get(name)
+        if wrapper is None:
+            wrapper = self._wrappers[name] = self._wrap(attr)
+        return wrapper
+
+    def _wrap(self, method):
+        player_param = self._player_param(method)
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            if not self._enabled:
+                return method(*args, **kwargs)
+
+            loop = asyncio.get_running_loop()
+            executor = self._executor or get_executor()
+            work = functools.partial(method, *args, **kwargs)
+            key = player_param(args, kwargs) if player_param else None
+            if key is None:
+                return await loop.run_in_executor(executor, work)
+            async with self._locks.lock(key):
+                return await loop.run_in_executor(executor, work)
+
+        return call
+
+    @staticmethod
+    def _player_param(method):
+        """Build a function that pulls the player id out of a call's arguments"""
+        try:
+            params = list(inspect.signature(method).parameters)
+        except (TypeError, ValueError):
+            return None
+        for name in PLAYER_KEYS:
+            if name in params:
+                index = params.index(name)
+
+                def extract(args, kwargs, name=name, index=index):
+                    if name in kwargs:
+                        return kwargs[name]
+                    return args[index] if index < len(args) else None
+
+                return extract
+        return None
@@ -1,80 +1,31 @@
 from ..repositories.cat_repository import CatRepository
-import random
+from ..breeds import get_breed_registry
+from ..encounters import EncounterGenerator, get_encounter_generator
+from ..battle import resolve_battle
 
 class CatService:
-    def __init__(self):
+    def __init__(self, encounters: EncounterGenerator = None):
         self.cat_repo = CatRepository()
-        
-        # Define breed pools by rarity
-        self.RARITY_WEIGHTS = {
-            'common': [
-                'Tabby', 'Domestic Shorthair', 'Domestic Longhair',
-                'Mixed Breed', 'Alley Cat'
-            ],
-            'uncommon': [
-                'Siamese', 'Persian', 'Maine Coon', 'Russian Blue',
-                'American Shorthair'
-            ],
-            'rare': [
-                'Bengal', 'Sphynx', 'Scottish Fold', 'British Shorthair',
-                'Ragdoll'
-            ],
-            'epic': [
-                'Mystic Shadowpaw', 'Celestial Whisker', 'Astral Prowler',
-                'Ethereal Purrer', 'Void Walker'
-            ],
-            'legendary': [
-                'Ancient Mau', 'Spectral Tiger', 'Phoenix Cat',
-                'Dragon Kitten', 'Cosmic Feline'
-            ]
-        }
-        
-        # Define base stats by rarity
-        self.BASE_STATS = {
-            'common': {'min': 8, 'max': 12},
-            'uncommon': {'min': 10, 'max': 15},
-            'rare': {'min': 12, 'max': 18},
-            'epic': {'min': 15, 'max': 22},
-            'legendary': {'min': 18, 'max': 25}
-        }
+        # Breed pools, rarities and base stats all come from data/Whiskerverse_Cats_List.csv
+        self.breeds = get_breed_registry()
+        # Precomputed alias tables per rarity profile and location (configs/encounters_config.json)
+        self.encounters = encounters or get_encounter_generator()
     
-    def get_random_breed(self, rarity=None):
-        """Get a random breed, optionally from a specific rarity tier"""
-        if not rarity:
-            # Choose rarity based on weights
-            weights = {
-                'common': 0.5,
-                'uncommon': 0.25,
-                'rare': 0.15,
-                'epic': 0.08,
-                'legendary': 0.02
-            }
-            rarity = random.choices(
-                list(weights.keys()),
-                weights=list(weights.values())
-            )[0]
-        
-        return random.choice(self.RARITY_WEIGHTS[rarity])
+    def get_random_breed(self, rarity=None, location=None):
+        """Get a random breed, from a specific rarity tier or weighted for a location"""
+        return self.encounters.sample_breed(location=location, rarity=rarity)
+    
+    def get_rarity(self, breed):
+        """Rarity of a breed (a dict lookup; unknown breeds count as common)"""
+        return self.breeds.rarity_of(breed)
     
     def generate_stats(self, breed):
-        """Generate random stats based on breed rarity"""
-        # Find rarity of the breed
-        rarity = next(
-            rarity for rarity, breeds in self.RARITY_WEIGHTS.items()
-            if breed in breeds
-        )
-        
-        stat_range = self.BASE_STATS[rarity]
-        return {
-            'health': random.randint(stat_range['min'], stat_range['max']),
-            'attack': random.randint(stat_range['min'], stat_range['max']),
-            'defense': random.randint(stat_range['min'], stat_range['max']),
-            'speed': random.randint(stat_range['min'], stat_range['max'])
-        }
+        """Generate stats from the breed's base stats (±10%)"""
+        return self.breeds.roll_stats(breed, rng=self.encounters.rng)
     
-    def generate_random(self, player_id=None, name=None):
-        """Generate a random cat with random breed and stats"""
-        breed = self.get_random_breed()
+    def generate_random(self, player_id=None, name=None, location=None):
+        """Generate a random cat with random breed and stats, weighted for the location"""
+        breed = self.get_random_breed(location=location)
         stats = self.generate_stats(breed)
         
         cat_data = {
@@ -92,6 +43,10 @@ class CatService:
         
         return cat_data
     
+    def battle(self, cat, opponent):
+        """Fight two cats (Cat instances or cat rows); returns a BattleResult, nothing is saved"""
+        return resolve_battle(cat, opponent, rng=self.encounters.rng)
+    
     def save_cat(self, cat_data):
         """Save a cat to the database"""
         return self.cat_repo.create(
@@ -106,6 +61,40 @@ class CatService:
             }
         )
     
+    def save_cats(self, cats_data):
+        """Save several cats with a single INSERT and return them with their ids"""
+        return self.cat_repo.create_many([
+            {
+                'player_id': cat_data['player_id'],
+                'name': cat_data['name'],
+                'breed': cat_data['breed'],
+                'stats': {
+                    'health': cat_data['health'],
+                    'attack': cat_data['attack'],
+                    'defense': cat_data['defense'],
+                    'speed': cat_data['speed']
+                }
+            }
+            for cat_data in cats_data
+        ])
+    
+    def get_cat_page(self, player_id: int, after=None, per_page: int = 5, sort: str = 'id',
+                     with_count: bool = False, **filters):
+        """One page of a player's collection, filtered and sorted in the database.
+        
+        ``filters`` are breed, rarity, min_level and max_level. Pass the previous
+        page's ``next_after`` as ``after`` to get the next page. With
+        ``with_count`` the page also carries ``count``, the number of matching cats.
+        """
+        page = {}
+        if with_count:
+            cats, has_more, page['count'] = self.cat_repo.get_page_with_count(player_id, per_page, sort, **filters)
+        else:
+            cats, has_more = self.cat_repo.get_page(player_id, after, per_page, sort, **filters)
+        page['cats'] = cats
+        page['next_after'] = (cats[-1][sort], cats[-1]['id']) if has_more else None
+        return page
+    
     def switch_active_cat(self, cat_id: int, player_id: int):
         """Switch the player's active cat"""
         # Verify cat exists and belongs to player
@@ -115,7 +104,7 @@ class CatService:
         if cat['player_id'] != player_id:
             return False, "This cat doesn't belong to you"
         
-        # Set as active
+        # Set as active (a single-row update of players.active_cat_id)
         self.cat_repo.set_active(cat_id, player_id)
         return True, f"{cat['name']} is now your active cat!"
     
@@ -0,0 +1,41 @@
+from ..cards import get_card_renderer
+from ..config import TimersConfig
+from ..encounters import get_encounter_generator
+from ..images import get_image_store
+from ..leaderboard import get_leaderboards
+from ..rendering import cat_text
+from .async_service import AsyncService
+from .cat_service import CatService
+from .player_service import PlayerService
+from .timer_service import TimerService
+
+
+class ServiceContainer:
+    """The bot's services, built once in setup_hook and shared by every cog.
+
+    The synchronous services share their repositories. Cogs use the
+    ``AsyncService`` wrappers (``cat_service``, ``player_service``,
+    ``timer_service``, ``leaderboard_service`` and ``image_service``),
+    ``config`` is the hot-reloaded timers config, ``encounters`` draws wild
+    cats, ``cat_text`` memoizes the text embeds show for each cat and
+    ``cards`` renders /profile cards in worker processes (already async).
+    """
+
+    def __init__(self, config: TimersConfig = None):
+        self.config = config or TimersConfig()
+        self.encounters = get_encounter_generator()
+        self.cats = CatService(encounters=self.encounters)
+        self.players = PlayerService(cat_service=self.cats)
+        self.timers = TimerService()
+        self.leaderboards = get_leaderboards()
+        self.cat_text = cat_text
+        self.images = get_image_store()
+        self.cards = get_card_renderer()
+
+        # Service calls hit the database, so cogs run them off the event loop
+        self.cat_service = AsyncService(self.cats)
+        self.player_service = AsyncService(self.players)
+        self.timer_service = AsyncService(self.timers)
+        self.leaderboard_service = AsyncService(self.leaderboards)
+        # Image derivatives are resized and hashed on first use, which is too slow for the event loop
+        self.image_service = AsyncService(self.images)
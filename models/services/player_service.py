@@ -1,14 +1,17 @@
 from ..repositories.player_repository import PlayerRepository
-from ..repositories.cat_repository import CatRepository
 from ..repositories.inventory_repository import InventoryRepository
+from ..repositories.profile_repository import ProfileRepository
+from ..cache import profile_cache
 from .cat_service import CatService
 
 class PlayerService:
-    def __init__(self):
+    def __init__(self, cat_service: CatService = None):
         self.player_repo = PlayerRepository()
-        self.cat_repo = CatRepository()
         self.inventory_repo = InventoryRepository()
-        self.cat_service = CatService()
+        self.profile_repo = ProfileRepository()
+        # Share the cat service (and its repository) when one already exists
+        self.cat_service = cat_service or CatService()
+        self.cat_repo = self.cat_service.cat_repo
         self.db = self.player_repo.db
     
     def get_or_create_player(self, discord_id: int, username: str):
@@ -50,22 +53,16 @@ class PlayerService:
             return True, "Adventure started!", cat
             
         except Exception as e:
-            self.db.end_transaction()
+            self.db.rollback_transaction()
             raise
     
-    def get_profile(self, discord_id: int):
-        """Get complete player profile including cats and inventory"""
-        player = self.player_repo.get_by_id(discord_id)
-        if not player:
-            return None
-        
-        active_cat = self.cat_repo.get_active_cat(discord_id)
-        cats = self.cat_repo.get_player_cats(discord_id)
-        inventory = self.inventory_repo.get_player_items(discord_id)
+    def get_profile(self, discord_id: int, full: bool = True):
+        """Get complete player profile including cats and inventory.
         
-        return {
-            'player': player,
-            'active_cat': active_cat,
-            'cats': cats,
-            'inventory': inventory
-        } 
\ No newline at end of file
+        With ``full=False`` only the player, active cat and the cat/item counts
+        are loaded; ``cats`` and ``inventory`` are None.
+        """
+        return profile_cache.get_profile(
+            discord_id, full,
+            lambda: self.profile_repo.load_profile(discord_id, full=full)
+        )
\ No newline at end of file
@@ -1,59 +1,47 @@
 from ..repositories.timer_repository import TimerRepository
-import datetime
+from ..cooldown_store import get_cooldown_store, from_epoch
+import time
 
 class TimerService:
     def __init__(self):
         self.timer_repo = TimerRepository()
+        # Cooldowns are checked in memory and written back to the timers table in batches
+        self.cooldowns = get_cooldown_store()
     
     def is_available(self, player_id: int, action: str) -> bool:
         """Check if an action is available for a player"""
-        timer = self.timer_repo.get_timer(player_id, action)
-        if not timer:
-            return True
-        
-        now = datetime.datetime.utcnow()
-        return now >= timer['next_available']
+        expires = self.cooldowns.expires_at(player_id, action)
+        return expires is None or time.time() >= expires
     
     def get_seconds_remaining(self, player_id: int, action: str) -> int:
         """Get the number of seconds remaining until the action is available again"""
-        timer = self.timer_repo.get_timer(player_id, action)
-        if not timer:
-            return 0
-        
-        now = datetime.datetime.utcnow()
-        if now >= timer['next_available']:
-            return 0
-        
-        time_diff = timer['next_available'] - now
-        return int(time_diff.total_seconds())
+        return int(self.cooldowns.remaining(player_id, action))
     
     def set_cooldown(self, player_id: int, action: str, seconds: int):
         """Set a cooldown for a player action"""
-        next_available = datetime.datetime.utcnow() + datetime.timedelta(seconds=seconds)
-        self.timer_repo.set_timer(player_id, action, next_available)
-        return next_available
+        expires = time.time() + seconds
+        self.cooldowns.set(player_id, action, expires)
+        return from_epoch(expires)
     
     def clear_timer(self, player_id: int, action: str):
         """Clear a timer for a player action"""
-        return self.timer_repo.delete_timer(player_id, action)
+        return self.cooldowns.delete(player_id, action)
     
     def get_all_timers(self, player_id: int):
         """Get all active timers for a player"""
-        timers = self.timer_repo.get_all_timers(player_id)
-        now = datetime.datetime.utcnow()
+        now = time.time()
         
         active_timers = []
-        for timer in timers:
-            if timer['next_available'] > now:
-                seconds_remaining = int((timer['next_available'] - now).total_seconds())
+        for action, expires in self.cooldowns.player_timers(player_id):
+            if expires > now:
                 active_timers.append({
-                    'action': timer['action'],
-                    'seconds_remaining': seconds_remaining,
-                    'next_available': timer['next_available']
+                    'action': action,
+                    'seconds_remaining': int(expires - now),
+                    'next_available': from_epoch(expires)
                 })
         
         return active_timers
     
     def reset_all_timers(self):
         """Reset all timers for all players (admin function)"""
-        return self.timer_repo.reset_all_timers()
\ No newline at end of file
+        return self.cooldowns.reset_all()
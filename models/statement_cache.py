@@ -0,0 +1,85 @@
+import threading
+from collections import Counter, OrderedDict
+
+
+class StatementCacheStats:
+    """Hit/miss counters shared by every connection's statement cache"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.hits_by_query = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, query: str, hit: bool, evicted: int = 0):
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.hits_by_query[query] += 1
+            else:
+                self.misses += 1
+            self.evictions += evicted
+
+    def report(self, top: int = 10) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'top_queries': [
+                    {'query': ' '.join(query.split()), 'hits': hits}
+                    for query, hits in self.hits_by_query.most_common(top)
+                ]
+            }
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+            self.hits_by_query.clear()
+
+
+class StatementCache:
+    """LRU of prepared statements for one connection, keyed by query text.
+
+    ``factory(query)`` prepares a statement on a miss and ``on_evict`` is
+    called with statements that fall out of the cache so the backend can
+    deallocate them.
+    """
+
+    def __init__(self, capacity: int, stats: StatementCacheStats, factory, on_evict=None):
+        self.capacity = capacity
+        self._stats = stats
+        self._factory = factory
+        self._on_evict = on_evict
+        self._entries = OrderedDict()
+
+    def get(self, query: str):
+        statement = self._entries.get(query)
+        if statement is not None:
+            self._entries.move_to_end(query)
+            self._stats.record(query, hit=True)
+            return statement
+
+        statement = self._factory(query)
+        self._entries[query] = statement
+        evicted = 0
+        while len(self._entries) > self.capacity:
+            _, old = self._entries.popitem(last=False)
+            evicted += 1
+            if self._on_evict:
+                self._on_evict(old)
+        self._stats.record(query, hit=False, evicted=evicted)
+        return statement
+
+    def clear(self):
+        entries = list(self._entries.values())
+        self._entries.clear()
+        if self._on_evict:
+            for statement in entries:
+                self._on_evict(statement)
+
+    def __len__(self):
+        return len(self._entries)
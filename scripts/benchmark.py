@@ -0,0 +1,337 @@
+import argparse
+import datetime
+import json
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the parent directory to the Python path so we can import our models
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.backends import BACKENDS, get_backend
+from models.base_model import utc_now
+from models.cache import profile_cache
+from models.cooldown_store import CooldownStore
+from models.database import initialize_database, DatabaseManager
+from models.rendering import cat_text
+from models.services.cat_service import CatService
+from models.services.player_service import PlayerService
+from models.services.timer_service import TimerService
+
+# Benchmark players get ids in [PLAYER_ID_BASE, COLLECTOR_ID]. Real Discord snowflakes are
+# above 10^16, so no real player is ever in that block, and only that block is ever deleted
+PLAYER_ID_BASE = 10 ** 12
+# Owner of the --collection-size cats, clear of the ids start_adventure hands out
+COLLECTOR_ID = PLAYER_ID_BASE + 10 ** 9
+
+ITEM_TYPES = ('weapon', 'armor', 'potion', 'material', 'misc')
+ITEM_RARITIES = ('common', 'uncommon', 'rare', 'epic', 'legendary')
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(rank, 1)) - 1]
+
+def measure(name, operation, iterations, warmup, setup=None):
+    """Time ``operation(i)`` and count its queries; ``setup(i)`` runs untimed before each call"""
+    instrumentation = DatabaseManager().instrumentation
+    for i in range(warmup):
+        if setup:
+            setup(i)
+        operation(i)
+
+    timings = []
+    queries = 0
+    for i in range(warmup, warmup + iterations):
+        if setup:
+            setup(i)
+        before = instrumentation.statements
+        started = time.perf_counter()
+        operation(i)
+        timings.append(time.perf_counter() - started)
+        queries += instrumentation.statements - before
+
+    timings.sort()
+    total = sum(timings)
+    result = {
+        'iterations': iterations,
+        'p50_ms': round(percentile(timings, 0.50) * 1000, 4),
+        'p95_ms': round(percentile(timings, 0.95) * 1000, 4),
+        'p99_ms': round(percentile(timings, 0.99) * 1000, 4),
+        'mean_ms': round(total / iterations * 1000, 4),
+        'max_ms': round(timings[-1] * 1000, 4),
+        'queries_per_op': round(queries / iterations, 2),
+        'ops_per_sec': round(iterations / total, 1) if total else 0.0
+    }
+    print(
+        f"{name:<28} p50 {result['p50_ms']:>9.3f}ms  p95 {result['p95_ms']:>9.3f}ms  "
+        f"p99 {result['p99_ms']:>9.3f}ms  {result['queries_per_op']:>6} q/op  {result['ops_per_sec']:>10} ops/s"
+    )
+    return result
+
+def clear_benchmark_rows(db):
+    """Delete everything a previous run seeded, and nothing outside the benchmark id block"""
+    params = (PLAYER_ID_BASE, COLLECTOR_ID)
+    db.execute_query("DELETE FROM timers WHERE player_id BETWEEN %s AND %s", params)
+    db.execute_query("DELETE FROM inventory WHERE player_id BETWEEN %s AND %s", params)
+    db.execute_query("UPDATE players SET active_cat_id = NULL WHERE id BETWEEN %s AND %s", params)
+    db.execute_query("DELETE FROM cats WHERE player_id BETWEEN %s AND %s", params)
+    db.execute_query("DELETE FROM players WHERE id BETWEEN %s AND %s", params)
+    db.execute_query("DELETE FROM items WHERE name LIKE %s", ('Benchmark Item %',))
+
+def count_real_players(db):
+    """Players outside the benchmark id block, i.e. rows this script didn't create"""
+    rows = db.execute_query(
+        "SELECT COUNT(*) AS players FROM players WHERE id NOT BETWEEN %s AND %s",
+        (PLAYER_ID_BASE, COLLECTOR_ID)
+    )
+    return int(rows[0]['players'])
+
+def seed(db, cat_service, players, cats_per_player, items, items_per_player):
+    """Create players with cats, an item catalog and inventories; returns {player_id: [cat ids]}"""
+    started = time.perf_counter()
+    player_ids = list(range(PLAYER_ID_BASE, PLAYER_ID_BASE + players))
+    db.insert_many(
+        'players', ('id', 'username', 'created_at'),
+        [(player_id, f"bench_{player_id - PLAYER_ID_BASE}", utc_now()) for player_id in player_ids]
+    )
+
+    cats = cat_service.save_cats([
+        cat_service.generate_random(player_id, f"Cat {n}")
+        for player_id in player_ids
+        for n in range(cats_per_player)
+    ])
+    owned = {player_id: [] for player_id in player_ids}
+    for cat in cats:
+        owned[cat['player_id']].append(cat['id'])
+    db.execute_many(
+        "UPDATE players SET active_cat_id = %s WHERE id = %s",
+        [(cat_ids[0], player_id) for player_id, cat_ids in owned.items() if cat_ids]
+    )
+
+    item_ids = db.insert_many(
+        'items', ('name', 'description', 'type', 'rarity', 'value'),
+        [
+            (f"Benchmark Item {n}", "Seeded by scripts/benchmark.py",
+             ITEM_TYPES[n % len(ITEM_TYPES)], ITEM_RARITIES[n % len(ITEM_RARITIES)], 100)
+            for n in range(items)
+        ]
+    )
+    if item_ids:
+        db.insert_many(
+            'inventory', ('player_id', 'item_id', 'quantity'),
+            [
+                (player_id, item_id, random.randint(1, 5))
+                for player_id in player_ids
+                for item_id in random.sample(item_ids, min(items_per_player, len(item_ids)))
+            ]
+        )
+
+    print(
+        f"Seeded {players} players, {len(cats)} cats, {len(item_ids)} items and "
+        f"{players * min(items_per_player, len(item_ids))} inventory rows "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return owned
+
+def run_benchmarks(args, owned):
+    """Run every benchmark and return their results keyed by name"""
+    player_service = PlayerService()
+    cat_service = CatService()
+    timer_service = TimerService()
+    # A private store without the flush thread, so flushes only happen when measured
+    timer_service.cooldowns = CooldownStore(timer_service.timer_repo, flush_interval=0)
+
+    player_ids = list(owned)
+    rng = random.Random(args.seed)
+    pick = lambda _: rng.choice(player_ids)
+    iterations, warmup = args.iterations, args.warmup
+    results = {}
+
+    def get_profile_cold(full):
+        current = {}
+        def setup(i):
+            current['id'] = pick(i)
+            profile_cache.invalidate(current['id'])
+        return setup, lambda i: player_service.get_profile(current['id'], full=full)
+
+    setup, operation = get_profile_cold(True)
+    results['get_profile'] = measure('get_profile', operation, iterations, warmup, setup)
+    setup, operation = get_profile_cold(False)
+    results['get_profile_light'] = measure('get_profile (full=False)', operation, iterations, warmup, setup)
+
+    hot_player = player_ids[0]
+    player_service.get_profile(hot_player)
+    results['get_profile_cached'] = measure(
+        'get_profile (cached)', lambda i: player_service.get_profile(hot_player), iterations, warmup
+    )
+
+    next_id = PLAYER_ID_BASE + len(player_ids)
+    results['start_adventure'] = measure(
+        'start_adventure',
+        lambda i: player_service.start_adventure(next_id + i, f"bench_new_{i}", "Starter"),
+        iterations, warmup
+    )
+
+    def switch(i):
+        player_id = pick(i)
+        cat_service.switch_active_cat(rng.choice(owned[player_id]), player_id)
+    results['switch_active_cat'] = measure('switch_active_cat', switch, iterations, warmup)
+
+    def timer_cycle(i):
+        player_id = pick(i)
+        if timer_service.is_available(player_id, 'encounter'):
+            timer_service.set_cooldown(player_id, 'encounter', 3600)
+        timer_service.get_seconds_remaining(player_id, 'encounter')
+        timer_service.get_all_timers(player_id)
+    results['timer_cycle'] = measure('timer_cycle', timer_cycle, iterations, warmup)
+    results['cooldown_flush'] = measure(
+        'cooldown_flush', lambda i: timer_service.cooldowns.flush(), max(1, iterations // 100), 0,
+        setup=lambda i: [timer_service.set_cooldown(player_id, 'train', 60) for player_id in player_ids[:100]]
+    )
+
+    results.update(benchmark_cat_pages(args, cat_service))
+    return results
+
+def benchmark_cat_pages(args, cat_service):
+    """Load and render /cats pages of one large collection: first, last, filtered and sorted"""
+    try:
+        from cogs.cat_commands import CATS_PER_PAGE, build_cat_page
+    except ImportError as e:
+        print(f"Rendering /cats pages skipped ({e}); timing the page queries only")
+        CATS_PER_PAGE, build_cat_page = 5, None
+
+    DatabaseManager().insert_many(
+        'players', ('id', 'username', 'created_at'), [(COLLECTOR_ID, "bench_collector", utc_now())]
+    )
+    cats = cat_service.save_cats([
+        cat_service.generate_random(COLLECTOR_ID, f"Collector Cat {n}")
+        for n in range(args.collection_size)
+    ])
+    pages = (len(cats) - 1) // CATS_PER_PAGE + 1
+    # Keyset cursors of the last page, in insertion order and sorted by attack
+    last_start = (pages - 1) * CATS_PER_PAGE - 1
+    by_attack = sorted(cats, key=lambda cat: (cat['attack'], cat['id']), reverse=True)
+    last_after = (cats[last_start]['id'], cats[last_start]['id']) if pages > 1 else None
+    last_after_by_attack = (by_attack[last_start]['attack'], by_attack[last_start]['id']) if pages > 1 else None
+
+    def show_page(after, number, **options):
+        page = cat_service.get_cat_page(
+            COLLECTOR_ID, after=after, per_page=CATS_PER_PAGE, with_count=after is None, **options
+        )
+        if build_cat_page:
+            build_cat_page(cat_text, "bench_collector", page['cats'], number, pages)
+
+    iterations, warmup = args.iterations, args.warmup
+    return {
+        'cats_first_page': measure(
+            f'/cats page 1 of {pages}', lambda i: show_page(None, 1), iterations, warmup
+        ),
+        'cats_last_page': measure(
+            f'/cats page {pages} of {pages}', lambda i: show_page(last_after, pages), iterations, warmup
+        ),
+        'cats_filtered_sorted': measure(
+            '/cats rare, by attack', lambda i: show_page(None, 1, sort='attack', rarity='rare'),
+            iterations, warmup
+        ),
+        'cats_sorted_last_page': measure(
+            f'/cats by attack, page {pages}',
+            lambda i: show_page(last_after_by_attack, pages, sort='attack'), iterations, warmup
+        )
+    }
+
+def compare(results, baseline_path):
+    """Print p50/p95 and queries/op changes against an earlier results file"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    print(f"\nCompared with {baseline_path}:")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not result or not before:
+            continue
+        changes = []
+        for key in ('p50_ms', 'p95_ms'):
+            if before[key]:
+                changes.append(f"{key} {(result[key] - before[key]) / before[key] * 100:+.1f}%")
+        changes.append(f"q/op {before['queries_per_op']} -> {result['queries_per_op']}")
+        print(f"  {name:<26} {', '.join(changes)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the service and repository hot paths")
+    parser.add_argument('--backend', choices=BACKENDS, default='sqlite',
+                        help="Database backend (default: sqlite); MySQL uses the MYSQL_* settings")
+    parser.add_argument('--sqlite-path', default=':memory:',
+                        help="SQLite database file (default: a private in-memory database)")
+    parser.add_argument('--players', type=int, default=500, help="Players to seed (default: 500)")
+    parser.add_argument('--cats-per-player', type=int, default=10, help="Cats per player (default: 10)")
+    parser.add_argument('--items', type=int, default=200, help="Items in the catalog (default: 200)")
+    parser.add_argument('--items-per-player', type=int, default=20,
+                        help="Distinct inventory items per player (default: 20)")
+    parser.add_argument('--iterations', type=int, default=1000,
+                        help="Timed calls per benchmark (default: 1000)")
+    parser.add_argument('--warmup', type=int, default=50, help="Untimed calls first (default: 50)")
+    parser.add_argument('--collection-size', type=int, default=1000,
+                        help="Cats owned by the player whose /cats pages are timed (default: 1000)")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed (default: 1)")
+    parser.add_argument('--output', help="Results file (default: benchmarks/<timestamp>.json)")
+    parser.add_argument('--compare', metavar='RESULTS', help="Earlier results file to compare with")
+    parser.add_argument('--keep', action='store_true', help="Leave the seeded rows in the database")
+    parser.add_argument('--allow-existing-data', action='store_true',
+                        help="Run against a database that already has players (only benchmark rows are touched)")
+    args = parser.parse_args()
+    if args.players + args.warmup + args.iterations >= COLLECTOR_ID - PLAYER_ID_BASE:
+        parser.error("--players, --warmup and --iterations together must stay below 10^9")
+
+    random.seed(args.seed)
+    if args.backend == 'sqlite':
+        from models.backends.sqlite_backend import SQLiteBackend
+        backend = SQLiteBackend(args.sqlite_path)
+    else:
+        backend = get_backend(args.backend)
+    db = DatabaseManager.configure(backend)
+    initialize_database()
+    real_players = count_real_players(db)
+    if real_players and not args.allow_existing_data:
+        sys.exit(
+            f"The {backend.name} database already has {real_players:,} players. Benchmark against a "
+            f"scratch database, or pass --allow-existing-data to run here anyway."
+        )
+    # Count every statement so queries per operation are exact
+    db.instrumentation.enabled = True
+    db.instrumentation.sample_rate = 1.0
+
+    try:
+        clear_benchmark_rows(db)
+        owned = seed(db, CatService(), args.players, args.cats_per_player, args.items, args.items_per_player)
+        profile_cache.clear()
+        print()
+        results = run_benchmarks(args, owned)
+    finally:
+        if not args.keep:
+            clear_benchmark_rows(db)
+
+    report = {
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'backend': backend.name,
+        'config': vars(args),
+        'results': results,
+        'queries': db.instrumentation.snapshot()
+    }
+    output = args.output or os.path.join(
+        'benchmarks', f"{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}-{backend.name}.json"
+    )
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"\nSaved results to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the parent directory to the Python path so we can import our models
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.breeds import ROOT_DIR
+from models.images import VARIANTS, ImageStore
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+def find_sources(directories):
+    """Image files directly inside each directory, as paths relative to the repository root"""
+    sources = []
+    for directory in directories:
+        root = os.path.join(ROOT_DIR, directory)
+        if not os.path.isdir(root):
+            print(f"Skipping {directory}: not a directory")
+            continue
+        for filename in sorted(os.listdir(root)):
+            if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS:
+                sources.append(os.path.join(directory, filename).replace(os.sep, '/'))
+    return sources
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the compressed thumbnail and embed-sized variants of the cat and item art"
+    )
+    parser.add_argument('directories', nargs='*', default=['images/cats', 'images/items'],
+                        help="Directories of source images (default: images/cats images/items)")
+    parser.add_argument('--variant', action='append', choices=sorted(VARIANTS), dest='variants',
+                        help="Variant to build; repeat for several (default: all)")
+    parser.add_argument('--format', choices=('webp', 'png'),
+                        help="Output format (default: WHISKERVERSE_IMAGE_FORMAT, or webp)")
+    parser.add_argument('--force', action='store_true',
+                        help="Rebuild derivatives that are already cached")
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        sys.exit("Building image derivatives needs Pillow: pip install Pillow")
+
+    store = ImageStore.from_env()
+    if args.format:
+        store.image_format = args.format
+    variants = args.variants or list(VARIANTS)
+    sources = find_sources(args.directories)
+    print(f"Building {', '.join(variants)} for {len(sources)} images into {store.cache_dir}")
+
+    started = time.perf_counter()
+    source_bytes = {variant: 0 for variant in variants}
+    derived_bytes = {variant: 0 for variant in variants}
+    for source in sources:
+        size = os.path.getsize(os.path.join(ROOT_DIR, source))
+        sizes = []
+        for variant in variants:
+            derived = store.derivative(source, variant, force=args.force)
+            source_bytes[variant] += size
+            derived_bytes[variant] += os.path.getsize(derived)
+            sizes.append(f"{variant} {os.path.getsize(derived) / 1024:,.0f} KB")
+        print(f"  {source:<48} {size / 1024:>8,.0f} KB -> {', '.join(sizes)}")
+
+    elapsed = time.perf_counter() - started
+    print(f"\n{store.generated} derivatives built, {store.cache_hits} already cached, in {elapsed:.2f}s")
+    for variant in variants:
+        if source_bytes[variant]:
+            print(f"  {variant:<10} {derived_bytes[variant] / source_bytes[variant]:.1%} of the source size")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+import argparse
 import csv
+import itertools
 import os
 import sys
+import time
 from pathlib import Path
 
 # Add the parent directory to the Python path so we can import our models
@@ -8,6 +11,24 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from models.database import DatabaseManager
 
+ITEM_TYPES = ('weapon', 'armor', 'potion', 'material', 'misc')
+
+# Item value by rarity
+ITEM_VALUES = {
+    'common': 100,
+    'uncommon': 250,
+    'rare': 500,
+    'epic': 1000,
+    'legendary': 2500
+}
+
+# For now, all items use the same image
+DEFAULT_IMAGE_PATH = 'images/items/eternal_scroll_of_meowgic.png'
+
+COLUMNS = ('name', 'description', 'type', 'rarity', 'value', 'image_path')
+# Refreshed when the item already exists; image_path is left alone so hand-set images survive
+UPDATE_COLUMNS = ('description', 'type', 'rarity', 'value')
+
 def ensure_image_directories():
     """Create necessary image directories if they don't exist"""
     image_dirs = ['images', 'images/items']
@@ -15,93 +36,160 @@ def ensure_image_directories():
         os.makedirs(dir_path, exist_ok=True)
         print(f"Ensured directory exists: {dir_path}")
 
-def import_items_from_csv(csv_path):
-    """Import items from a CSV file into the database"""
+def read_items(csv_path, stats):
+    """Yield one item dict per valid CSV row, reading the file incrementally"""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            stats['read'] += 1
+            name = (row.get('name') or '').strip()
+            item_type = (row.get('type') or '').strip().lower()
+            rarity = (row.get('rarity') or '').strip().lower()
+            if not name or item_type not in ITEM_TYPES or rarity not in ITEM_VALUES:
+                stats['invalid'] += 1
+                print(f"Skipping invalid row on line {reader.line_num}: {row}")
+                continue
+            yield {
+                'name': name,
+                'description': row.get('description') or '',
+                'type': item_type,
+                'rarity': rarity,
+                'value': ITEM_VALUES[rarity],
+                'image_path': DEFAULT_IMAGE_PATH
+            }
+
+def batched(items, batch_size):
+    """Group an iterator into lists of at most batch_size"""
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def diff_batch(db, batch, known=None):
+    """Split a batch into new and changed items against what is stored.
+
+    ``known`` maps names to rows already planned by earlier batches of a
+    dry run, which never reach the database. Returns (new, changed, unchanged)
+    where changed holds (item, {column: (old, new)}) pairs.
+    """
+    # Later rows for the same name win, as they would with the upsert
+    batch = list({item['name']: item for item in batch}.values())
+    placeholders = ', '.join(['%s'] * len(batch))
+    existing = {
+        row['name']: row
+        for row in db.execute_query(
+            f"SELECT {', '.join(COLUMNS)} FROM items WHERE name IN ({placeholders})",
+            tuple(item['name'] for item in batch)
+        )
+    }
+    if known:
+        existing.update((item['name'], known[item['name']]) for item in batch if item['name'] in known)
+
+    new, changed, unchanged = [], [], 0
+    for item in batch:
+        current = existing.get(item['name'])
+        if current is None:
+            new.append(item)
+            continue
+        changes = {
+            column: (current[column], item[column])
+            for column in UPDATE_COLUMNS
+            if current[column] != item[column]
+        }
+        if changes:
+            changed.append((item, changes))
+        else:
+            unchanged += 1
+    return new, changed, unchanged
+
+def print_diff(new, changed):
+    for item in new:
+        print(f"+ {item['name']} ({item['rarity']} {item['type']}, {item['value']} coins)")
+    for item, changes in changed:
+        details = ', '.join(f"{column}: {old!r} -> {value!r}" for column, (old, value) in changes.items())
+        print(f"~ {item['name']}: {details}")
+
+def import_items_from_csv(csv_path, batch_size=500, dry_run=False, verbose=False):
+    """Stream items from a CSV file into the database, upserting by name in batches"""
     db = DatabaseManager()
-    
-    try:
-        # Ensure image directories exist
+
+    # Upserting by name relies on uq_items_name (migration 0005)
+    if not db.backend.index_exists(db, 'items', 'uq_items_name'):
+        print("items.name has no unique key yet; run scripts/migrate.py first")
+        return False
+
+    if not dry_run:
         ensure_image_directories()
-        
-        # Start a transaction for all inserts
-        db.start_transaction()
-        
-        # First, let's get existing items to avoid duplicates
-        existing_items = db.execute_query("SELECT name FROM items")
-        existing_names = {item['name'] for item in existing_items}
-        
-        # Read the CSV file
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            items_to_insert = []
-            
-            for row in reader:
-                # Skip if item already exists
-                if row['name'] in existing_names:
-                    print(f"Skipping existing item: {row['name']}")
-                    continue
-                
-                # Calculate value based on rarity
-                value = {
-                    'common': 100,
-                    'uncommon': 250,
-                    'rare': 500,
-                    'epic': 1000,
-                    'legendary': 2500
-                }.get(row['rarity'].lower(), 100)
-                
-                # Generate image path (for now, all use the same image)
-                image_path = 'images/items/eternal_scroll_of_meowgic.png'
-                
-                items_to_insert.append((
-                    row['name'],
-                    row['description'],
-                    row['type'],
-                    row['rarity'],
-                    value,
-                    image_path
-                ))
-        
-        if items_to_insert:
-            # Insert new items
-            insert_query = """
-                INSERT INTO items (name, description, type, rarity, value, image_path)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            
-            for item in items_to_insert:
+
+    upsert_query = db.backend.upsert('items', COLUMNS, conflict_columns=('name',), update_columns=UPDATE_COLUMNS)
+    stats = {'read': 0, 'invalid': 0, 'new': 0, 'changed': 0, 'unchanged': 0}
+    planned = {} if dry_run else None
+    started = time.perf_counter()
+
+    try:
+        for batch in batched(read_items(csv_path, stats), batch_size):
+            new, changed, unchanged = diff_batch(db, batch, planned)
+            if dry_run or verbose:
+                print_diff(new, changed)
+
+            rows = new + [item for item, _ in changed]
+            if dry_run:
+                planned.update((item['name'], item) for item in rows)
+            elif rows:
+                # One transaction per batch keeps progress durable and locks short
+                db.start_transaction()
                 try:
-                    db.execute_query(insert_query, item)
-                    print(f"Added item: {item[0]} (Image: {item[5]})")
-                except Exception as e:
-                    print(f"Error adding item {item[0]}: {str(e)}")
-        
-        # Commit the transaction
-        db.end_transaction()
-        print(f"\nSuccessfully imported {len(items_to_insert)} items!")
-        
+                    db.execute_many(upsert_query, [tuple(item[column] for column in COLUMNS) for item in rows])
+                except Exception:
+                    db.rollback_transaction()
+                    raise
+                db.end_transaction()
+
+            stats['new'] += len(new)
+            stats['changed'] += len(changed)
+            stats['unchanged'] += unchanged
+            elapsed = time.perf_counter() - started
+            print(
+                f"Processed {stats['read']} rows ({stats['read'] / elapsed:.0f} rows/s): "
+                f"{stats['new']} new, {stats['changed']} changed, {stats['unchanged']} unchanged"
+            )
     except Exception as e:
         print(f"Error during import: {str(e)}")
-        db.end_transaction()
         return False
-    
+
+    elapsed = time.perf_counter() - started
+    action = "Would import" if dry_run else "Imported"
+    print(
+        f"\n{action} {stats['new']} new and {stats['changed']} changed items "
+        f"({stats['unchanged']} unchanged, {stats['invalid']} invalid) "
+        f"from {stats['read']} rows in {elapsed:.2f}s"
+    )
     return True
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python import_items.py <path_to_csv>")
-        print("Example: python import_items.py data/Whiskerverse_Lore_Item_List.csv")
-        sys.exit(1)
-    
-    csv_path = sys.argv[1]
-    if not os.path.exists(csv_path):
-        print(f"Error: File not found: {csv_path}")
+    parser = argparse.ArgumentParser(
+        description="Import items from a CSV file",
+        epilog="Example: python import_items.py data/Whiskerverse_Lore_Item_List.csv"
+    )
+    parser.add_argument('csv_path', help="CSV file with name, description, type and rarity columns")
+    parser.add_argument('--batch-size', type=int, default=500, help="Rows per upsert batch (default: 500)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Print the items that would be added or changed without writing anything")
+    parser.add_argument('--verbose', action='store_true', help="Print every added or changed item")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv_path):
+        print(f"Error: File not found: {args.csv_path}")
         sys.exit(1)
-    
-    success = import_items_from_csv(csv_path)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    success = import_items_from_csv(args.csv_path, args.batch_size, args.dry_run, args.verbose)
     if not success:
         print("Import failed!")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path so we can import our models
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.database import initialize_database, DatabaseManager
+from models.migrations import MIGRATIONS, applied_versions, run_migrations
+
+def show_status(db):
+    """Print every known migration and whether it has been applied"""
+    applied = applied_versions(db)
+    for migration in MIGRATIONS:
+        status = "applied" if migration.VERSION in applied else "pending"
+        print(f"{migration.VERSION:04d}  {status:<8} {migration.DESCRIPTION}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Show pending migrations and query plans without changing the schema")
+    parser.add_argument('--explain', action='store_true',
+                        help="Print query plans for the hot repository queries before and after migrating")
+    parser.add_argument('--status', action='store_true', help="List migrations and whether they are applied")
+    args = parser.parse_args()
+    
+    try:
+        initialize_database(migrate=False)
+        db = DatabaseManager()
+        if args.status:
+            show_status(db)
+            return
+        
+        applied = run_migrations(db, dry_run=args.dry_run, explain=args.explain)
+        if not args.dry_run:
+            print(f"Applied {len(applied)} migration(s)")
+    except Exception as e:
+        print(f"Error during migration: {str(e)}")
+        print("Migration failed!")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
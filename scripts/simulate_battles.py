@@ -0,0 +1,88 @@
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+# Add the parent directory to the Python path so we can import our models
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.battle import MAX_ROUNDS, MOVE_POWER, win_rate_matrix
+from models.breeds import RARITIES, get_breed_registry
+
+def write_matrix(path, breeds, matrix):
+    """CSV with one row and one column per breed; cell [row, column] is row's win rate against column"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['breed'] + breeds)
+        for breed, row in zip(breeds, matrix):
+            writer.writerow([breed] + [f"{value:.4f}" for value in row])
+
+def print_summary(result, top):
+    breeds = result['breeds']
+    win_rate = result['win_rate']
+    registry = get_breed_registry()
+
+    # Average win rate against every breed (including itself)
+    overall = win_rate.mean(axis=1)
+    ranking = sorted(range(len(breeds)), key=lambda index: overall[index], reverse=True)
+    print("\nStrongest breeds (mean win rate against all breeds):")
+    for index in ranking[:top]:
+        print(f"  {breeds[index]:<28} {registry.rarity_of(breeds[index]):<10} {overall[index]:.3f}")
+    print("\nWeakest breeds:")
+    for index in ranking[-top:]:
+        print(f"  {breeds[index]:<28} {registry.rarity_of(breeds[index]):<10} {overall[index]:.3f}")
+
+    # Rarity tier against rarity tier
+    tiers = {rarity: [i for i, breed in enumerate(breeds) if registry.rarity_of(breed) == rarity] for rarity in RARITIES}
+    tiers = {rarity: indexes for rarity, indexes in tiers.items() if indexes}
+    print("\nWin rate by rarity (row vs column):")
+    print(f"  {'':<10}" + ''.join(f"{rarity:>11}" for rarity in tiers))
+    for rarity, rows in tiers.items():
+        cells = ''.join(f"{win_rate[rows][:, columns].mean():>11.3f}" for columns in tiers.values())
+        print(f"  {rarity:<10}{cells}")
+    print(f"\nDraws: {result['draw_rate'].mean():.4f}, mean rounds: {result['mean_rounds'].mean():.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate battles between every pair of breeds and report win rates"
+    )
+    parser.add_argument('--battles-per-pair', type=int, default=100,
+                        help="Fights for every ordered pair of breeds (default: 100)")
+    parser.add_argument('--spread', type=float, default=0.0,
+                        help="Roll stats within ±spread of the base stats for each fight, e.g. 0.1 like wild cats")
+    parser.add_argument('--move-power', type=int, default=MOVE_POWER,
+                        help=f"Power of the basic attack (default: {MOVE_POWER})")
+    parser.add_argument('--max-rounds', type=int, default=MAX_ROUNDS,
+                        help=f"Rounds before a fight is a draw (default: {MAX_ROUNDS})")
+    parser.add_argument('--seed', type=int, help="Random seed for reproducible runs")
+    parser.add_argument('--top', type=int, default=10, help="Breeds listed as strongest and weakest (default: 10)")
+    parser.add_argument('--output', help="Write the full win-rate matrix to this CSV file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        result = win_rate_matrix(
+            battles_per_pair=args.battles_per_pair,
+            spread=args.spread,
+            move_power=args.move_power,
+            max_rounds=args.max_rounds,
+            seed=args.seed
+        )
+    except ImportError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+    breeds = result['breeds']
+    print(
+        f"Simulated {result['battles']:,} battles across {len(breeds)} breeds in {elapsed:.2f}s "
+        f"({result['battles'] / elapsed:,.0f} battles/s)"
+    )
+
+    print_summary(result, args.top)
+    if args.output:
+        write_matrix(args.output, breeds, result['win_rate'])
+        print(f"\nSaved win-rate matrix to {args.output}")
+
+if __name__ == "__main__":
+    main()
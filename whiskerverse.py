@@ -1,11 +1,24 @@
 import os
+import argparse
+import hashlib
 import json
+import logging
+import signal
+import time
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 import boto3
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError
-from models import initialize_database
+from models import DatabaseManager, initialize_database
+from models.cache import profile_cache
+from models.cards import get_card_renderer
+from models.cooldown_store import get_cooldown_store
+from models.images import get_image_store
+from models.leaderboard import get_leaderboards
+from models.rendering import cat_text
+from models.services.async_service import shutdown_executor
+from models.services.container import ServiceContainer
 
 def get_discord_token():
     token = os.getenv('DISCORD_TOKEN')
@@ -34,31 +47,121 @@ def get_version():
     else:
         return "Version not specified"
 
-load_dotenv()
-token = get_discord_token()
-if not token:
-    raise ValueError("Discord bot token not found in environment variables or AWS Secrets Manager")
+logger = logging.getLogger('whiskerverse')
+
+# Hash of the last app-command tree synced to Discord, per application id
+COMMAND_HASH_FILE = os.getenv('WHISKERVERSE_COMMAND_HASH_FILE', '.command_sync.json')
+
+def command_tree_hash(tree):
+    """Stable hash of the global app-command payloads tree.sync() would upload"""
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands()),
+        key=lambda command: (command.get('type', 1), command['name'])
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def load_synced_hashes():
+    try:
+        with open(COMMAND_HASH_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_synced_hash(application_id, digest):
+    hashes = load_synced_hashes()
+    hashes[str(application_id)] = digest
+    try:
+        with open(COMMAND_HASH_FILE, 'w') as f:
+            json.dump(hashes, f, indent=2)
+    except OSError as e:
+        logger.warning("Could not save the command tree hash to %s: %s", COMMAND_HASH_FILE, e)
+
+def dump_query_stats(signum, frame):
+    """Print query latency histograms and cache counters (kill -USR1 <pid>)"""
+    db = DatabaseManager()
+    print(db.instrumentation.dump())
+    print(f"Statement cache: {db.backend.statement_stats.report()}")
+    print(f"Profile cache: {profile_cache.stats()}")
+    print(f"Leaderboards: {get_leaderboards().stats()}")
+    print(f"Cat text cache: {cat_text.stats()}")
+    print(f"Images: {get_image_store().stats()}")
+    print(f"Profile cards: {get_card_renderer().stats()}")
 
 class MyBot(commands.Bot):
+    def __init__(self, *args, force_sync=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.force_sync = force_sync
+    
     async def setup_hook(self):
-        # Initialize database tables
+        started = time.perf_counter()
+        
+        # Initialize database tables and apply pending schema migrations
         initialize_database()
+        database_done = time.perf_counter()
+        
+        # One set of services and one parsed config, injected into every cog
+        self.services = ServiceContainer()
         
         # Load cogs
         for filename in os.listdir('./cogs'):
             if filename.endswith('.py') and filename != '__init__.py':
                 await self.load_extension(f'cogs.{filename[:-3]}')
+        cogs_done = time.perf_counter()
+        
+        sync_status = await self.sync_commands()
+        sync_done = time.perf_counter()
+        
+        logger.info(
+            "Startup: database %.2fs, cogs %.2fs, command sync %.2fs (%s), total %.2fs",
+            database_done - started, cogs_done - database_done, sync_done - cogs_done,
+            sync_status, sync_done - started
+        )
+    
+    async def sync_commands(self):
+        """Sync the app-command tree only when it differs from the last synced one"""
+        digest = command_tree_hash(self.tree)
+        application_id = str(self.application_id)
+        if not self.force_sync and load_synced_hashes().get(application_id) == digest:
+            return "skipped, unchanged"
+        
         await self.tree.sync()
+        save_synced_hash(application_id, digest)
+        return "forced" if self.force_sync else "synced"
+    
+    async def close(self):
+        await super().close()
+        # Let in-flight service calls finish, persist pending cooldowns, then release pooled connections
+        shutdown_executor()
+        get_card_renderer().close()
+        get_cooldown_store().close()
+        get_leaderboards().close()
+        DatabaseManager().close()
+
+    async def on_ready(self):
+        version = get_version()
+        print(f'Whiskerverse is ready and {self.user} is logged in. Verison: {version}')
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Whiskerverse Discord bot")
+    parser.add_argument('--sync-commands', action='store_true',
+                        help="Sync the app-command tree with Discord even if it hasn't changed")
+    args = parser.parse_args()
 
-intents = discord.Intents.default()
-intents.message_content = True
-intents.members = True
+    load_dotenv()
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, dump_query_stats)
+    token = get_discord_token()
+    if not token:
+        raise ValueError("Discord bot token not found in environment variables or AWS Secrets Manager")
 
-bot = MyBot(command_prefix="/", intents=intents, case_insensitive=True)
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
 
-@bot.event
-async def on_ready():
-    version = get_version()
-    print(f'Whiskerverse is ready and {bot.user} is logged in. Verison: {version}')
+    bot = MyBot(command_prefix="/", intents=intents, case_insensitive=True, force_sync=args.sync_commands)
+    bot.run(token, root_logger=True)
 
-bot.run(token)
\ No newline at end of file
+# Profile card workers are spawned processes that import this module again; they must not start a bot
+if __name__ == "__main__":
+    main()